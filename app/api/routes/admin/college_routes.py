@@ -2,6 +2,13 @@ from fastapi import APIRouter, Depends, HTTPException, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.database import get_db
+from app.core.responses import ORJSONResponse
+from app.core.cache import (
+    cached,
+    invalidate,
+    COLLEGES_LIST_KEY,
+    ADMIN_DASHBOARD_KEY
+)
 from app.utils.decorators import require_permission
 from app.services.admin.college_service import AdminCollegeService
 from app.schemas.college_schema import (
@@ -30,7 +37,9 @@ async def create_college(
     payload: CollegeCreate,
     db: AsyncSession = Depends(get_db)
 ):
-    return await service.create_college(db, payload)
+    college = await service.create_college(db, payload)
+    await invalidate(COLLEGES_LIST_KEY, ADMIN_DASHBOARD_KEY)
+    return college
 
 
 # -------------------------------------------------
@@ -38,13 +47,18 @@ async def create_college(
 # -------------------------------------------------
 @router.get(
     "",
-    response_model=list[CollegeResponse],
+    response_class=ORJSONResponse,
+    response_model=None,
+    responses={200: {"model": list[CollegeResponse]}},
     dependencies=[Depends(require_permission("view", "colleges"))]
 )
 async def list_colleges(
     db: AsyncSession = Depends(get_db)
 ):
-    return await service.list_colleges(db)
+    return await cached(
+        COLLEGES_LIST_KEY,
+        lambda: service.list_colleges(db)
+    )
 
 
 # -------------------------------------------------
@@ -79,6 +93,7 @@ async def update_college(
     db: AsyncSession = Depends(get_db)
 ):
     college = await service.update_college(db, college_id, payload)
+    await invalidate(COLLEGES_LIST_KEY, ADMIN_DASHBOARD_KEY)
     if not college:
         raise HTTPException(status_code=404, detail="College not found")
     return college
@@ -89,6 +104,7 @@ async def update_college(
 # -------------------------------------------------
 @router.delete(
     "/{college_id}",
+    response_class=ORJSONResponse,
     status_code=status.HTTP_200_OK,
 )
 async def delete_college(
@@ -96,6 +112,7 @@ async def delete_college(
     db: AsyncSession = Depends(get_db)
 ):
     await service.delete_college(db, college_id)
+    await invalidate(COLLEGES_LIST_KEY, ADMIN_DASHBOARD_KEY)
     return {
         "success": True,
         "message": "College deleted successfully"
@@ -4,22 +4,28 @@ from fastapi import (
     HTTPException,
     UploadFile,
     File,
-    Request,
     status,
 )
 from fastapi.responses import RedirectResponse
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
+from sqlalchemy import select, lambda_stmt
 
 from app.core.database import get_db
+from app.core.responses import ORJSONResponse
+from app.core.permissions import require_role
+from app.core.s3 import presign_get, s3_key_from_url
 from app.services.admin.course_file_service import AdminCourseFileService
-from app.schemas.course_file_schema import CourseFileResponse
+from app.schemas.course_file_schema import (
+    CourseFileResponse,
+    CourseFileUploadInitiate,
+    CourseFileUploadTicket,
+)
 from app.models.models import CourseFile
-from fastapi.responses import StreamingResponse
-import httpx
+
 router = APIRouter(
     prefix="/api/admin/courses",
-    tags=["Admin - Course Files"]
+    tags=["Admin - Course Files"],
+    dependencies=[Depends(require_role("ADMIN", detail="Admin access only"))]
 )
 
 service = AdminCourseFileService()
@@ -34,19 +40,12 @@ service = AdminCourseFileService()
 )
 async def upload_course_file(
     course_id: int,
-    request: Request,
     file: UploadFile = File(...),
     file_title: str | None = None,
     file_description: str | None = None,
     duration_seconds: int | None = None,
     db: AsyncSession = Depends(get_db),
 ):
-    if request.state.user["role"] != "ADMIN":
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="Admin access only"
-        )
-
     return await service.upload_course_file(
         db=db,
         course_id=course_id,
@@ -57,53 +56,97 @@ async def upload_course_file(
     )
 
 
+# -------------------------------------------------
+# DIRECT UPLOAD: GET PRESIGNED PUT URL
+# -------------------------------------------------
+# Client PUTs the bytes straight to S3, then calls /commit – the
+# file never passes through the worker.
+@router.post(
+    "/{course_id}/files/initiate",
+    response_model=CourseFileUploadTicket,
+    status_code=status.HTTP_201_CREATED
+)
+async def initiate_course_file_upload(
+    course_id: int,
+    payload: CourseFileUploadInitiate,
+    db: AsyncSession = Depends(get_db),
+):
+    return await service.initiate_course_file_upload(
+        db=db,
+        course_id=course_id,
+        payload=payload,
+    )
+
+
+# -------------------------------------------------
+# DIRECT UPLOAD: COMMIT AFTER S3 PUT
+# -------------------------------------------------
+@router.post(
+    "/{course_id}/files/{file_id}/commit",
+    response_model=CourseFileResponse
+)
+async def commit_course_file_upload(
+    course_id: int,
+    file_id: int,
+    db: AsyncSession = Depends(get_db),
+):
+    return await service.commit_course_file_upload(
+        db=db,
+        course_id=course_id,
+        file_id=file_id,
+    )
+
+
 # -------------------------------------------------
 # LIST ALL FILES FOR A COURSE
 # -------------------------------------------------
 @router.get(
     "/{course_id}/files",
-    response_model=list[CourseFileResponse]
+    response_class=ORJSONResponse,
+    response_model=None,
+    responses={200: {"model": list[CourseFileResponse]}}
 )
 async def list_course_files(
     course_id: int,
-    request: Request,
     db: AsyncSession = Depends(get_db),
 ):
-    if request.state.user["role"] != "ADMIN":
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="Admin access only"
-        )
-
     return await service.list_course_files(db, course_id)
 
 
 # -------------------------------------------------
 # LIST ONLY PDFs FOR A COURSE
 # -------------------------------------------------
-@router.get("/{course_id}/pdfs")
+@router.get(
+    "/{course_id}/pdfs",
+    response_class=ORJSONResponse
+)
 async def list_course_pdfs(
     course_id: int,
-    request: Request,
     db: AsyncSession = Depends(get_db),
 ):
-    if request.state.user["role"] != "ADMIN":
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="Admin access only"
-        )
-
+    # Only the serialized columns → plain rows, no ORM hydration.
+    # lambda_stmt: the statement is built + cache-keyed once; per call
+    # only the course_id bind value changes.
     result = await db.execute(
-        select(CourseFile)
-        .where(
-            CourseFile.course_id == course_id,
-            CourseFile.file_type == "PDF",
-            CourseFile.is_published.is_(True),
+        lambda_stmt(
+            lambda: select(
+                CourseFile.id,
+                CourseFile.file_name,
+                CourseFile.file_title,
+                CourseFile.file_description,
+                CourseFile.file_url,
+                CourseFile.created_at,
+            )
+            .where(
+                CourseFile.course_id == course_id,
+                CourseFile.file_type == "PDF",
+                CourseFile.is_published.is_(True),
+            )
+            .order_by(CourseFile.created_at.desc())
         )
-        .order_by(CourseFile.created_at.desc())
     )
 
-    pdfs = result.scalars().all()
+    pdfs = result.all()
 
     return {
         "course_id": course_id,
@@ -130,29 +173,51 @@ async def list_course_pdfs(
 @router.get("/course-files/{file_id}/stream")
 async def stream_pdf(
     file_id: int,
-    request: Request,
     db: AsyncSession = Depends(get_db)
 ):
-    if request.state.user["role"] != "ADMIN":
-        raise HTTPException(status_code=403, detail="Admin access only")
-
-    pdf = await db.scalar(
-        select(CourseFile).where(
-            CourseFile.id == file_id,
-            CourseFile.file_type == "PDF"
+    pdf = (
+        await db.execute(
+            select(CourseFile.file_url, CourseFile.file_name).where(
+                CourseFile.id == file_id,
+                CourseFile.file_type == "PDF",
+                # never hand out a URL for an object that isn't there yet
+                CourseFile.upload_status == "UPLOADED",
+            )
         )
-    )
+    ).first()
 
     if not pdf:
         raise HTTPException(status_code=404, detail="PDF not found")
 
-    async with httpx.AsyncClient() as client:
-        r = await client.get(pdf.file_url)
+    # Client fetches directly from S3 – no bytes pass through the worker
+    url = presign_get(s3_key_from_url(pdf.file_url), pdf.file_name)
 
-    return StreamingResponse(
-        r.aiter_bytes(),
-        media_type="application/pdf",
-        headers={
-            "Content-Disposition": f'inline; filename="{pdf.file_name}"'
-        }
-    )
+    return RedirectResponse(url, status_code=status.HTTP_307_TEMPORARY_REDIRECT)
+
+
+# -------------------------------------------------
+# STREAM A SINGLE VIDEO (REDIRECT TO S3)
+# -------------------------------------------------
+@router.get("/course-files/{file_id}/video")
+async def stream_video(
+    file_id: int,
+    db: AsyncSession = Depends(get_db)
+):
+    video = (
+        await db.execute(
+            select(CourseFile.file_url, CourseFile.file_name).where(
+                CourseFile.id == file_id,
+                CourseFile.file_type == "VIDEO",
+                CourseFile.upload_status == "UPLOADED",
+            )
+        )
+    ).first()
+
+    if not video:
+        raise HTTPException(status_code=404, detail="Video not found")
+
+    # S3 serves Range requests (206 Partial Content) natively, so player
+    # seeks go straight to S3 instead of through the worker
+    url = presign_get(s3_key_from_url(video.file_url), video.file_name)
+
+    return RedirectResponse(url, status_code=status.HTTP_307_TEMPORARY_REDIRECT)
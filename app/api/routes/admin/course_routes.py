@@ -2,6 +2,13 @@ from fastapi import APIRouter, Depends, Request, HTTPException, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.database import get_db
+from app.core.responses import ORJSONResponse
+from app.core.cache import (
+    cached,
+    invalidate,
+    COURSES_LIST_KEY,
+    ADMIN_DASHBOARD_KEY
+)
 from app.utils.decorators import require_permission
 from app.services.admin.course_service import AdminCourseService
 from app.schemas.course_schema import (
@@ -31,7 +38,9 @@ async def create_course(
     payload: CourseCreate,
     db: AsyncSession = Depends(get_db)
 ):
-    return await service.create_course(db, payload)
+    course = await service.create_course(db, payload)
+    await invalidate(COURSES_LIST_KEY, ADMIN_DASHBOARD_KEY)
+    return course
 
 
 # -------------------------------------------------
@@ -39,13 +48,18 @@ async def create_course(
 # -------------------------------------------------
 @router.get(
     "",
-    response_model=list[CourseResponse],
+    response_class=ORJSONResponse,
+    response_model=None,
+    responses={200: {"model": list[CourseResponse]}},
     dependencies=[Depends(require_permission("view", "courses"))]
 )
 async def list_courses(
     db: AsyncSession = Depends(get_db)
 ):
-    return await service.list_courses(db)
+    return await cached(
+        COURSES_LIST_KEY,
+        lambda: service.list_courses(db)
+    )
 
 
 # -------------------------------------------------
@@ -80,7 +94,9 @@ async def update_course(
     payload: CourseUpdate,
     db: AsyncSession = Depends(get_db)
 ):
-    return await service.update_course(db, course_id, payload)
+    course = await service.update_course(db, course_id, payload)
+    await invalidate(COURSES_LIST_KEY, ADMIN_DASHBOARD_KEY)
+    return course
 
 
 # -------------------------------------------------
@@ -88,6 +104,7 @@ async def update_course(
 # -------------------------------------------------
 @router.delete(
     "/{course_id}",
+    response_class=ORJSONResponse,
     status_code=status.HTTP_200_OK,
     dependencies=[Depends(require_permission("delete", "courses"))]
 )
@@ -96,6 +113,7 @@ async def delete_course(
     db: AsyncSession = Depends(get_db)
 ):
     await service.delete_course(db, course_id)
+    await invalidate(COURSES_LIST_KEY, ADMIN_DASHBOARD_KEY)
     return {
         "success": True,
         "message": "Course deleted successfully"
@@ -1,12 +1,21 @@
-from fastapi import APIRouter, Request, Depends, HTTPException
+from fastapi import APIRouter, Depends
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.cache import (
+    cached,
+    ADMIN_DASHBOARD_KEY,
+    ADMIN_DASHBOARD_TTL_SECONDS
+)
 from app.core.database import get_db
+from app.core.responses import ORJSONResponse
+from app.core.permissions import require_role
 from app.services.admin.dashboard_service import DashboardService
 
 router = APIRouter(
     prefix="/api/admin",
-    tags=["Dashboard"]
+    default_response_class=ORJSONResponse,
+    tags=["Dashboard"],
+    dependencies=[Depends(require_role("ADMIN", detail="Admins only"))]
 )
 
 service = DashboardService()
@@ -14,15 +23,10 @@ service = DashboardService()
 
 @router.get("/admin/dashboard")
 async def admin_dashboard(
-    request: Request,
     db: AsyncSession = Depends(get_db)
 ):
-    user = getattr(request.state, "user", None)
-
-    if not user:
-        raise HTTPException(status_code=401, detail="Not authenticated")
-
-    if user["role"] != "ADMIN":
-        raise HTTPException(status_code=403, detail="Admins only")
-
-    return await service.get_admin_dashboard(db)
+    return await cached(
+        ADMIN_DASHBOARD_KEY,
+        lambda: service.get_admin_dashboard(db),
+        ttl=ADMIN_DASHBOARD_TTL_SECONDS
+    )
@@ -2,10 +2,12 @@ from fastapi import APIRouter, Depends, Request
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.database import get_db
+from app.core.responses import ORJSONResponse
 from app.utils.decorators import require_permission
 
 router = APIRouter(
     prefix="/api/admin/tests",
+    default_response_class=ORJSONResponse,
     tags=["Admin - Tests"]
 )
 
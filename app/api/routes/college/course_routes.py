@@ -1,7 +1,17 @@
-from fastapi import APIRouter, Depends, Request, HTTPException, status
+from fastapi import APIRouter, Depends, Request, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.cache import (
+    cached,
+    invalidate,
+    college_courses_key,
+    college_dashboard_key,
+    ADMIN_DASHBOARD_KEY
+)
 from app.core.database import get_db
+from app.core.responses import ORJSONResponse
+from app.core.permissions import require_role
+from app.services.college.admin_college import resolve_college_id
 from app.services.college.course_service import CollegeCourseService
 from app.schemas.enrollment_schema import (
     CourseAssignRequest,
@@ -10,7 +20,10 @@ from app.schemas.enrollment_schema import (
 
 router = APIRouter(
     prefix="/api/college/courses",
-    tags=["College - Courses"]
+    tags=["College - Courses"],
+    dependencies=[
+        Depends(require_role("COLLEGE_ADMIN", detail="College admin access only"))
+    ]
 )
 
 service = CollegeCourseService()
@@ -21,6 +34,7 @@ service = CollegeCourseService()
 # -------------------------------------------------
 @router.post(
     "/assign",
+    response_class=ORJSONResponse,
     status_code=status.HTTP_201_CREATED
 )
 async def assign_course(
@@ -30,24 +44,27 @@ async def assign_course(
 ):
     user = request.state.user
 
-    if user.get("role") != "COLLEGE_ADMIN":
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="College admin access only"
-        )
-
-    return await service.assign_course_to_students(
+    result = await service.assign_course_to_students(
         db=db,
         college_admin_user=user,
         payload=payload
     )
+    college_id = await resolve_college_id(db, user.id)
+    await invalidate(
+        college_dashboard_key(college_id),
+        college_courses_key(college_id),
+        ADMIN_DASHBOARD_KEY
+    )
+    return result
 
 # -------------------------------------------------
 # LIST COURSES (COLLEGE SCOPE)
 # -------------------------------------------------
 @router.get(
     "",
-    response_model=list[CollegeCourseSummaryResponse]
+    response_class=ORJSONResponse,
+    response_model=None,
+    responses={200: {"model": list[CollegeCourseSummaryResponse]}}
 )
 async def list_college_courses(
     request: Request,
@@ -55,15 +72,15 @@ async def list_college_courses(
 ):
     user = request.state.user
 
-    if user.get("role") != "COLLEGE_ADMIN":
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="College admin access only"
-        )
+    # unmapped admin → key is never filled: the service raises 403
+    college_id = await resolve_college_id(db, user.id)
 
-    return await service.list_college_courses(
-        db=db,
-        college_admin_user=user
+    return await cached(
+        college_courses_key(college_id),
+        lambda: service.list_college_courses(
+            db=db,
+            college_admin_user=user
+        )
     )
 
 # -------------------------------------------------
@@ -76,13 +93,9 @@ async def list_admin_courses_for_college(
 ):
     user = request.state.user
 
-    if user.get("role") != "COLLEGE_ADMIN":
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="College admin access only"
+    return ORJSONResponse(
+        await service.get_admin_courses_for_college(
+            db=db,
+            college_admin_user=user
         )
-
-    return await service.get_admin_courses_for_college(
-        db=db,
-        college_admin_user=user
     )
@@ -1,12 +1,20 @@
 from fastapi import APIRouter, Request, Depends
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.cache import (
+    cached,
+    college_dashboard_key,
+    COLLEGE_DASHBOARD_TTL_SECONDS
+)
 from app.core.database import get_db
+from app.core.responses import ORJSONResponse
 from app.utils.decorators import require_permission
+from app.services.college.admin_college import resolve_college_id
 from app.services.college.dashboard_service import CollegeDashboardService
 
 router = APIRouter(
     prefix="/api/college",
+    default_response_class=ORJSONResponse,
     tags=["College"]
 )
 
@@ -21,13 +29,19 @@ async def college_dashboard(
     request: Request,
     db: AsyncSession = Depends(get_db)
 ):
-    dashboard_data = await service.get_dashboard_data(
-        db=db,
-        user=request.state.user
+    user = request.state.user
+
+    # unmapped admin → key is never filled: the service raises 403
+    college_id = await resolve_college_id(db, user.id)
+
+    dashboard_data = await cached(
+        college_dashboard_key(college_id),
+        lambda: service.get_dashboard_data(db=db, user=user),
+        ttl=COLLEGE_DASHBOARD_TTL_SECONDS
     )
 
-    return {
+    return ORJSONResponse({
         "message": "Welcome College Admin",
-        "college_admin_id": request.state.user["id"],
+        "college_admin_id": user.id,
         "stats": dashboard_data
-    }
+    })
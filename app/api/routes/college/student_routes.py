@@ -4,44 +4,54 @@ from fastapi import (
     UploadFile, File
 )
 from sqlalchemy.ext.asyncio import AsyncSession
-from app.core.dependencies import get_current_user
+from app.core.cache import (
+    invalidate,
+    college_dashboard_key,
+    ADMIN_DASHBOARD_KEY
+)
 from app.core.database import get_db
+from app.core.responses import ORJSONResponse
+from app.core.permissions import require_role
+from app.services.college.admin_college import resolve_college_id
 from app.services.college.student_service import CollegeStudentService
 from app.schemas.student_schema import StudentCreate
 
 router = APIRouter(
     prefix="/api/college",
-    tags=["College - Students"]
+    default_response_class=ORJSONResponse,
+    tags=["College - Students"],
+    dependencies=[
+        Depends(require_role("COLLEGE_ADMIN", detail="College admin access only"))
+    ]
 )
 
 service = CollegeStudentService()
 
 
-# =====================================================
-# 🔐 COMMON ROLE CHECK
-# =====================================================
-def ensure_college_admin(user: dict):
-    if user.get("role") != "COLLEGE_ADMIN":
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="College admin access only"
-        )
-
-
 # =====================================================
 # 1️⃣ LIST STUDENTS
 # =====================================================
 @router.get("/students")
 async def list_students(
     request: Request,
+    limit: int | None = Query(None, ge=1, le=500),
+    after_name: str | None = Query(None, description="Name of the last student on the previous page"),
+    after_id: int | None = Query(None, description="student_id of the last student on the previous page"),
     db: AsyncSession = Depends(get_db)
 ):
     user = request.state.user
-    ensure_college_admin(user)
+
+    if (after_name is None) != (after_id is None):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="after_name and after_id must be given together"
+        )
 
     return await service.list_students(
         db=db,
-        college_admin_user=user
+        college_admin_user=user,
+        limit=limit,
+        after=(after_name, after_id) if after_id is not None else None
     )
 
 
@@ -58,7 +68,6 @@ async def filter_students(
     db: AsyncSession = Depends(get_db)
 ):
     user = request.state.user
-    ensure_college_admin(user)
 
     return await service.filter_students(
         db=db,
@@ -80,7 +89,6 @@ async def search_students(
     db: AsyncSession = Depends(get_db)
 ):
     user = request.state.user
-    ensure_college_admin(user)
 
     return await service.search_students(
         db=db,
@@ -99,13 +107,15 @@ async def add_single_student(
     db: AsyncSession = Depends(get_db)
 ):
     user = request.state.user
-    ensure_college_admin(user)
 
-    return await service.add_single_student(
+    result = await service.add_single_student(
         db=db,
         college_admin_user=user,
         data=payload
     )
+    college_id = await resolve_college_id(db, user.id)
+    await invalidate(college_dashboard_key(college_id), ADMIN_DASHBOARD_KEY)
+    return result
 
 
 # =====================================================
@@ -118,21 +128,26 @@ async def bulk_upload_students(
     db: AsyncSession = Depends(get_db)
 ):
     user = request.state.user
-    ensure_college_admin(user)
 
-    return await service.bulk_upload_students(
+    result = await service.bulk_upload_students(
         db=db,
         college_admin_user=user,
         file=file
     )
+    college_id = await resolve_college_id(db, user.id)
+    await invalidate(college_dashboard_key(college_id), ADMIN_DASHBOARD_KEY)
+    return result
 @router.get("/students/progress")
 async def student_progress(
     request: Request,
+    limit: int | None = Query(None, ge=1, le=500),
+    offset: int = Query(0, ge=0),
     db: AsyncSession = Depends(get_db),
 ):
     user = request.state.user
-    ensure_college_admin(user)
 
-    return await service.get_student_progress(db, user)
+    return await service.get_student_progress(
+        db, user, limit=limit, offset=offset
+    )
 
 
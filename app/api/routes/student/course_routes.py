@@ -1,7 +1,9 @@
-from fastapi import APIRouter, Depends, Request, HTTPException, status
+from fastapi import APIRouter, Depends, Request, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.database import get_db
+from app.core.responses import ORJSONResponse
+from app.core.permissions import require_role
 from app.utils.decorators import require_permission
 from app.services.student.course_service import StudentCourseService
 from app.schemas.enrollment_schema import (
@@ -11,7 +13,8 @@ from app.schemas.enrollment_schema import (
 
 router = APIRouter(
     prefix="/api/student/courses",
-    tags=["Student - Courses"]
+    tags=["Student - Courses"],
+    dependencies=[Depends(require_role("STUDENT", detail="Student access only"))]
 )
 
 service = StudentCourseService()
@@ -35,12 +38,6 @@ async def list_my_courses(
 
     user = request.state.user
 
-    if user.role.name != "STUDENT":
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="Student access only"
-        )
-
     return await service.list_student_courses(
         db=db,
         student_user=user
@@ -52,7 +49,8 @@ async def list_my_courses(
 # -------------------------------------------------
 @router.patch(
     "/{course_id}/progress",
-    status_code=status.HTTP_200_OK,
+    response_class=ORJSONResponse,
+    status_code=status.HTTP_202_ACCEPTED,
     dependencies=[Depends(require_permission("update", "student_courses"))]
 )
 async def update_course_progress(
@@ -63,16 +61,13 @@ async def update_course_progress(
 ):
     """
     Update progress for a course (percentage, last accessed)
+
+    202: the write is batched and lands within a couple of seconds;
+    the dashboard cache is invalidated once it does.
     """
 
     user = request.state.user
 
-    if user.role.name != "STUDENT":
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="Student access only"
-        )
-
     return await service.update_course_progress(
         db=db,
         student_user=user,
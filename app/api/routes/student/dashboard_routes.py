@@ -1,13 +1,22 @@
-from fastapi import APIRouter, Depends, Request, HTTPException, status
+from fastapi import APIRouter, Depends, Request, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.cache import (
+    cached,
+    student_dashboard_key,
+    STUDENT_DASHBOARD_TTL_SECONDS
+)
 from app.core.database import get_db
+from app.core.responses import ORJSONResponse
+from app.core.permissions import require_role
 from app.utils.decorators import require_permission
 from app.services.student.dashboard_service import StudentDashboardService
 
 router = APIRouter(
     prefix="/api/student",
-    tags=["Student"]
+    default_response_class=ORJSONResponse,
+    tags=["Student"],
+    dependencies=[Depends(require_role("STUDENT", detail="Student access only"))]
 )
 
 service = StudentDashboardService()
@@ -32,16 +41,10 @@ async def student_dashboard(
 
     user = request.state.user
 
-    # Defense-in-depth role check
-    if user.role.name != "STUDENT":
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="Student access only"
-        )
-
-    dashboard_data = await service.get_dashboard_data(
-        db=db,
-        student_user=user
+    dashboard_data = await cached(
+        student_dashboard_key(user.id),
+        lambda: service.get_dashboard_data(db=db, student_user=user),
+        ttl=STUDENT_DASHBOARD_TTL_SECONDS
     )
 
-    return dashboard_data
+    return ORJSONResponse(dashboard_data)
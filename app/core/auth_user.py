@@ -0,0 +1,12 @@
+from dataclasses import dataclass
+
+
+@dataclass(slots=True, frozen=True)
+class AuthUser:
+    """
+    Authenticated principal built from JWT claims.
+    Stored on request.state.user by AuthMiddleware.
+    """
+    id: int
+    role: str
+    permissions: frozenset[str]
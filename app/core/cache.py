@@ -0,0 +1,211 @@
+from typing import Any, Awaitable, Callable
+
+import orjson
+from cachetools import TLRUCache
+
+from app.core.config import settings
+
+# -----------------------------
+# RESULT CACHE
+# -----------------------------
+# Short TTL keeps rarely-changing list / dashboard endpoints off the DB;
+# write paths call invalidate() so users see their own changes.
+#
+# With REDIS_URL set the cache is shared by all workers (values stored
+# as orjson); otherwise it falls back to a per-process TLRU cache.
+CACHE_TTL_SECONDS = 30
+CACHE_PREFIX = "crt:"
+
+# local entries are (ttl, value) so each key expires on its own TTL
+_cache: TLRUCache = TLRUCache(
+    maxsize=256,
+    ttu=lambda _key, entry, now: now + entry[0]
+)
+
+if settings.REDIS_URL:
+    from redis import asyncio as aioredis
+    from redis.exceptions import RedisError
+
+    _redis = aioredis.from_url(settings.REDIS_URL)
+else:
+    _redis = None
+
+    class RedisError(Exception):
+        pass
+
+
+COLLEGES_LIST_KEY = "colleges:list"
+COURSES_LIST_KEY = "courses:list"
+ADMIN_DASHBOARD_KEY = "dashboard:admin"
+
+# platform-wide aggregates: expensive, minute-level freshness is fine
+ADMIN_DASHBOARD_TTL_SECONDS = 60
+# college aggregates; student/course writes invalidate, progress just ages out
+COLLEGE_DASHBOARD_TTL_SECONDS = 120
+# progress flushes invalidate; bulk course assignment doesn't (no per-student
+# keys at hand), so new enrollments show up within this window
+STUDENT_DASHBOARD_TTL_SECONDS = 30
+
+
+# college-scoped entries are keyed by college, not by admin, so a write
+# by one admin clears the entry every admin of that college reads
+def college_dashboard_key(college_id: int) -> str:
+    return f"dashboard:college:{college_id}"
+
+
+def student_dashboard_key(user_id: int) -> str:
+    return f"dashboard:student:{user_id}"
+
+
+def college_courses_key(college_id: int) -> str:
+    return f"courses:college:{college_id}"
+
+
+async def cached(
+    key: str,
+    factory: Callable[[], Awaitable[Any]],
+    ttl: int = CACHE_TTL_SECONDS
+) -> Any:
+    """
+    Return the cached value for key, computing it with factory() on a miss
+    """
+    if _redis is not None:
+        try:
+            raw = await _redis.get(CACHE_PREFIX + key)
+            if raw is not None:
+                return orjson.loads(raw)
+        except RedisError:
+            # cache outage must not take the endpoint down
+            return await factory()
+
+        value = await factory()
+
+        try:
+            await _redis.set(
+                CACHE_PREFIX + key,
+                orjson.dumps(value),
+                ex=ttl
+            )
+        except RedisError:
+            pass
+
+        return value
+
+    try:
+        return _cache[key][1]
+    except KeyError:
+        pass
+
+    value = await factory()
+    _cache[key] = (ttl, value)
+    return value
+
+
+async def invalidate(*keys: str) -> None:
+    """
+    Drop cached entries after a write
+    """
+    for key in keys:
+        _cache.pop(key, None)
+
+    if _redis is not None and keys:
+        try:
+            await _redis.delete(*(CACHE_PREFIX + key for key in keys))
+        except RedisError:
+            pass
+
+
+async def close_cache() -> None:
+    """
+    Release the Redis connection pool (app shutdown)
+    """
+    if _redis is not None:
+        await _redis.aclose()
+
+
+# -----------------------------
+# SIEVE CACHE (HOT-PATH LOOKUPS)
+# -----------------------------
+class _SieveNode:
+    __slots__ = ("key", "value", "visited", "prev", "next")
+
+    def __init__(self, key, value):
+        self.key = key
+        self.value = value
+        self.visited = False
+        self.prev = None    # towards newer entries (head)
+        self.next = None    # towards older entries (tail)
+
+
+class SieveCache:
+    """
+    Bounded cache with SIEVE eviction: a hit only sets a flag (no list
+    reordering like LRU), and eviction sweeps a hand from old to new,
+    sparing visited entries once. Resists thrash from one-off keys.
+
+    Not thread-safe; meant for event-loop-only lookups.
+    """
+
+    def __init__(self, maxsize: int):
+        self.maxsize = maxsize
+        self._map: dict = {}
+        self._head = None
+        self._tail = None
+        self._hand = None
+
+    def __len__(self) -> int:
+        return len(self._map)
+
+    def get(self, key, default=None):
+        node = self._map.get(key)
+        if node is None:
+            return default
+        node.visited = True
+        return node.value
+
+    def __setitem__(self, key, value) -> None:
+        node = self._map.get(key)
+        if node is not None:
+            node.value = value
+            node.visited = True
+            return
+
+        if len(self._map) >= self.maxsize:
+            self._evict()
+
+        node = _SieveNode(key, value)
+        node.next = self._head
+        if self._head is not None:
+            self._head.prev = node
+        self._head = node
+        if self._tail is None:
+            self._tail = node
+        self._map[key] = node
+
+    def pop(self, key, default=None):
+        node = self._map.pop(key, None)
+        if node is None:
+            return default
+        if self._hand is node:
+            self._hand = node.prev
+        self._unlink(node)
+        return node.value
+
+    def _evict(self) -> None:
+        node = self._hand or self._tail
+        while node.visited:
+            node.visited = False
+            node = node.prev or self._tail
+        self._hand = node.prev
+        del self._map[node.key]
+        self._unlink(node)
+
+    def _unlink(self, node: _SieveNode) -> None:
+        if node.prev is not None:
+            node.prev.next = node.next
+        else:
+            self._head = node.next
+        if node.next is not None:
+            node.next.prev = node.prev
+        else:
+            self._tail = node.prev
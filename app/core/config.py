@@ -1,7 +1,19 @@
+import os
+from functools import lru_cache
+
+from dotenv import load_dotenv
 from pydantic_settings import BaseSettings
 from pydantic import Field
 from typing import Optional
 
+# -----------------------------
+# LOAD ENV (ONCE PER PROCESS)
+# -----------------------------
+# Populates os.environ for modules that read it directly (database.py).
+# In production the orchestrator provides the environment.
+if os.getenv("ENVIRONMENT", "development") != "production":
+    load_dotenv(override=False)
+
 
 class Settings(BaseSettings):
     # -----------------------------
@@ -11,6 +23,12 @@ class Settings(BaseSettings):
     ALGORITHM: str = "HS256"
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 60
 
+    # -----------------------------
+    # PASSWORDS
+    # -----------------------------
+    # bcrypt work factor for new hashes; existing hashes keep theirs
+    BCRYPT_ROUNDS: int = 12
+
     # -----------------------------
     # AWS S3 (OPTIONAL but REQUIRED FOR FILE UPLOAD)
     # -----------------------------
@@ -20,6 +38,11 @@ class Settings(BaseSettings):
     AWS_S3_BUCKET: Optional[str] = None
     AWS_S3_COURSE_PREFIX: str = "Courses"
 
+    # -----------------------------
+    # CACHE (OPTIONAL – in-process fallback when unset)
+    # -----------------------------
+    REDIS_URL: Optional[str] = None
+
     # -----------------------------
     # APP
     # -----------------------------
@@ -30,4 +53,12 @@ class Settings(BaseSettings):
         extra = "ignore"
 
 
-settings = Settings()
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """
+    Parsed once per process; usable as Depends(get_settings)
+    """
+    return Settings()
+
+
+settings = get_settings()
@@ -1,7 +1,9 @@
+import asyncio
+import logging
 import os
-from dotenv import load_dotenv
 from urllib.parse import quote_plus
 
+from sqlalchemy import text
 from sqlalchemy.ext.asyncio import (
     create_async_engine,
     AsyncSession,
@@ -11,7 +13,7 @@ from sqlalchemy.ext.asyncio import (
 # -----------------------------
 # LOAD ENV
 # -----------------------------
-load_dotenv()
+from app.core import config  # noqa: F401  (loads .env once)
 
 # -----------------------------
 # DATABASE CONFIG
@@ -27,19 +29,45 @@ DATABASE_URL = (
     f"@{DB_HOST}:{DB_PORT}/{DB_NAME}"
 )
 
+# -----------------------------
+# POOL CONFIG
+# -----------------------------
+DB_POOL_SIZE = int(os.getenv("DB_POOL_SIZE", "20"))
+DB_MAX_OVERFLOW = int(os.getenv("DB_MAX_OVERFLOW", "40"))
+DB_POOL_TIMEOUT = int(os.getenv("DB_POOL_TIMEOUT", "30"))
+DB_QUERY_CACHE_SIZE = int(os.getenv("DB_QUERY_CACHE_SIZE", "1200"))
+DB_POOL_WARM_SIZE = int(os.getenv("DB_POOL_WARM_SIZE", str(DB_POOL_SIZE)))
+DB_ISOLATION_LEVEL = os.getenv("DB_ISOLATION_LEVEL", "READ COMMITTED")
+
+# SQL echo shows "[cached since …]" / "[generated in …]" per statement,
+# i.e. whether query_cache_size is large enough for the hot statements
+DB_ECHO = os.getenv("DB_ECHO", "false").lower() == "true"
+
+logger = logging.getLogger(__name__)
+
+# MySQL error code for a unique-key violation (IntegrityError.orig.args[0])
+MYSQL_DUP_ENTRY = 1062
+
 # -----------------------------
 # ASYNC ENGINE (STABLE CONFIG)
 # -----------------------------
 engine = create_async_engine(
     DATABASE_URL,
-    echo=False,
+    echo=DB_ECHO,
 
     # 🔥 REQUIRED FOR MYSQL STABILITY (Windows Safe)
     pool_pre_ping=True,     # checks connection before use
     pool_recycle=1800,      # recycle before MySQL timeout
-    pool_size=5,
-    max_overflow=10,
-    pool_timeout=30,
+    pool_size=DB_POOL_SIZE,
+    max_overflow=DB_MAX_OVERFLOW,
+    pool_timeout=DB_POOL_TIMEOUT,
+
+    # bounded LRU of compiled SQL shared by all sessions
+    query_cache_size=DB_QUERY_CACHE_SIZE,
+
+    # InnoDB defaults to REPEATABLE READ; read-mostly API traffic doesn't
+    # need a transaction-long snapshot or gap locks on writes
+    isolation_level=DB_ISOLATION_LEVEL,
 )
 
 # -----------------------------
@@ -51,6 +79,49 @@ AsyncSessionLocal = async_sessionmaker(
     expire_on_commit=False,
 )
 
+
+async def in_own_session(section, *args):
+    """
+    Await section(session, *args) on its own pooled session, so
+    independent queries can run concurrently (one AsyncSession can't)
+    """
+    async with AsyncSessionLocal() as session:
+        return await section(session, *args)
+
+# -----------------------------
+# POOL WARM-UP (APP STARTUP)
+# -----------------------------
+async def _ping() -> None:
+    async with engine.connect() as conn:
+        await conn.execute(text("SELECT 1"))
+
+
+async def warm_pool() -> None:
+    """
+    Open DB_POOL_WARM_SIZE connections concurrently so the first requests
+    don't pay the TCP + MySQL handshake. Failures only log: the pool
+    still connects lazily.
+    """
+    results = await asyncio.gather(
+        *(_ping() for _ in range(DB_POOL_WARM_SIZE)),
+        return_exceptions=True,
+    )
+
+    errors = [r for r in results if isinstance(r, Exception)]
+    if errors:
+        logger.warning(
+            "DB pool warm-up: %d/%d connections failed (%s)",
+            len(errors), len(results), errors[0]
+        )
+
+
+async def close_pool() -> None:
+    """
+    Close pooled DB connections cleanly (app shutdown)
+    """
+    await engine.dispose()
+
+
 # -----------------------------
 # FASTAPI DEPENDENCY
 # -----------------------------
@@ -1,28 +1,38 @@
-from fastapi import Depends, HTTPException, Request
-from sqlalchemy.ext.asyncio import AsyncSession
+from fastapi import HTTPException, Request
 
-from app.core.database import get_db
+from app.core.auth_user import AuthUser
 from app.core.jwt import decode_access_token
-from app.repositories.user_repository import UserRepository
+from app.core.user_status import is_user_active
+
+
+async def get_current_user(request: Request) -> AuthUser:
+    """
+    Resolve the authenticated user from token claims; is_active comes
+    from the DB (TTL-cached), not from the token.
+
+    AuthMiddleware has normally already decoded the token; otherwise the
+    Authorization header is decoded here.
+    """
+    user = getattr(request.state, "user", None)
+    if user:
+        return user
 
-async def get_current_user(
-    request: Request,
-    db: AsyncSession = Depends(get_db)
-):
     auth = request.headers.get("Authorization")
 
     if not auth or not auth.startswith("Bearer "):
         raise HTTPException(status_code=401, detail="Access token missing")
 
-    token = auth.split(" ")[1]
+    token = auth.split(" ", 1)[1].strip()
     payload = decode_access_token(token)
 
-    if not payload:
+    if not payload or not payload.get("sub"):
         raise HTTPException(status_code=401, detail="Invalid token")
 
-    user = await UserRepository().get_by_id(db, payload["user_id"])
-
-    if not user or not user.is_active:
+    if not await is_user_active(int(payload["sub"])):
         raise HTTPException(status_code=401, detail="User inactive")
 
-    return user
+    return AuthUser(
+        id=int(payload["sub"]),
+        role=payload.get("role", "USER"),
+        permissions=frozenset(payload.get("permissions", ())),
+    )
@@ -1,38 +1,76 @@
+import base64
+import calendar
+import hashlib
+import hmac
+import time
 from datetime import datetime, timedelta
-from jose import jwt, JWTError
 
+import jwt
+import orjson
+from app.core.cache import SieveCache
 from app.core.config import settings
 
 ALGORITHM = "HS256"
 ACCESS_TOKEN_EXPIRE_MINUTES = 60
+DECODE_CACHE_SIZE = 10000
+DECODE_CACHE_TTL = 30
+
+# token sha256 -> (verified payload, cache-until ts); failures are not cached
+_decode_cache = SieveCache(maxsize=DECODE_CACHE_SIZE)
+
+
+def _b64url(raw: bytes) -> bytes:
+    return base64.urlsafe_b64encode(raw).rstrip(b"=")
+
+
+# Signing state built once: HS256 header segment + HMAC key
+_HEADER_SEGMENT = _b64url(orjson.dumps({"alg": ALGORITHM, "typ": "JWT"}))
+_SIGNING_KEY = settings.SECRET_KEY.encode("utf-8")
 
 
 def create_access_token(data: dict) -> str:
     """
     Create JWT access token
+
+    HS256 compact serialization done directly (orjson payload + one
+    HMAC); tokens are standard and decoded by PyJWT below.
     """
     to_encode = data.copy()
 
     expire = datetime.utcnow() + timedelta(minutes=ACCESS_TOKEN_EXPIRE_MINUTES)
-    to_encode.update({"exp": expire})
+    to_encode["exp"] = calendar.timegm(expire.utctimetuple())
 
-    return jwt.encode(
-        to_encode,
-        settings.SECRET_KEY,
-        algorithm=ALGORITHM
-    )
+    signing_input = _HEADER_SEGMENT + b"." + _b64url(orjson.dumps(to_encode))
+    signature = hmac.new(_SIGNING_KEY, signing_input, hashlib.sha256).digest()
+
+    return (signing_input + b"." + _b64url(signature)).decode("ascii")
 
 
 def decode_access_token(token: str) -> dict | None:
     """
     Decode and validate JWT token
+
+    Verified payloads are cached (SIEVE eviction) keyed by the token's
+    SHA-256, never past min(exp, now + DECODE_CACHE_TTL), so an expired
+    token is never served from cache.
     """
+    key = hashlib.sha256(token.encode()).digest()
+    now = time.time()
+
+    entry = _decode_cache.get(key)
+    if entry is not None and entry[1] > now:
+        return dict(entry[0])
+
     try:
         payload = jwt.decode(
             token,
             settings.SECRET_KEY,
-            algorithms=[ALGORITHM]
+            algorithms=[ALGORITHM],
+            options={"require": ["exp", "sub"]}
         )
-        return payload
-    except JWTError:
+    except jwt.PyJWTError:
+        _decode_cache.pop(key, None)
         return None
+
+    _decode_cache[key] = (payload, min(payload["exp"], now + DECODE_CACHE_TTL))
+    return dict(payload)
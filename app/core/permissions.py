@@ -1,14 +1,25 @@
+from functools import lru_cache
 from fastapi import Request, HTTPException, status
 from typing import Callable
 
+# roles that pass every permission check (one hash lookup, however many)
+BYPASS_ROLES: frozenset[str] = frozenset({"ADMIN"})
 
+
+@lru_cache(maxsize=None)
 def require_permission(action: str, resource: str) -> Callable:
     """
     Dependency to enforce role & permission based access.
     Uses request.state.user (set by auth middleware).
+
+    Memoized: every route asking for the same permission shares one
+    checker, so FastAPI's per-request dependency cache runs it once.
     """
 
-    async def permission_checker(request: Request):
+    # invariant per route: build once, not on every request
+    required_permission = f"{action}:{resource}"
+
+    async def permission_checker(request: Request) -> None:
         user = getattr(request.state, "user", None)
 
         if not user:
@@ -17,21 +28,45 @@ def require_permission(action: str, resource: str) -> Callable:
                 detail="Authentication required"
             )
 
-        role = user.get("role")
-        permissions = user.get("permissions", [])
-
         # ✅ Super Admin / Admin full access
-        if role == "ADMIN":
-            return True
+        if user.role in BYPASS_ROLES:
+            return
 
-        required_permission = f"{action}:{resource}"
-
-        if required_permission not in permissions:
+        # frozenset (set by auth middleware) -> O(1) membership
+        if required_permission not in user.permissions:
             raise HTTPException(
                 status_code=status.HTTP_403_FORBIDDEN,
                 detail="You do not have permission to perform this action"
             )
 
-        return True
-
     return permission_checker
+
+
+@lru_cache(maxsize=None)
+def require_role(*roles: str, detail: str = "Access denied for this role") -> Callable:
+    """
+    Dependency to restrict a router/route to specific roles.
+    Install once via `dependencies=[Depends(require_role(...))]`
+    instead of repeating inline role checks in every handler.
+    """
+
+    allowed = frozenset(roles)
+
+    async def role_checker(request: Request):
+        user = getattr(request.state, "user", None)
+
+        if not user:
+            raise HTTPException(
+                status_code=status.HTTP_401_UNAUTHORIZED,
+                detail="Authentication required"
+            )
+
+        if user.role not in allowed:
+            raise HTTPException(
+                status_code=status.HTTP_403_FORBIDDEN,
+                detail=detail
+            )
+
+        return user
+
+    return role_checker
@@ -0,0 +1,24 @@
+from typing import Any
+
+import orjson
+from fastapi.responses import JSONResponse
+
+
+class ORJSONResponse(JSONResponse):
+    """
+    JSON response rendered with orjson (Rust) instead of stdlib json.
+    For routes returning plain dicts; routes with a response_model keep
+    FastAPI's default class so Pydantic dumps straight to JSON bytes.
+
+    Handlers may also return an ORJSONResponse instance directly: FastAPI
+    then skips its jsonable_encoder walk over the content, so large dicts
+    (dashboards, course lists) are encoded once, by orjson. The content
+    must then be orjson-native (no Decimal or ORM objects), and such
+    routes need no response_class.
+    """
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(
+            content,
+            option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+        )
@@ -1,7 +1,12 @@
 import boto3
+import hashlib
 import uuid
+from boto3.s3.transfer import TransferConfig
+from botocore.config import Config
+from botocore.exceptions import ClientError
 from fastapi import UploadFile
-from urllib.parse import quote
+from fastapi.concurrency import run_in_threadpool
+from urllib.parse import quote, unquote, urlparse
 
 from app.core.config import settings
 
@@ -10,38 +15,156 @@ s3_client = boto3.client(
     aws_access_key_id=settings.AWS_ACCESS_KEY_ID,
     aws_secret_access_key=settings.AWS_SECRET_ACCESS_KEY,
     region_name=settings.AWS_REGION,
+    # Shared keep-alive pool sized for concurrent multipart uploads
+    config=Config(
+        max_pool_connections=50,
+        tcp_keepalive=True,
+        retries={"max_attempts": 3, "mode": "adaptive"},
+    ),
 )
 
-async def upload_file_to_s3(
-    file: UploadFile,
-    folder: str,
-):
-    # Read file bytes
-    file_bytes = await file.read()
+# Multipart in 8 MB parts → memory bounded by chunk size × concurrency
+TRANSFER_CONFIG = TransferConfig(
+    multipart_threshold=8 * 1024 * 1024,
+    multipart_chunksize=8 * 1024 * 1024,
+    max_concurrency=8,
+    use_threads=True,
+)
 
-    # Safer key (UUID + original name)
-    key = f"{folder}/{uuid.uuid4()}_{file.filename}"
+# Read size for the local size/hash pass (1 MiB, not the 8 KiB default)
+READ_CHUNK_SIZE = 1024 * 1024
 
-    # Upload to S3
-    s3_client.put_object(
-        Bucket=settings.AWS_S3_BUCKET,
-        Key=key,
-        Body=file_bytes,
-        ContentType=file.content_type,
-        ContentDisposition="inline",  # allows browser preview
+
+def _put_fileobj(
+    fileobj, key: str, content_type: str | None
+) -> tuple[int, str]:
+    """
+    Blocking part of the upload (disk read + S3 transfer).
+    Always called via the threadpool so the event loop stays free.
+    """
+    # Size + SHA-256 in one chunked pass over the spooled temp file
+    hasher = hashlib.sha256()
+    size = 0
+    fileobj.seek(0)
+    while chunk := fileobj.read(READ_CHUNK_SIZE):
+        size += len(chunk)
+        hasher.update(chunk)
+    fileobj.seek(0)
+
+    # Stream to S3 (multipart for large files)
+    s3_client.upload_fileobj(
+        fileobj,
+        settings.AWS_S3_BUCKET,
+        key,
+        Config=TRANSFER_CONFIG,
+        ExtraArgs={
+            "ContentType": content_type,
+            "ContentDisposition": "inline",  # allows browser preview
+        },
     )
 
+    return size, hasher.hexdigest()
+
+
+def new_s3_key(folder: str, filename: str) -> str:
+    # Safer key (UUID + original name)
+    return f"{folder}/{uuid.uuid4()}_{filename}"
+
+
+def s3_url_for_key(key: str) -> str:
     # ✅ URL encode the key (THIS IS THE FIX)
     encoded_key = quote(key)
 
-    file_url = (
+    return (
         f"https://{settings.AWS_S3_BUCKET}.s3."
         f"{settings.AWS_REGION}.amazonaws.com/{encoded_key}"
     )
 
+
+async def upload_file_to_s3(
+    file: UploadFile,
+    folder: str,
+    key: str | None = None,
+):
+    """
+    Upload to folder under a fresh key, or under key when the caller
+    needs the URL before the upload finishes (see new_s3_key)
+    """
+    if key is None:
+        key = new_s3_key(folder, file.filename)
+
+    file_size, sha256 = await run_in_threadpool(
+        _put_fileobj, file.file, key, file.content_type
+    )
+
     return {
-        "file_url": file_url,   # ✅ usable in browser
-        "file_size": len(file_bytes),
+        "file_url": s3_url_for_key(key),   # ✅ usable in browser
+        "file_size": file_size,
         "content_type": file.content_type,
+        "sha256": sha256,       # content hash (dedup / integrity)
         "s3_key": key,          # internal use (delete/stream)
     }
+
+
+async def delete_s3_object(key: str) -> None:
+    await run_in_threadpool(
+        s3_client.delete_object,
+        Bucket=settings.AWS_S3_BUCKET,
+        Key=key,
+    )
+
+
+def s3_key_from_url(file_url: str) -> str:
+    """
+    Recover the object key from a stored public S3 URL
+    """
+    return unquote(urlparse(file_url).path.lstrip("/"))
+
+
+def presign_put(key: str, content_type: str, expires: int = 900) -> str:
+    """
+    Short-lived PUT URL so clients upload straight to S3; the client
+    must send the same Content-Type it was signed with
+    """
+    return s3_client.generate_presigned_url(
+        "put_object",
+        Params={
+            "Bucket": settings.AWS_S3_BUCKET,
+            "Key": key,
+            "ContentType": content_type,
+        },
+        ExpiresIn=expires,
+    )
+
+
+async def s3_object_size(key: str) -> int | None:
+    """
+    Size of an uploaded object (HEAD), None when it doesn't exist
+    """
+    try:
+        head = await run_in_threadpool(
+            s3_client.head_object,
+            Bucket=settings.AWS_S3_BUCKET,
+            Key=key,
+        )
+    except ClientError as exc:
+        if exc.response.get("Error", {}).get("Code") in ("404", "NoSuchKey", "NotFound"):
+            return None
+        raise
+
+    return head["ContentLength"]
+
+
+def presign_get(key: str, filename: str, expires: int = 900) -> str:
+    """
+    Short-lived GET URL so clients download straight from S3
+    """
+    return s3_client.generate_presigned_url(
+        "get_object",
+        Params={
+            "Bucket": settings.AWS_S3_BUCKET,
+            "Key": key,
+            "ResponseContentDisposition": f'inline; filename="{filename}"',
+        },
+        ExpiresIn=expires,
+    )
@@ -1,12 +1,22 @@
-from passlib.context import CryptContext
+import bcrypt
+
+from app.core.config import settings
+
+# bcrypt only uses the first 72 bytes of the password
+BCRYPT_MAX_PASSWORD_BYTES = 72
+
+
+def _password_bytes(password: str) -> bytes:
+    return password.encode("utf-8")[:BCRYPT_MAX_PASSWORD_BYTES]
 
-pwd_context = CryptContext(
-    schemes=["bcrypt"],
-    deprecated="auto"
-)
 
 def hash_password(password: str) -> str:
-    return pwd_context.hash(password)
+    return bcrypt.hashpw(
+        _password_bytes(password),
+        bcrypt.gensalt(rounds=settings.BCRYPT_ROUNDS)
+    ).decode("ascii")
+
 
 def verify_password(password: str, hashed: str) -> bool:
-    return pwd_context.verify(password, hashed)
+    # straight to the C extension (no passlib handler layer)
+    return bcrypt.checkpw(_password_bytes(password), hashed.encode("ascii"))
@@ -0,0 +1,30 @@
+from cachetools import TTLCache
+from sqlalchemy import select
+
+from app.core.database import in_own_session
+from app.models.models import User
+
+# user id → users.is_active; tokens live 60 min, so the flag is re-read
+# from the DB at most every USER_STATUS_TTL seconds per worker – a
+# deactivated (or deleted) user loses access within that window
+USER_STATUS_TTL = 60   # seconds
+_user_status: TTLCache = TTLCache(maxsize=10000, ttl=USER_STATUS_TTL)
+
+
+async def _load_is_active(db, user_id: int) -> bool:
+    # no row (user deleted) counts as inactive
+    return bool(
+        await db.scalar(select(User.is_active).where(User.id == user_id))
+    )
+
+
+async def is_user_active(user_id: int) -> bool:
+    """
+    users.is_active for an authenticated token subject (TTL-cached)
+    """
+    active = _user_status.get(user_id)
+    if active is None:
+        active = await in_own_session(_load_is_active, user_id)
+        _user_status[user_id] = active
+    return active
+
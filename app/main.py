@@ -1,9 +1,19 @@
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from brotli_asgi import BrotliMiddleware
 from fastapi.openapi.utils import get_openapi
 
+from app.core.cache import close_cache
+from app.core.config import settings
+from app.core.database import close_pool, warm_pool
 from app.middleware.auth_middleware import AuthMiddleware
+from app.repositories.user_repository import preload_role_ids
+from app.services.student.progress_coalescer import progress_coalescer
 from app.middleware.logging_middleware import LoggingMiddleware
+from app.middleware.health_middleware import HealthCheckMiddleware
+from app.middleware.query_count_middleware import QueryCountMiddleware
 from app.middleware.error_handler import register_exception_handlers
 
 # -----------------------------
@@ -24,14 +34,58 @@ from app.api.routes.college.course_routes import router as college_course_router
 from app.api.routes.student.dashboard_routes import router as student_dashboard_router
 from app.api.routes.student.course_routes import router as student_course_router
 
-from dotenv import load_dotenv
-load_dotenv()
+ROUTERS = (
+    auth_router,
+
+    admin_dashboard_router,
+    admin_college_router,
+    admin_course_router,
+    admin_test_router,
+    admin_course_file_router,
+
+    college_dashboard_router,
+    college_student_router,
+    college_course_router,
+
+    student_dashboard_router,
+    student_course_router,
+)
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    await warm_pool()
+    await preload_role_ids()
+
+    # Build + cache the OpenAPI schema once at boot (all routes are
+    # registered by now) instead of on the first /docs request
+    app.openapi()
+
+    progress_coalescer.start()
+
+    yield
+    await progress_coalescer.stop()
+    await close_cache()
+    await close_pool()
+
 
 def create_app() -> FastAPI:
     app = FastAPI(
         title="CRT Backend API",
         description="Complete Role-based Training Platform Backend",
-        version="1.0.0"
+        version="1.0.0",
+        lifespan=lifespan
+    )
+
+    # -----------------------------
+    # COMPRESSION (JSON lists / dashboards)
+    # -----------------------------
+    # br for clients that accept it, gzip fallback for the rest
+    app.add_middleware(
+        BrotliMiddleware,
+        quality=4,
+        minimum_size=512,
+        gzip_fallback=True,
     )
 
     # -----------------------------
@@ -49,8 +103,16 @@ def create_app() -> FastAPI:
     # MIDDLEWARE
     # -----------------------------
     app.add_middleware(LoggingMiddleware)
+
+    # dev only: warn on requests that look like N+1 query loops
+    if settings.ENVIRONMENT == "development":
+        app.add_middleware(QueryCountMiddleware)
+
     app.add_middleware(AuthMiddleware)
 
+    # outermost: /health never reaches the stack above
+    app.add_middleware(HealthCheckMiddleware)
+
     # -----------------------------
     # EXCEPTION HANDLERS
     # -----------------------------
@@ -59,20 +121,8 @@ def create_app() -> FastAPI:
     # -----------------------------
     # ROUTERS
     # -----------------------------
-    app.include_router(auth_router)
-
-    app.include_router(admin_dashboard_router)
-    app.include_router(admin_college_router)
-    app.include_router(admin_course_router)
-    app.include_router(admin_test_router)
-    app.include_router(admin_course_file_router)
-
-    app.include_router(college_dashboard_router)
-    app.include_router(college_student_router)
-    app.include_router(college_course_router)
-
-    app.include_router(student_dashboard_router)
-    app.include_router(student_course_router)
+    for router in ROUTERS:
+        app.include_router(router)
 
     return app
 
@@ -102,9 +152,12 @@ def custom_openapi():
         }
     }
 
+    # one shared list for every operation (schema is read-only once built)
+    security = [{"BearerAuth": []}]
     for path in openapi_schema["paths"].values():
         for method in path.values():
-            method.setdefault("security", [{"BearerAuth": []}])
+            if "security" not in method:
+                method["security"] = security
 
     app.openapi_schema = openapi_schema
     return app.openapi_schema
@@ -112,15 +165,3 @@ def custom_openapi():
 
 # ✅ VERY IMPORTANT
 app.openapi = custom_openapi
-
-
-# -----------------------------
-# HEALTH CHECK
-# -----------------------------
-@app.get("/health", tags=["System"])
-async def health_check():
-    return {
-        "status": "OK",
-        "service": "CRT Backend",
-        "version": "1.0.0"
-    }
@@ -1,9 +1,10 @@
-from fastapi import Request, status
-from fastapi.responses import JSONResponse
-from starlette.middleware.base import BaseHTTPMiddleware
-from jose import JWTError
+import orjson
+from fastapi import status
+from starlette.types import ASGIApp, Receive, Scope, Send
 
+from app.core.auth_user import AuthUser
 from app.core.jwt import decode_access_token
+from app.core.user_status import is_user_active
 
 # -------------------------------------------------
 # PUBLIC ROUTES (NO AUTH REQUIRED)
@@ -13,95 +14,126 @@ PUBLIC_PATHS = (
     "/docs",
     "/redoc",
     "/openapi.json",
-    "/health",
 )
 
+AUTHORIZATION_HEADER = b"authorization"
+BEARER_PREFIX = b"Bearer "
+BEARER_PREFIX_LEN = len(BEARER_PREFIX)
 
-class AuthMiddleware(BaseHTTPMiddleware):
+
+class AuthMiddleware:
     """
-    Global Authentication Middleware
+    Global Authentication Middleware (pure ASGI)
 
     - Validates JWT access token
     - Attaches authenticated user context to request.state
     - Blocks unauthenticated access to protected routes
+
+    Plain ASGI instead of BaseHTTPMiddleware: no extra task / memory
+    stream per request, and failures are answered directly via send().
     """
 
-    async def dispatch(self, request: Request, call_next):
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
 
-        path = request.url.path
-        method = request.method
+        if scope["type"] != "http":
+            return await self.app(scope, receive, send)
+
+        path = scope["path"]
+        method = scope["method"]
 
         # ------------------------------------------------
         # 1️⃣ ALLOW CORS PREFLIGHT
         # ------------------------------------------------
         if method == "OPTIONS":
-            return await call_next(request)
+            return await self.app(scope, receive, send)
 
         # ------------------------------------------------
         # 2️⃣ ALLOW PUBLIC ROUTES
         # ------------------------------------------------
-        if any(path.startswith(p) for p in PUBLIC_PATHS):
-            return await call_next(request)
+        if path.startswith(PUBLIC_PATHS):  # tuple → single C-level scan
+            return await self.app(scope, receive, send)
 
         # ------------------------------------------------
         # 3️⃣ READ AUTH HEADER
         # ------------------------------------------------
-        auth_header = request.headers.get("Authorization")
+        # Raw ASGI headers: names are already lower-cased bytes
+        auth_header = None
+        for name, value in scope["headers"]:
+            if name == AUTHORIZATION_HEADER:
+                auth_header = value
+                break
 
         if not auth_header:
-            return JSONResponse(
-                status_code=status.HTTP_401_UNAUTHORIZED,
-                content={"detail": "Authorization header missing"},
-            )
+            return await _send_401(send, MISSING_HEADER)
 
-        if not auth_header.startswith("Bearer "):
-            return JSONResponse(
-                status_code=status.HTTP_401_UNAUTHORIZED,
-                content={"detail": "Invalid authorization format"},
-            )
+        # bytes-level prefix check + slice (no str decode / split of the header)
+        if not auth_header.startswith(BEARER_PREFIX):
+            return await _send_401(send, BAD_FORMAT)
 
-        token = auth_header.split(" ", 1)[1].strip()
+        token = auth_header[BEARER_PREFIX_LEN:].strip().decode("latin-1")
 
         if not token:
-            return JSONResponse(
-                status_code=status.HTTP_401_UNAUTHORIZED,
-                content={"detail": "Token not provided"},
-            )
+            return await _send_401(send, MISSING_TOKEN)
 
         # ------------------------------------------------
         # 4️⃣ DECODE & VALIDATE TOKEN
         # ------------------------------------------------
-        try:
-            payload = decode_access_token(token)
-        except JWTError:
-            return JSONResponse(
-                status_code=status.HTTP_401_UNAUTHORIZED,
-                content={"detail": "Invalid or expired token"},
-            )
+        payload = decode_access_token(token)
 
         if not payload:
-            return JSONResponse(
-                status_code=status.HTTP_401_UNAUTHORIZED,
-                content={"detail": "Invalid token payload"},
-            )
+            return await _send_401(send, INVALID_TOKEN)
 
         user_id = payload.get("sub")
         if not user_id:
-            return JSONResponse(
-                status_code=status.HTTP_401_UNAUTHORIZED,
-                content={"detail": "User identity missing in token"},
-            )
+            return await _send_401(send, MISSING_SUBJECT)
 
         # ------------------------------------------------
-        # 5️⃣ ATTACH USER CONTEXT (SINGLE SOURCE OF TRUTH)
+        # 5️⃣ USER STILL ACTIVE (DB, TTL-cached)
         # ------------------------------------------------
-        request.state.user = {
-            "id": int(user_id),                     # 🔥 IMPORTANT
-            "role": payload.get("role", "USER"),
-            "permissions": payload.get("permissions", []),
-        }
+        if not await is_user_active(int(user_id)):
+            return await _send_401(send, USER_INACTIVE)
 
         # ------------------------------------------------
-        # 6️⃣ CONTINUE REQUEST
+        # 6️⃣ ATTACH USER CONTEXT (SINGLE SOURCE OF TRUTH)
+        # ------------------------------------------------
+        # request.state is backed by scope["state"]
+        scope.setdefault("state", {})["user"] = AuthUser(
+            id=int(user_id),                        # 🔥 IMPORTANT
+            role=payload.get("role", "USER"),
+            permissions=frozenset(payload.get("permissions", ())),
+        )
+
         # ------------------------------------------------
-        return await call_next(request)
+        # 7️⃣ CONTINUE REQUEST
+        # ------------------------------------------------
+        await self.app(scope, receive, send)
+
+
+# -------------------------------------------------
+# 401 RESPONSES (SERIALIZED ONCE AT IMPORT)
+# -------------------------------------------------
+def _401_body(detail: str) -> bytes:
+    return orjson.dumps({"detail": detail})
+
+
+MISSING_HEADER = _401_body("Authorization header missing")
+BAD_FORMAT = _401_body("Invalid authorization format")
+MISSING_TOKEN = _401_body("Token not provided")
+INVALID_TOKEN = _401_body("Invalid token payload")
+MISSING_SUBJECT = _401_body("User identity missing in token")
+USER_INACTIVE = _401_body("User inactive")
+
+
+async def _send_401(send: Send, body: bytes) -> None:
+    await send({
+        "type": "http.response.start",
+        "status": status.HTTP_401_UNAUTHORIZED,
+        "headers": [
+            (b"content-type", b"application/json"),
+            (b"content-length", str(len(body)).encode()),
+        ],
+    })
+    await send({"type": "http.response.body", "body": body})
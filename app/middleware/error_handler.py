@@ -1,9 +1,11 @@
 from fastapi import FastAPI, Request
-from fastapi.responses import JSONResponse
+from fastapi.encoders import jsonable_encoder
 from fastapi.exceptions import RequestValidationError
 from starlette.exceptions import HTTPException as StarletteHTTPException
 from sqlalchemy.exc import IntegrityError
 
+from app.core.responses import ORJSONResponse
+
 
 def register_exception_handlers(app: FastAPI):
     """
@@ -18,7 +20,7 @@ def register_exception_handlers(app: FastAPI):
         request: Request,
         exc: StarletteHTTPException
     ):
-        return JSONResponse(
+        return ORJSONResponse(
             status_code=exc.status_code,
             content={
                 "success": False,
@@ -34,12 +36,12 @@ def register_exception_handlers(app: FastAPI):
         request: Request,
         exc: RequestValidationError
     ):
-        return JSONResponse(
+        return ORJSONResponse(
             status_code=422,
             content={
                 "success": False,
                 "message": "Validation error",
-                "errors": exc.errors()
+                "errors": jsonable_encoder(exc.errors())
             }
         )
 
@@ -51,7 +53,7 @@ def register_exception_handlers(app: FastAPI):
         request: Request,
         exc: IntegrityError
     ):
-        return JSONResponse(
+        return ORJSONResponse(
             status_code=400,
             content={
                 "success": False,
@@ -67,7 +69,7 @@ def register_exception_handlers(app: FastAPI):
         request: Request,
         exc: Exception
     ):
-        return JSONResponse(
+        return ORJSONResponse(
             status_code=500,
             content={
                 "success": False,
@@ -0,0 +1,40 @@
+import orjson
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+HEALTH_PATH = "/health"
+
+# Constant body → serialized once at import
+HEALTH_BODY = orjson.dumps({
+    "status": "OK",
+    "service": "CRT Backend",
+    "version": "1.0.0"
+})
+
+
+class HealthCheckMiddleware:
+    """
+    Answers GET /health before any other middleware runs
+
+    Registered outermost, so liveness probes skip auth, logging, CORS,
+    compression and routing entirely.
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] != "http" or scope["path"] != HEALTH_PATH:
+            return await self.app(scope, receive, send)
+
+        await send({
+            "type": "http.response.start",
+            "status": 200,
+            "headers": [
+                (b"content-type", b"application/json"),
+                (b"content-length", str(len(HEALTH_BODY)).encode()),
+            ],
+        })
+        await send({
+            "type": "http.response.body",
+            "body": b"" if scope["method"] == "HEAD" else HEALTH_BODY,
+        })
@@ -1,24 +1,61 @@
+import atexit
+import logging
+import queue
 import time
-from starlette.middleware.base import BaseHTTPMiddleware
-from fastapi import Request
+from logging.handlers import QueueHandler, QueueListener
 
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
-class LoggingMiddleware(BaseHTTPMiddleware):
+# -------------------------------------------------
+# ACCESS LOGGER
+# -------------------------------------------------
+# Records are only enqueued on the request path; a background thread
+# formats and writes them, so stdout I/O never blocks the event loop.
+access_log = logging.getLogger("crt.access")
+access_log.setLevel(logging.INFO)
+access_log.propagate = False
+
+_log_queue: queue.SimpleQueue = queue.SimpleQueue()
+access_log.addHandler(QueueHandler(_log_queue))
+
+_stream_handler = logging.StreamHandler()
+_stream_handler.setFormatter(logging.Formatter("%(message)s"))
+
+_listener = QueueListener(_log_queue, _stream_handler)
+_listener.start()
+atexit.register(_listener.stop)
+
+
+class LoggingMiddleware:
     """
     Logs request method, path, status code, and execution time
+    (pure ASGI – reads the status from the response start message)
     """
 
-    async def dispatch(self, request: Request, call_next):
-        start_time = time.time()
+    def __init__(self, app: ASGIApp):
+        self.app = app
 
-        response = await call_next(request)
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] != "http":
+            return await self.app(scope, receive, send)
 
-        process_time = (time.time() - start_time) * 1000
+        start_time = time.perf_counter()
+        status_code = 500
 
-        print(
-            f"[{request.method}] {request.url.path} "
-            f"→ {response.status_code} "
-            f"({process_time:.2f} ms)"
-        )
+        async def send_wrapper(message: Message):
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
 
-        return response
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            # lazy %-formatting: skipped entirely if INFO is disabled
+            access_log.info(
+                "[%s] %s → %d (%.2f ms)",
+                scope["method"],
+                scope["path"],
+                status_code,
+                (time.perf_counter() - start_time) * 1000,
+            )
@@ -0,0 +1,53 @@
+import logging
+from contextvars import ContextVar
+from typing import Optional
+
+from sqlalchemy import event
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+from app.core.database import engine
+
+logger = logging.getLogger(__name__)
+
+# Requests issuing more statements than this are logged as likely N+1
+QUERY_COUNT_WARN_THRESHOLD = 20
+
+# Per-request counter; SQLAlchemy's greenlet bridge carries the
+# request's context into the cursor event
+_query_count: ContextVar[Optional[list]] = ContextVar("query_count", default=None)
+
+
+def _count_query(conn, cursor, statement, parameters, context, executemany):
+    counter = _query_count.get()
+    if counter is not None:
+        counter[0] += 1
+
+
+class QueryCountMiddleware:
+    """
+    Development-only N+1 detector: counts SQL statements per request
+    and warns when a request crosses QUERY_COUNT_WARN_THRESHOLD
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+        if not event.contains(engine.sync_engine, "before_cursor_execute", _count_query):
+            event.listen(engine.sync_engine, "before_cursor_execute", _count_query)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] != "http":
+            return await self.app(scope, receive, send)
+
+        counter = [0]
+        token = _query_count.set(counter)
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            _query_count.reset(token)
+
+            if counter[0] > QUERY_COUNT_WARN_THRESHOLD:
+                logger.warning(
+                    "%s %s issued %d SQL statements (possible N+1)",
+                    scope["method"], scope["path"], counter[0]
+                )
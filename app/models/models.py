@@ -1,13 +1,17 @@
-from datetime import datetime
 from sqlalchemy import (
-    Column, Integer, String, Text, Boolean, DateTime, Float, 
+    Column, Integer, String, Text, Boolean, DateTime, Numeric, Enum,
     ForeignKey, UniqueConstraint, Index, JSON, Date, Time,
-    CheckConstraint
+    CheckConstraint, func
 )
 from sqlalchemy.orm import relationship, declarative_base
 
 Base = declarative_base()
 
+# Exact fixed-point storage for scores (stable ranking order, 3–4 bytes
+# instead of FLOAT); asdecimal=False keeps Python/JSON values as float
+PERCENT = Numeric(5, 2, asdecimal=False)     # 0.00 – 100.00
+SCORE = Numeric(8, 2, asdecimal=False)
+
 # =========================================================
 # 1. ROLES (Simple Role Management)
 # =========================================================
@@ -35,7 +39,7 @@ class Role(Base):
     name = Column(String(50), nullable=False, unique=True)  # ADMIN, TEACHER, STUDENT, COLLEGE_ADMIN
     description = Column(Text, nullable=True)
     is_active = Column(Boolean, default=True, nullable=False)
-    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+    created_at = Column(DateTime, default=func.utc_timestamp(), nullable=False)
 
     users = relationship("User", back_populates="role")
     permissions = relationship(
@@ -72,7 +76,7 @@ class Permission(Base):
     role_id = Column(Integer, ForeignKey("roles.id", ondelete="CASCADE"), nullable=False)
     action = Column(String(50), nullable=False)  # view, create, edit, delete, approve
     resource = Column(String(50), nullable=False)  # courses, tests, students, colleges
-    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+    created_at = Column(DateTime, default=func.utc_timestamp(), nullable=False)
 
     role = relationship("Role", back_populates="permissions")
 
@@ -118,10 +122,9 @@ class User(Base):
     """
     __tablename__ = "users"
     __table_args__ = (
-        UniqueConstraint('email', name='uq_user_email'),
-        Index('idx_email', 'email'),
-        Index('idx_role_id', 'role_id'),
-        Index('idx_is_active', 'is_active'),
+        UniqueConstraint('email', name='uq_user_email'),   # also serves email lookups
+        Index('idx_role_active', 'role_id', 'is_active'),
+        Index('idx_users_phone', 'phone'),   # phone side of the login OR
     )
 
     id = Column(Integer, primary_key=True, autoincrement=True)
@@ -129,23 +132,23 @@ class User(Base):
 
     # Authentication
     full_name = Column(String(200), nullable=False)
-    email = Column(String(150), nullable=False, unique=True)
+    email = Column(String(150), nullable=False)
     phone = Column(String(20), nullable=True)
-    password_hash = Column(String(512), nullable=False)  # bcrypt
+    password_hash = Column(String(128), nullable=False)  # bcrypt = 60, argon2id ≈ 97
 
     # Profile
     bio = Column(Text, nullable=True)
 
     # Status
-    is_active = Column(Boolean, default=True, nullable=False, index=True)
+    is_active = Column(Boolean, default=True, nullable=False)
     is_verified = Column(Boolean, default=False, nullable=False)
 
     # Activity
     last_login_at = Column(DateTime, nullable=True)
 
     # Timestamps
-    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
-    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False)
+    created_at = Column(DateTime, default=func.utc_timestamp(), nullable=False)
+    updated_at = Column(DateTime, default=func.utc_timestamp(), onupdate=func.utc_timestamp(), nullable=False)
 
     # Relationships
     role = relationship("Role", back_populates="users")
@@ -185,7 +188,7 @@ class PasswordReset(Base):
     reset_token = Column(String(500), nullable=False, unique=True)
     expires_at = Column(DateTime, nullable=False)
     is_used = Column(Boolean, default=False, nullable=False)
-    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+    created_at = Column(DateTime, default=func.utc_timestamp(), nullable=False)
 
     user = relationship("User")
 
@@ -205,17 +208,17 @@ class LoginHistory(Base):
     """
     __tablename__ = "login_history"
     __table_args__ = (
-        Index('idx_user_login_at', 'user_id', 'login_at'),
-        Index('idx_login_status', 'login_status'),
+        # "recent logins for user" answered from the index alone
+        Index('idx_user_login_at', 'user_id', 'login_at', 'login_status'),
     )
 
     id = Column(Integer, primary_key=True, autoincrement=True)
     user_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
     
-    login_status = Column(String(20), nullable=False)  # SUCCESS, FAILED, BLOCKED
+    login_status = Column(Enum("SUCCESS", "FAILED", "BLOCKED", name="login_status"), nullable=False)
     ip_address = Column(String(45), nullable=True)
     reason_if_failed = Column(String(200), nullable=True)
-    login_at = Column(DateTime, default=datetime.utcnow, nullable=False, index=True)
+    login_at = Column(DateTime, default=func.utc_timestamp(), nullable=False, index=True)
 
     user = relationship("User")
 
@@ -233,8 +236,6 @@ class College(Base):
     __tablename__ = "colleges"
     __table_args__ = (
         UniqueConstraint('code', name='uq_college_code'),
-        Index('idx_code', 'code'),
-        Index('idx_is_active', 'is_active'),
     )
 
     id = Column(Integer, primary_key=True, autoincrement=True)
@@ -255,11 +256,13 @@ class College(Base):
     country = Column(String(100), default="India", nullable=True)
 
     # Status
-    is_active = Column(Boolean, default=True, nullable=False, index=True)
+    is_active = Column(Boolean, default=True, nullable=False)
     established_year = Column(Integer, nullable=True)
 
-    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
-    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False)
+    # AdminCollegeService.create_college stamps both from the app
+    # server's clock (skips the refresh SELECT); other inserts use SQL
+    created_at = Column(DateTime, default=func.utc_timestamp(), nullable=False)
+    updated_at = Column(DateTime, default=func.utc_timestamp(), onupdate=func.utc_timestamp(), nullable=False)
 
     # ✅ Relationships
     college_courses = relationship(
@@ -293,7 +296,7 @@ class CollegeBranch(Base):
     branch_code = Column(String(50), nullable=True)
     is_active = Column(Boolean, default=True, nullable=False)
 
-    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+    created_at = Column(DateTime, default=func.utc_timestamp(), nullable=False)
 
     college = relationship("College", back_populates="branches")
     students = relationship("Student", back_populates="branch")
@@ -318,7 +321,7 @@ class AcademicYear(Base):
     year_number = Column(Integer, nullable=True)  # 1, 2, 3 (for 1st, 2nd, 3rd year)
     is_active = Column(Boolean, default=True, nullable=False)
 
-    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+    created_at = Column(DateTime, default=func.utc_timestamp(), nullable=False)
 
     college = relationship("College", back_populates="academic_years")
     students = relationship("Student", back_populates="academic_year")
@@ -341,7 +344,7 @@ class CollegeAdmin(Base):
     user_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
 
     is_primary = Column(Boolean, default=False, nullable=False)
-    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+    created_at = Column(DateTime, default=func.utc_timestamp(), nullable=False)
 
     college = relationship("College", back_populates="admins")
     user = relationship("User", back_populates="college_admin")
@@ -366,9 +369,9 @@ class Student(Base):
     __table_args__ = (
         UniqueConstraint('user_id', name='uq_student_user'),
         UniqueConstraint('student_unique_id', name='uq_student_unique_id'),
-        Index('idx_college_id', 'college_id'),
+        # college → branch → year: list/filter/assign lookups (also backs college_id FK)
+        Index('idx_student_college_branch_year', 'college_id', 'branch_id', 'academic_year_id'),
         Index('idx_branch_id', 'branch_id'),
-        Index('idx_enrollment_status', 'enrollment_status'),
     )
 
     id = Column(Integer, primary_key=True, autoincrement=True)
@@ -384,16 +387,16 @@ class Student(Base):
     student_unique_id = Column(String(100), nullable=False, unique=True)
 
     # Status
-    enrollment_status = Column(String(20), default="ACTIVE", nullable=False)  # ACTIVE, INACTIVE, GRADUATED
+    enrollment_status = Column(Enum("ACTIVE", "INACTIVE", "GRADUATED", name="student_status"), default="ACTIVE", nullable=False)
 
     # Performance
-    total_crt_score = Column(Float, default=0.0, nullable=False)
+    total_crt_score = Column(SCORE, default=0.0, nullable=False)
     total_tests_completed = Column(Integer, default=0, nullable=False)
 
     # Timestamps
-    enrollment_date = Column(Date, default=datetime.now, nullable=False)
-    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
-    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False)
+    enrollment_date = Column(Date, default=func.curdate(), nullable=False)
+    created_at = Column(DateTime, default=func.utc_timestamp(), nullable=False)
+    updated_at = Column(DateTime, default=func.utc_timestamp(), onupdate=func.utc_timestamp(), nullable=False)
 
     # Relationships
     user = relationship("User", back_populates="student")
@@ -440,8 +443,8 @@ class Teacher(Base):
     # Status
     is_active = Column(Boolean, default=True, nullable=False)
 
-    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
-    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False)
+    created_at = Column(DateTime, default=func.utc_timestamp(), nullable=False)
+    updated_at = Column(DateTime, default=func.utc_timestamp(), onupdate=func.utc_timestamp(), nullable=False)
 
     user = relationship("User", back_populates="teacher")
     courses = relationship("Course", back_populates="teacher")
@@ -460,8 +463,6 @@ class Course(Base):
     __tablename__ = "courses"
     __table_args__ = (
         UniqueConstraint('course_code', name='uq_course_code'),
-        Index('idx_code', 'course_code'),
-        Index('idx_is_active', 'is_active'),
     )
 
     id = Column(Integer, primary_key=True, autoincrement=True)
@@ -479,7 +480,7 @@ class Course(Base):
 
     # Classification
     category = Column(String(100), nullable=True)
-    level = Column(String(20), default="BEGINNER", nullable=False)
+    level = Column(Enum("BEGINNER", "INTERMEDIATE", "ADVANCED", name="course_level"), default="BEGINNER", nullable=False)
 
     # Duration
     duration_hours = Column(Integer, nullable=True)
@@ -489,12 +490,14 @@ class Course(Base):
     thumbnail_url = Column(String(500), nullable=True)
 
     # Status
-    is_active = Column(Boolean, default=True, nullable=False, index=True)
+    is_active = Column(Boolean, default=True, nullable=False)
     is_published = Column(Boolean, default=False, nullable=False)
 
     # Timestamps
-    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
-    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False)
+    # AdminCourseService.create_course stamps both from the app
+    # server's clock (skips the refresh SELECT); other inserts use SQL
+    created_at = Column(DateTime, default=func.utc_timestamp(), nullable=False)
+    updated_at = Column(DateTime, default=func.utc_timestamp(), onupdate=func.utc_timestamp(), nullable=False)
 
     # ✅ Relationships
     college_courses = relationship(
@@ -521,9 +524,9 @@ class CollegeCourse(Base):
     __tablename__ = "college_courses"
     __table_args__ = (
         UniqueConstraint("college_id", "course_id", name="uq_college_course"),
-        Index("idx_college_id", "college_id"),
-        Index("idx_course_id", "course_id"),
-        Index("idx_is_active", "is_active"),
+        Index("idx_college_courses_course_id", "course_id"),
+        # college course lists: filter + join column read from the index
+        Index("idx_college_courses_college_active", "college_id", "is_active", "course_id"),
     )
 
     id = Column(Integer, primary_key=True, autoincrement=True)
@@ -544,7 +547,7 @@ class CollegeCourse(Base):
     is_active = Column(Boolean, default=True, nullable=False)
     is_published = Column(Boolean, default=False, nullable=False)
 
-    assigned_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+    assigned_at = Column(DateTime, default=func.utc_timestamp(), nullable=False)
 
     # Relationships
     college = relationship("College", back_populates="college_courses")
@@ -559,8 +562,9 @@ class CourseFile(Base):
   
     __tablename__ = "course_files"
     __table_args__ = (
-        Index('idx_course_id', 'course_id'),
         Index('idx_file_type', 'file_type'),
+        # list_course_pdfs: filter + ORDER BY served from one index
+        Index('idx_course_type_published_created', 'course_id', 'file_type', 'is_published', 'created_at'),
     )
 
     id = Column(Integer, primary_key=True, autoincrement=True)
@@ -572,7 +576,7 @@ class CourseFile(Base):
     file_description = Column(Text, nullable=True)
 
     # File Metadata
-    file_type = Column(String(20), nullable=False)  # PDF, VIDEO, DOCUMENT, IMAGE
+    file_type = Column(Enum("PDF", "VIDEO", "DOCUMENT", "IMAGE", name="file_type"), nullable=False)
     file_size = Column(Integer, nullable=True)  # in bytes
     mime_type = Column(String(100), nullable=True)
 
@@ -586,14 +590,18 @@ class CourseFile(Base):
     is_published = Column(Boolean, default=True, nullable=False)
     download_allowed = Column(Boolean, default=True, nullable=False)
 
+    # Direct-to-S3 uploads stay PENDING until the client commits them;
+    # server-side uploads are UPLOADING while the bytes stream to S3
+    upload_status = Column(Enum("PENDING", "UPLOADING", "UPLOADED", name="upload_status"), default="UPLOADED", server_default="UPLOADED", nullable=False)
+
     # Analytics (tracked via code)
     download_count = Column(Integer, default=0, nullable=False)
     view_count = Column(Integer, default=0, nullable=False)
 
     display_order = Column(Integer, default=0, nullable=False)
 
-    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
-    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False)
+    created_at = Column(DateTime, default=func.utc_timestamp(), nullable=False)
+    updated_at = Column(DateTime, default=func.utc_timestamp(), onupdate=func.utc_timestamp(), nullable=False)
 
     course = relationship("Course", back_populates="files")
 
@@ -611,8 +619,8 @@ class StudentCourse(Base):
     __tablename__ = "student_courses"
     __table_args__ = (
         UniqueConstraint('student_id', 'course_id', name='uq_student_course'),
-        Index('idx_student_id', 'student_id'),
-        Index('idx_course_id', 'course_id'),
+        Index('idx_student_courses_student_status', 'student_id', 'enrollment_status'),
+        Index('idx_student_courses_course_status', 'course_id', 'enrollment_status'),
         Index('idx_enrollment_status', 'enrollment_status'),
     )
 
@@ -621,10 +629,10 @@ class StudentCourse(Base):
     course_id = Column(Integer, ForeignKey("courses.id", ondelete="CASCADE"), nullable=False)
 
     # Status
-    enrollment_status = Column(String(20), default="ASSIGNED", nullable=False)  # ASSIGNED, IN_PROGRESS, COMPLETED, DROPPED
+    enrollment_status = Column(Enum("ASSIGNED", "IN_PROGRESS", "COMPLETED", "DROPPED", name="enrollment_status"), default="ASSIGNED", nullable=False)
 
     # Progress
-    progress_percentage = Column(Float, default=0.0, nullable=False)
+    progress_percentage = Column(PERCENT, default=0.0, nullable=False)
 
     # Time Tracking
     start_date = Column(DateTime, nullable=True)
@@ -632,10 +640,10 @@ class StudentCourse(Base):
     last_accessed_at = Column(DateTime, nullable=True)
 
     # Performance
-    course_score = Column(Float, nullable=True)
+    course_score = Column(SCORE, nullable=True)
 
-    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
-    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False)
+    created_at = Column(DateTime, default=func.utc_timestamp(), nullable=False)
+    updated_at = Column(DateTime, default=func.utc_timestamp(), onupdate=func.utc_timestamp(), nullable=False)
 
     student = relationship("Student", back_populates="course_enrollments")
     course = relationship("Course", back_populates="student_enrollments")
@@ -654,8 +662,7 @@ class Test(Base):
     __tablename__ = "tests"
     __table_args__ = (
         UniqueConstraint('test_code', name='uq_test_code'),
-        Index('idx_course_id', 'course_id'),
-        Index('idx_is_published', 'is_published'),
+        Index('idx_tests_course_published', 'course_id', 'is_published'),
     )
 
     id = Column(Integer, primary_key=True, autoincrement=True)
@@ -673,8 +680,8 @@ class Test(Base):
     total_questions = Column(Integer, nullable=False, default=1)
 
     # Test Type
-    test_type = Column(String(20), default="PRACTICE", nullable=False)  # QUIZ, MID_TERM, FINAL, PRACTICE
-    difficulty_level = Column(String(20), default="MEDIUM", nullable=False)  # EASY, MEDIUM, HARD
+    test_type = Column(Enum("QUIZ", "MID_TERM", "FINAL", "PRACTICE", name="test_type"), default="PRACTICE", nullable=False)
+    difficulty_level = Column(Enum("EASY", "MEDIUM", "HARD", name="difficulty_level"), default="MEDIUM", nullable=False)
 
     # Scheduling
     scheduled_date = Column(Date, nullable=True)
@@ -683,7 +690,7 @@ class Test(Base):
     available_until = Column(DateTime, nullable=True)
 
     # Status
-    is_published = Column(Boolean, default=False, nullable=False, index=True)
+    is_published = Column(Boolean, default=False, nullable=False)
 
     # Settings
     instructions = Column(Text, nullable=True)
@@ -691,8 +698,8 @@ class Test(Base):
     allow_retake = Column(Boolean, default=True, nullable=False)
     max_retakes = Column(Integer, default=3, nullable=False)
 
-    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
-    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False)
+    created_at = Column(DateTime, default=func.utc_timestamp(), nullable=False)
+    updated_at = Column(DateTime, default=func.utc_timestamp(), onupdate=func.utc_timestamp(), nullable=False)
 
     course = relationship("Course", back_populates="tests")
     attempts = relationship("TestAttempt", back_populates="test", cascade="all, delete-orphan")
@@ -707,9 +714,11 @@ class TestAttempt(Base):
     """
     __tablename__ = "test_attempts"
     __table_args__ = (
-        Index('idx_student_id', 'student_id'),
         Index('idx_test_id', 'test_id'),
-        Index('idx_student_test', 'student_id', 'test_id'),
+        # latest attempt per (student, test) straight off the index
+        Index('idx_student_test_attempt', 'student_id', 'test_id', 'attempt_number'),
+        # dashboard attempted / passed counts: index-only per student
+        Index('idx_attempts_student_passed', 'student_id', 'is_passed'),
         Index('idx_attempt_status', 'attempt_status'),
         CheckConstraint('attempt_number >= 1', name='ck_attempt_positive'),
     )
@@ -722,8 +731,8 @@ class TestAttempt(Base):
     attempt_number = Column(Integer, default=1, nullable=False)
 
     # Performance
-    marks_obtained = Column(Float, nullable=True)
-    percentage = Column(Float, nullable=True)
+    marks_obtained = Column(SCORE, nullable=True)
+    percentage = Column(PERCENT, nullable=True)
     is_passed = Column(Boolean, nullable=True)
 
     # Timing
@@ -732,13 +741,13 @@ class TestAttempt(Base):
     time_taken_seconds = Column(Integer, nullable=True)
 
     # Status
-    attempt_status = Column(String(20), default="STARTED", nullable=False)  # STARTED, IN_PROGRESS, SUBMITTED, EVALUATED
+    attempt_status = Column(Enum("STARTED", "IN_PROGRESS", "SUBMITTED", "EVALUATED", name="attempt_status"), default="STARTED", nullable=False)
 
     # Feedback
     feedback = Column(Text, nullable=True)
 
-    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
-    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False)
+    created_at = Column(DateTime, default=func.utc_timestamp(), nullable=False)
+    updated_at = Column(DateTime, default=func.utc_timestamp(), onupdate=func.utc_timestamp(), nullable=False)
 
     student = relationship("Student", back_populates="test_attempts")
     test = relationship("Test", back_populates="attempts")
@@ -755,30 +764,27 @@ class StudentScore(Base):
     Aggregate student performance scores
     """
     __tablename__ = "student_scores"
-    __table_args__ = (
-        Index('idx_student_id', 'student_id'),
-    )
 
     id = Column(Integer, primary_key=True, autoincrement=True)
     student_id = Column(Integer, ForeignKey("students.id", ondelete="CASCADE"), nullable=False, unique=True)
 
     # Overall Performance
-    total_crt_score = Column(Float, default=0.0, nullable=False)
+    total_crt_score = Column(SCORE, default=0.0, nullable=False)
 
     # Test Performance
     total_tests_attempted = Column(Integer, default=0, nullable=False)
     total_tests_passed = Column(Integer, default=0, nullable=False)
-    average_test_score = Column(Float, default=0.0, nullable=False)
+    average_test_score = Column(SCORE, default=0.0, nullable=False)
 
     # Course Performance
     total_courses_assigned = Column(Integer, default=0, nullable=False)
     total_courses_completed = Column(Integer, default=0, nullable=False)
 
     # Overall Percentage
-    overall_percentage = Column(Float, default=0.0, nullable=False)
+    overall_percentage = Column(PERCENT, default=0.0, nullable=False)
 
-    calculated_at = Column(DateTime, default=datetime.utcnow, nullable=False)
-    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False)
+    calculated_at = Column(DateTime, default=func.utc_timestamp(), nullable=False)
+    updated_at = Column(DateTime, default=func.utc_timestamp(), onupdate=func.utc_timestamp(), nullable=False)
 
     student = relationship("Student", back_populates="scores")
 
@@ -796,9 +802,8 @@ class Ranking(Base):
     __tablename__ = "rankings"
     __table_args__ = (
         UniqueConstraint('student_id', 'ranking_type', 'academic_year_id', name='uq_ranking'),
-        Index('idx_student_id', 'student_id'),
-        Index('idx_college_id', 'college_id'),
-        Index('idx_rank_position', 'rank_position'),
+        # top-N per college/type: ORDER BY rank_position served by the index
+        Index('idx_rankings_college_type_position', 'college_id', 'ranking_type', 'rank_position'),
         CheckConstraint('rank_position >= 1', name='ck_rank_positive'),
     )
 
@@ -810,15 +815,15 @@ class Ranking(Base):
     academic_year_id = Column(Integer, ForeignKey("academic_years.id", ondelete="CASCADE"), nullable=True)
 
     # Ranking Details
-    ranking_type = Column(String(20), nullable=False)  # COLLEGE_OVERALL, BRANCH_OVERALL
+    ranking_type = Column(Enum("COLLEGE_OVERALL", "BRANCH_OVERALL", name="ranking_type"), nullable=False)
     rank_position = Column(Integer, nullable=False, index=True)
     total_students_ranked = Column(Integer, nullable=False)
-    percentile_rank = Column(Float, nullable=True)
+    percentile_rank = Column(PERCENT, nullable=True)
 
     # Performance Snapshot
-    score_at_ranking = Column(Float, nullable=False)
+    score_at_ranking = Column(SCORE, nullable=False)
 
-    calculated_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+    calculated_at = Column(DateTime, default=func.utc_timestamp(), nullable=False)
 
     student = relationship("Student")
 
@@ -835,8 +840,7 @@ class Notification(Base):
     """
     __tablename__ = "notifications"
     __table_args__ = (
-        Index('idx_user_id', 'user_id'),
-        Index('idx_is_read', 'is_read'),
+        Index('idx_notifications_user_read_created', 'user_id', 'is_read', 'created_at'),
     )
 
     id = Column(Integer, primary_key=True, autoincrement=True)
@@ -848,13 +852,13 @@ class Notification(Base):
     notification_type = Column(String(50), nullable=False)  # COURSE_ASSIGNED, TEST_PUBLISHED, SCORE_UPDATED, etc.
 
     # Status
-    is_read = Column(Boolean, default=False, nullable=False, index=True)
+    is_read = Column(Boolean, default=False, nullable=False)
     read_at = Column(DateTime, nullable=True)
 
     # Action
     action_url = Column(String(500), nullable=True)
 
-    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+    created_at = Column(DateTime, default=func.utc_timestamp(), nullable=False)
     expires_at = Column(DateTime, nullable=True)
 
     user = relationship("User", back_populates="notifications")
@@ -881,9 +885,11 @@ class AuditLog(Base):
     """
     __tablename__ = "audit_logs"
     __table_args__ = (
-        Index('idx_user_id', 'user_id'),
+        Index('idx_audit_logs_user_id', 'user_id'),
         Index('idx_action_type', 'action_type'),
-        Index('idx_created_at', 'created_at'),
+        Index('idx_audit_logs_entity', 'entity_type', 'entity_id', 'created_at'),
+        # append-only, rarely read: compressed pages shrink the JSON diffs
+        {'mysql_row_format': 'COMPRESSED'},
     )
 
     id = Column(Integer, primary_key=True, autoincrement=True)
@@ -902,9 +908,9 @@ class AuditLog(Base):
     new_values = Column(JSON, nullable=True)
 
     # Status
-    status = Column(String(20), default="SUCCESS", nullable=False)  # SUCCESS, FAILURE
+    status = Column(Enum("SUCCESS", "FAILURE", name="audit_status"), default="SUCCESS", nullable=False)
 
-    created_at = Column(DateTime, default=datetime.utcnow, nullable=False, index=True)
+    created_at = Column(DateTime, default=func.utc_timestamp(), nullable=False, index=True)
 
     user = relationship("User")
 
@@ -917,7 +923,11 @@ class AuditLog(Base):
 # =========================================================
 
 def init_database(engine):
-    """Initialize database - create all tables"""
+    """Initialize database - create all tables
+
+    Only missing tables are created; existing tables are never altered.
+    Column changes on an existing database: migrations/sql/*.sql
+    """
     Base.metadata.create_all(bind=engine)
     print("✓ Database initialized")
 
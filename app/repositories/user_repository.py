@@ -1,9 +1,33 @@
-from sqlalchemy import select, or_
+import logging
+
+from sqlalchemy import select, or_, lambda_stmt
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
+from sqlalchemy.orm import joinedload, raiseload
 
+from app.core.database import AsyncSessionLocal
 from app.models.models import User, Role
 
+logger = logging.getLogger(__name__)
+
+# role name → id, preloaded at startup / filled on first use
+# (roles are seeded, never renamed)
+_role_ids: dict[str, int] = {}
+
+
+async def preload_role_ids() -> None:
+    """
+    Load every role id in one query at startup. Failures only log:
+    get_role_id() still resolves lazily.
+    """
+    try:
+        async with AsyncSessionLocal() as db:
+            rows = (await db.execute(select(Role.name, Role.id))).all()
+    except Exception as exc:
+        logger.warning("Role id preload failed (%s)", exc)
+        return
+
+    _role_ids.update(rows)
+
 
 class UserRepository:
     """
@@ -13,19 +37,21 @@ class UserRepository:
     # -------------------------------------------------
     # BASIC FETCH
     # -------------------------------------------------
+    # lambda_stmt: each statement is built + cache-keyed once; per call
+    # only the closure values (user_id / email / ...) are re-bound.
     async def get_by_id(self, db: AsyncSession, user_id: int):
-        stmt = (
-            select(User)
-            .options(selectinload(User.role))
+        stmt = lambda_stmt(
+            lambda: select(User)
+            .options(joinedload(User.role), raiseload("*"))
             .where(User.id == user_id)
         )
         result = await db.execute(stmt)
         return result.scalar_one_or_none()
 
     async def get_by_email(self, db: AsyncSession, email: str):
-        stmt = (
-            select(User)
-            .options(selectinload(User.role))
+        stmt = lambda_stmt(
+            lambda: select(User)
+            .options(joinedload(User.role), raiseload("*"))
             .where(User.email == email)
         )
         result = await db.execute(stmt)
@@ -44,13 +70,16 @@ class UserRepository:
         Fetch user by identifier + role.
         Identifier = email / phone (future-proof)
         """
+        role_id = await self.get_role_id(db, role_name)
+        if role_id is None:
+            return None
 
-        stmt = (
-            select(User)
-            .join(Role, User.role_id == Role.id)
-            .options(selectinload(User.role))
+        # one round-trip: role comes back in the same row
+        stmt = lambda_stmt(
+            lambda: select(User)
+            .options(joinedload(User.role), raiseload("*"))
             .where(
-                Role.name == role_name,
+                User.role_id == role_id,
                 or_(
                     User.email == identifier,
                     User.phone == identifier
@@ -72,3 +101,17 @@ class UserRepository:
         stmt = select(Role).where(Role.name == role_name)
         result = await db.execute(stmt)
         return result.scalar_one_or_none()
+
+    async def get_role_id(
+        self,
+        db: AsyncSession,
+        role_name: str
+    ):
+        role_id = _role_ids.get(role_name)
+        if role_id is None:
+            role_id = await db.scalar(
+                select(Role.id).where(Role.name == role_name)
+            )
+            if role_id is not None:
+                _role_ids[role_name] = role_id
+        return role_id
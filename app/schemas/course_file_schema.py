@@ -1,4 +1,5 @@
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
+from typing import Optional
 from datetime import datetime
 
 
@@ -11,3 +12,23 @@ class CourseFileResponse(BaseModel):
 
     class Config:
         from_attributes = True
+
+
+# -------------------------------------------------
+# DIRECT-TO-S3 UPLOAD (PRESIGNED PUT)
+# -------------------------------------------------
+class CourseFileUploadInitiate(BaseModel):
+    file_name: str = Field(..., max_length=255)
+    content_type: str = Field(..., max_length=100)
+    file_size: Optional[int] = None
+
+    file_title: Optional[str] = Field(None, max_length=200)
+    file_description: Optional[str] = None
+    duration_seconds: Optional[int] = None
+
+
+class CourseFileUploadTicket(BaseModel):
+    file_id: int
+    upload_url: str             # PUT the bytes here
+    upload_headers: dict[str, str]
+    expires_in: int             # seconds
@@ -1,9 +1,13 @@
+from datetime import datetime, timezone
+
 from sqlalchemy import select
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 from fastapi import HTTPException, status
 
+from app.core.database import MYSQL_DUP_ENTRY
 from app.models.models import College
-from app.schemas.college_schema import CollegeCreate, CollegeUpdate
+from app.schemas.college_schema import CollegeCreate, CollegeUpdate, CollegeResponse
 
 
 class AdminCollegeService:
@@ -21,15 +25,10 @@ class AdminCollegeService:
         db: AsyncSession,
         payload: CollegeCreate
     ) -> College:
-        # Prevent duplicate college code
-        existing = await db.scalar(
-            select(College).where(College.code == payload.code)
-        )
-        if existing:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail="College with this code already exists"
-            )
+        # timestamps set here (not by the SQL default) so nothing is
+        # expired by the INSERT and no refresh SELECT is needed;
+        # naive UTC, the same form UTC_TIMESTAMP() stores
+        now = datetime.now(timezone.utc).replace(tzinfo=None)
 
         college = College(
             name=payload.name,
@@ -43,11 +42,23 @@ class AdminCollegeService:
             country=payload.country,
             established_year=payload.established_year,
             is_active=True,
+            created_at=now,
+            updated_at=now,
         )
 
         db.add(college)
-        await db.commit()
-        await db.refresh(college)
+
+        # Duplicate code → rejected by the unique key (no pre-check race)
+        try:
+            await db.commit()
+        except IntegrityError as exc:
+            await db.rollback()
+            if exc.orig.args[0] != MYSQL_DUP_ENTRY:
+                raise
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="College with this code already exists"
+            )
 
         return college
 
@@ -57,13 +68,17 @@ class AdminCollegeService:
     async def list_colleges(
         self,
         db: AsyncSession
-    ) -> list[College]:
+    ) -> list[dict]:
+        """
+        Active colleges as plain dicts with exactly the CollegeResponse
+        fields – the route serves them as-is (response_model=None)
+        """
         result = await db.execute(
-            select(College)
+            select(*(getattr(College, f) for f in CollegeResponse.model_fields))
             .where(College.is_active.is_(True))
             .order_by(College.created_at.desc())
         )
-        return result.scalars().all()
+        return [dict(r._mapping) for r in result]
 
     # -------------------------------------------------
     # GET COLLEGE BY ID (ADMIN – ACTIVE / INACTIVE)
@@ -1,9 +1,38 @@
+import asyncio
+from datetime import datetime, timedelta
+
 from fastapi import UploadFile, HTTPException
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
+from sqlalchemy import select, update, delete
 
 from app.models.models import Course, CourseFile
-from app.core.s3 import upload_file_to_s3
+from app.core.s3 import (
+    upload_file_to_s3,
+    new_s3_key,
+    s3_url_for_key,
+    delete_s3_object,
+    presign_put,
+    s3_object_size,
+    s3_key_from_url,
+)
+from app.schemas.course_file_schema import (
+    CourseFileResponse,
+    CourseFileUploadInitiate,
+)
+
+
+# Presigned PUT lifetime; the commit call must follow within it
+UPLOAD_URL_EXPIRES = 900    # seconds
+
+
+def _file_type(content_type: str | None) -> str:
+    content_type = content_type or ""
+
+    if content_type == "application/pdf":
+        return "PDF"
+    if content_type.startswith("video/"):
+        return "VIDEO"
+    return "DOCUMENT"
 
 
 class AdminCourseFileService:
@@ -23,42 +52,23 @@ class AdminCourseFileService:
         # --------------------------------------------------
         # 1️⃣ Validate course
         # --------------------------------------------------
-        result = await db.execute(
-            select(Course).where(Course.id == course_id)
+        course_exists = await db.scalar(
+            select(Course.id).where(Course.id == course_id)
         )
-        course = result.scalar_one_or_none()
 
-        if not course:
+        if not course_exists:
             raise HTTPException(status_code=404, detail="Course not found")
 
         # --------------------------------------------------
-        # 2️⃣ Upload file to S3
-        # --------------------------------------------------
-        s3_result = await upload_file_to_s3(
-            file=file,
-            folder=f"Courses/{course_id}",
-        )
-
-        # --------------------------------------------------
-        # 3️⃣ Detect file type
+        # 2️⃣ Detect file type
         # --------------------------------------------------
-        content_type = file.content_type or ""
-
-        if content_type == "application/pdf":
-            file_type = "PDF"
-        elif content_type.startswith("video/"):
-            file_type = "VIDEO"
-        else:
-            file_type = "DOCUMENT"
+        file_type = _file_type(file.content_type)
 
         # --------------------------------------------------
-        # 4️⃣ Update course thumbnail URL
+        # 3️⃣ Build course file record (key → URL known up front)
         # --------------------------------------------------
-        course.thumbnail_url = s3_result["file_url"]
+        s3_key = new_s3_key(f"Courses/{course_id}", file.filename)
 
-        # --------------------------------------------------
-        # 5️⃣ Save course file record
-        # --------------------------------------------------
         course_file = CourseFile(
             course_id=course_id,
             file_name=file.filename,
@@ -66,25 +76,214 @@ class AdminCourseFileService:
             file_description=file_description,
             duration_seconds=duration_seconds,
             file_type=file_type,
-            file_size=s3_result["file_size"],
-            mime_type=s3_result["content_type"],
-            file_url=s3_result["file_url"],
-            is_published=True,
+            file_size=file.size,
+            mime_type=file.content_type,
+            file_url=s3_url_for_key(s3_key),
+            # hidden until the S3 object exists (see 5️⃣); UPLOADING, not
+            # PENDING, so reap_stale_uploads leaves a long upload alone
+            is_published=False,
             download_allowed=True,
+            upload_status="UPLOADING",
         )
 
-        db.add(course_file)
+        # --------------------------------------------------
+        # 4️⃣ Upload to S3 and save the record concurrently
+        # --------------------------------------------------
+        async def save_record():
+            db.add(course_file)
+            await db.commit()
+
+        # return_exceptions → both sides have finished before cleanup
+        s3_result, saved = await asyncio.gather(
+            upload_file_to_s3(
+                file=file,
+                folder=f"Courses/{course_id}",
+                key=s3_key,
+            ),
+            save_record(),
+            return_exceptions=True,
+        )
+
+        if isinstance(saved, BaseException):
+            await db.rollback()
+            if not isinstance(s3_result, BaseException):
+                await delete_s3_object(s3_key)
+            raise saved
+
+        if isinstance(s3_result, BaseException):
+            # drop the row pointing at a file that never landed
+            await db.execute(
+                delete(CourseFile).where(CourseFile.id == course_file.id)
+            )
+            await db.commit()
+            raise s3_result
 
         # --------------------------------------------------
-        # 6️⃣ Commit transaction
+        # 5️⃣ Publish + update course thumbnail URL in one commit
+        #    (only once the file exists)
         # --------------------------------------------------
+        await db.execute(
+            update(Course)
+            .where(Course.id == course_id)
+            .values(thumbnail_url=s3_result["file_url"])
+        )
+
+        # size as actually read while uploading
+        course_file.file_size = s3_result["file_size"]
+        course_file.upload_status = "UPLOADED"
+        course_file.is_published = True
+
         await db.commit()
 
+        # created_at is a SQL default
         await db.refresh(course_file)
-        await db.refresh(course)
 
         return course_file
 
+    # --------------------------------------------------
+    # DIRECT UPLOAD – STEP 1: PRESIGNED PUT
+    # --------------------------------------------------
+    async def initiate_course_file_upload(
+        self,
+        db: AsyncSession,
+        course_id: int,
+        payload: CourseFileUploadInitiate,
+    ) -> dict:
+        course_exists = await db.scalar(
+            select(Course.id).where(Course.id == course_id)
+        )
+
+        if not course_exists:
+            raise HTTPException(status_code=404, detail="Course not found")
+
+        # opportunistic cleanup: uploads are initiated rarely enough
+        await self.reap_stale_uploads(db)
+
+        s3_key = new_s3_key(f"Courses/{course_id}", payload.file_name)
+
+        # Hidden (unpublished + PENDING) until the upload is committed
+        course_file = CourseFile(
+            course_id=course_id,
+            file_name=payload.file_name,
+            file_title=payload.file_title or payload.file_name,
+            file_description=payload.file_description,
+            duration_seconds=payload.duration_seconds,
+            file_type=_file_type(payload.content_type),
+            file_size=payload.file_size,
+            mime_type=payload.content_type,
+            file_url=s3_url_for_key(s3_key),
+            is_published=False,
+            download_allowed=True,
+            upload_status="PENDING",
+        )
+
+        db.add(course_file)
+        await db.commit()
+
+        return {
+            "file_id": course_file.id,
+            "upload_url": presign_put(
+                s3_key, payload.content_type, expires=UPLOAD_URL_EXPIRES
+            ),
+            "upload_headers": {"Content-Type": payload.content_type},
+            "expires_in": UPLOAD_URL_EXPIRES,
+        }
+
+    # --------------------------------------------------
+    # DIRECT UPLOAD – STEP 2: COMMIT
+    # --------------------------------------------------
+    async def commit_course_file_upload(
+        self,
+        db: AsyncSession,
+        course_id: int,
+        file_id: int,
+    ):
+        course_file = await db.scalar(
+            select(CourseFile).where(
+                CourseFile.id == file_id,
+                CourseFile.course_id == course_id,
+            )
+        )
+
+        if not course_file:
+            raise HTTPException(status_code=404, detail="Course file not found")
+
+        # repeated commit → same answer
+        if course_file.upload_status == "UPLOADED":
+            return course_file
+
+        # server-side upload still streaming: nothing to commit
+        if course_file.upload_status != "PENDING":
+            raise HTTPException(
+                status_code=409,
+                detail="File is still being uploaded"
+            )
+
+        file_size = await s3_object_size(s3_key_from_url(course_file.file_url))
+
+        if file_size is None:
+            raise HTTPException(
+                status_code=409,
+                detail="File has not been uploaded yet"
+            )
+
+        course_file.file_size = file_size
+        course_file.upload_status = "UPLOADED"
+        course_file.is_published = True
+
+        await db.execute(
+            update(Course)
+            .where(Course.id == course_id)
+            .values(thumbnail_url=course_file.file_url)
+        )
+
+        await db.commit()
+
+        return course_file
+
+    # --------------------------------------------------
+    # REAP ABANDONED UPLOADS
+    # --------------------------------------------------
+    async def reap_stale_uploads(self, db: AsyncSession) -> int:
+        """
+        Delete direct-upload (PENDING) rows older than UPLOAD_URL_EXPIRES –
+        their PUT URL is dead, so they can never be committed – plus any
+        object that did land in S3 for them. Server-side uploads are
+        UPLOADING while they stream and are never reaped.
+        """
+        # created_at is written by UTC_TIMESTAMP() → naive UTC
+        cutoff = datetime.utcnow() - timedelta(seconds=UPLOAD_URL_EXPIRES)
+        stale_filter = (
+            CourseFile.upload_status == "PENDING",
+            CourseFile.created_at < cutoff,
+        )
+
+        stale = (
+            await db.execute(
+                select(CourseFile.id, CourseFile.file_url).where(*stale_filter)
+            )
+        ).all()
+
+        if not stale:
+            return 0
+
+        # re-check the filter: a row committed meanwhile is kept
+        await db.execute(
+            delete(CourseFile).where(
+                CourseFile.id.in_([row.id for row in stale]),
+                *stale_filter,
+            )
+        )
+        await db.commit()
+
+        # best effort – a missing object is fine
+        await asyncio.gather(
+            *(delete_s3_object(s3_key_from_url(row.file_url)) for row in stale),
+            return_exceptions=True,
+        )
+
+        return len(stale)
+
     # --------------------------------------------------
     # LIST COURSE FILES
     # --------------------------------------------------
@@ -92,10 +291,17 @@ class AdminCourseFileService:
         self,
         db: AsyncSession,
         course_id: int,
-    ):
+    ) -> list[dict]:
+        """
+        Uploaded files of a course as plain dicts with exactly the
+        CourseFileResponse fields – served as-is (response_model=None)
+        """
         result = await db.execute(
-            select(CourseFile)
-            .where(CourseFile.course_id == course_id)
+            select(*(getattr(CourseFile, f) for f in CourseFileResponse.model_fields))
+            .where(
+                CourseFile.course_id == course_id,
+                CourseFile.upload_status == "UPLOADED",
+            )
             .order_by(CourseFile.created_at.desc())
         )
-        return result.scalars().all()
+        return [dict(r._mapping) for r in result]
@@ -1,9 +1,13 @@
+from datetime import datetime, timezone
+
 from sqlalchemy import select
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 from fastapi import HTTPException, status
 
+from app.core.database import MYSQL_DUP_ENTRY
 from app.models.models import Course
-from app.schemas.course_schema import CourseCreate, CourseUpdate
+from app.schemas.course_schema import CourseCreate, CourseUpdate, CourseResponse
 
 
 class AdminCourseService:
@@ -20,15 +24,10 @@ class AdminCourseService:
         payload: CourseCreate
     ) -> Course:
 
-        # Optional: prevent duplicate course code
-        existing = await db.scalar(
-            select(Course).where(Course.course_code == payload.course_code)
-        )
-        if existing:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail="Course with this course_code already exists"
-            )
+        # timestamps set here (not by the SQL default) so nothing is
+        # expired by the INSERT and no refresh SELECT is needed;
+        # naive UTC, the same form UTC_TIMESTAMP() stores
+        now = datetime.now(timezone.utc).replace(tzinfo=None)
 
         course = Course(
             teacher_id=payload.teacher_id,
@@ -43,24 +42,40 @@ class AdminCourseService:
 
             # ✅ CONTROLLED INTERNALLY
             is_active=True,
-            is_published=False
+            is_published=False,
+            created_at=now,
+            updated_at=now
         )
 
         db.add(course)
-        await db.commit()
-        await db.refresh(course)
+
+        # Duplicate course_code → rejected by the unique key (no pre-check race)
+        try:
+            await db.commit()
+        except IntegrityError as exc:
+            await db.rollback()
+            if exc.orig.args[0] != MYSQL_DUP_ENTRY:
+                raise
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Course with this course_code already exists"
+            )
         return course
 
     # -------------------------------------------------
     # LIST COURSES
     # -------------------------------------------------
-    async def list_courses(self, db: AsyncSession):
+    async def list_courses(self, db: AsyncSession) -> list[dict]:
+        """
+        Active courses as plain dicts with exactly the CourseResponse
+        fields – the route serves them as-is (response_model=None)
+        """
         result = await db.execute(
-            select(Course)
+            select(*(getattr(Course, f) for f in CourseResponse.model_fields))
             .where(Course.is_active == True)
             .order_by(Course.created_at.desc())
         )
-        return result.scalars().all()
+        return [dict(r._mapping) for r in result]
 
     # -------------------------------------------------
     # GET COURSE
@@ -1,7 +1,11 @@
+import asyncio
+
 from fastapi import HTTPException, status
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, func
+from sqlalchemy import select, func, Float
 
+from app.core.database import in_own_session
+from app.core.auth_user import AuthUser
 from app.models.models import (
     College,
     CollegeAdmin,
@@ -16,6 +20,13 @@ from app.models.models import (
 )
 
 
+def _avg2(column):
+    """
+    ROUND(COALESCE(AVG(column), 0), 2) as a float – ready to serialize
+    """
+    return func.round(func.coalesce(func.avg(column), 0), 2, type_=Float)
+
+
 class DashboardService:
     """
     Handles BOTH:
@@ -28,35 +39,68 @@ class DashboardService:
     # =====================================================
     async def get_admin_dashboard(self, db: AsyncSession):
 
-        total_colleges = await db.scalar(
-            select(func.count(College.id))
-        ) or 0
+        # Independent sections → one pooled connection each, run
+        # concurrently (an AsyncSession cannot run queries in parallel)
+        overview, rankings, course_rows = await asyncio.gather(
+            self._admin_overview(db),
+            in_own_session(self._college_rankings),
+            in_own_session(self._course_adoption_rows),
+        )
 
-        total_students = await db.scalar(
-            select(func.count(Student.id))
-        ) or 0
+        total_colleges = overview["total_colleges"]
 
-        avg_completion = await db.scalar(
-            select(func.avg(StudentCourse.progress_percentage))
-        ) or 0.0
+        course_adoption = []
+        for row in course_rows:
+            percent = (
+                (row.college_count / total_colleges) * 100
+                if total_colleges else 0
+            )
 
-        avg_score = await db.scalar(
-            select(func.avg(StudentCourse.course_score))
-        ) or 0.0
+            course_adoption.append({
+                "course": row.course,
+                "adoption_percent": round(percent),
+                "adopted_by": f"{row.college_count} of {total_colleges} colleges",
+            })
 
-        overview = {
-            "total_colleges": total_colleges,
-            "total_students": total_students,
-            "avg_completion": round(avg_completion, 2),
-            "avg_score": round(avg_score, 2),
+        return {
+            "overview": overview,
+            "rankings": rankings,
+            "course_adoption": course_adoption,
         }
 
-        # ---------------- RANKINGS ----------------
+    # ---------------- OVERVIEW ----------------
+    async def _admin_overview(self, db: AsyncSession) -> dict:
+
+        # one round-trip: the two counts ride along as scalar subqueries
+        # next to the StudentCourse averages (aggregates always yield a row)
+        row = (
+            await db.execute(
+                select(
+                    select(func.count(College.id))
+                    .scalar_subquery().label("total_colleges"),
+                    select(func.count(Student.id))
+                    .scalar_subquery().label("total_students"),
+                    _avg2(StudentCourse.progress_percentage).label("avg_completion"),
+                    _avg2(StudentCourse.course_score).label("avg_score"),
+                )
+            )
+        ).one()
+
+        return {
+            "total_colleges": row.total_colleges,
+            "total_students": row.total_students,
+            "avg_completion": row.avg_completion,
+            "avg_score": row.avg_score,
+        }
+
+    # ---------------- RANKINGS ----------------
+    async def _college_rankings(self, db: AsyncSession) -> list[dict]:
+
         ranking_stmt = (
             select(
                 College.name.label("college"),
-                func.avg(StudentCourse.progress_percentage).label("completion"),
-                func.avg(StudentCourse.course_score).label("points"),
+                _avg2(StudentCourse.progress_percentage).label("completion"),
+                _avg2(StudentCourse.course_score).label("points"),
             )
             .join(Student, Student.college_id == College.id)
             .join(StudentCourse, StudentCourse.student_id == Student.id)
@@ -66,80 +110,68 @@ class DashboardService:
 
         ranking_rows = await db.execute(ranking_stmt)
 
-        rankings = []
-        for idx, row in enumerate(ranking_rows.all(), start=1):
-            rankings.append({
+        return [
+            {
                 "rank": idx,
                 "college": row.college,
-                "completion": round(row.completion or 0, 2),
-                "points": round(row.points or 0, 2),
-            })
+                "completion": row.completion,
+                "points": row.points,
+            }
+            for idx, row in enumerate(ranking_rows, start=1)
+        ]
 
-        # ---------------- COURSE ADOPTION ----------------
-        course_stmt = (
+    # ---------------- COURSE ADOPTION ----------------
+    async def _course_adoption_rows(self, db: AsyncSession):
+
+        # distinct (course, college) pairs first, then a plain COUNT per
+        # course – no per-group DISTINCT, and no join to colleges needed
+        adoption = (
             select(
-                Course.title.label("course"),
-                func.count(func.distinct(College.id)).label("college_count"),
+                StudentCourse.course_id,
+                Student.college_id,
             )
-            .join(StudentCourse, StudentCourse.course_id == Course.id)
             .join(Student, Student.id == StudentCourse.student_id)
-            .join(College, College.id == Student.college_id)
-            .group_by(Course.id)
+            .distinct()
+            .subquery()
         )
 
-        course_rows = await db.execute(course_stmt)
-
-        course_adoption = []
-        for row in course_rows.all():
-            percent = (
-                (row.college_count / total_colleges) * 100
-                if total_colleges else 0
+        course_stmt = (
+            select(
+                Course.title.label("course"),
+                func.count().label("college_count"),
             )
+            .join(adoption, adoption.c.course_id == Course.id)
+            .group_by(Course.id)
+        )
 
-            course_adoption.append({
-                "course": row.course,
-                "adoption_percent": round(percent),
-                "adopted_by": f"{row.college_count} of {total_colleges} colleges",
-            })
-
-        return {
-            "overview": overview,
-            "rankings": rankings,
-            "course_adoption": course_adoption,
-        }
+        return (await db.execute(course_stmt)).all()
 
     # =====================================================
     # COLLEGE ADMIN DASHBOARD
     # =====================================================
-    async def get_college_dashboard(self, db: AsyncSession, user: dict):
+    async def get_college_dashboard(self, db: AsyncSession, user: AuthUser):
 
-        if user.get("role") != "COLLEGE_ADMIN":
+        if user.role != "COLLEGE_ADMIN":
             raise HTTPException(
                 status_code=status.HTTP_403_FORBIDDEN,
                 detail="College admin access only",
             )
 
-        user_id = user.get("id")
-
-        college_admin = await db.scalar(
-            select(CollegeAdmin).where(CollegeAdmin.user_id == user_id)
-        )
+        # admin → college in one row (FK guarantees the college exists)
+        college = (
+            await db.execute(
+                select(College.id, College.name, College.city)
+                .join(CollegeAdmin, CollegeAdmin.college_id == College.id)
+                .where(CollegeAdmin.user_id == user.id)
+            )
+        ).first()
 
-        if not college_admin:
+        if not college:
             raise HTTPException(
                 status_code=status.HTTP_403_FORBIDDEN,
                 detail="College admin not mapped to any college",
             )
 
-        college_id = college_admin.college_id
-
-        college = await db.scalar(
-            select(College).where(College.id == college_id)
-        )
-
-        if not college:
-            raise HTTPException(status_code=404, detail="College not found")
-
         return {
             "college_info": {
                 "college_id": college.id,
@@ -1,10 +1,28 @@
 from fastapi import HTTPException, status
+from fastapi.concurrency import run_in_threadpool
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.repositories.user_repository import UserRepository
 from app.core.security import verify_password
 from app.core.jwt import create_access_token
 
+# role → JWT permissions (tuples: shared, never mutated; encode as arrays)
+_ROLE_PERMISSIONS: dict[str, tuple[str, ...]] = {
+    "ADMIN": ("admin:*",),
+    "COLLEGE_ADMIN": (
+        "view:college_dashboard",
+        "view:students",
+        "view:courses"
+    ),
+    "TEACHER": (
+        "view:courses",
+        "create:tests"
+    ),
+    "STUDENT": (
+        "view:student_dashboard",
+    ),
+}
+
 
 class AuthService:
     """
@@ -56,7 +74,11 @@ class AuthService:
         # -------------------------------------------------
         # 3️⃣ Verify password
         # -------------------------------------------------
-        if not verify_password(password, user.password_hash):
+        # bcrypt is pure CPU (~100ms+) → worker thread, loop stays free
+        # (anyio's default limiter caps concurrent hashing threads)
+        if not await run_in_threadpool(
+            verify_password, password, user.password_hash
+        ):
             raise HTTPException(
                 status_code=status.HTTP_401_UNAUTHORIZED,
                 detail="Invalid credentials"
@@ -70,31 +92,7 @@ class AuthService:
         # -------------------------------------------------
         # 5️⃣ Assign permissions by role
         # -------------------------------------------------
-        permissions: list[str]
-
-        if role_name == "ADMIN":
-            permissions = ["admin:*"]
-
-        elif role_name == "COLLEGE_ADMIN":
-            permissions = [
-                "view:college_dashboard",
-                "view:students",
-                "view:courses"
-            ]
-
-        elif role_name == "TEACHER":
-            permissions = [
-                "view:courses",
-                "create:tests"
-            ]
-
-        elif role_name == "STUDENT":
-            permissions = [
-                "view:student_dashboard"
-            ]
-
-        else:
-            permissions = []
+        permissions = _ROLE_PERMISSIONS.get(role_name, ())
 
         # -------------------------------------------------
         # 6️⃣ Create JWT access token
@@ -0,0 +1,25 @@
+from cachetools import TTLCache
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.models import CollegeAdmin
+
+# college admin user id → college id; short TTL so a re-mapped admin
+# is picked up quickly (unmapped admins are never cached)
+COLLEGE_ID_CACHE_TTL = 60   # seconds
+_college_ids: TTLCache = TTLCache(maxsize=1024, ttl=COLLEGE_ID_CACHE_TTL)
+
+
+async def resolve_college_id(db: AsyncSession, user_id: int) -> int | None:
+    """
+    College of a college admin (None when the admin is not mapped)
+    """
+    college_id = _college_ids.get(user_id)
+    if college_id is None:
+        college_id = await db.scalar(
+            select(CollegeAdmin.college_id)
+            .where(CollegeAdmin.user_id == user_id)
+        )
+        if college_id is not None:
+            _college_ids[user_id] = college_id
+    return college_id
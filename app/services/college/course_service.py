@@ -1,15 +1,16 @@
-from sqlalchemy import select, func
+from sqlalchemy import select, insert, exists, literal, func, case
 from sqlalchemy.ext.asyncio import AsyncSession
 from fastapi import HTTPException, status
 
+from app.core.auth_user import AuthUser
 from app.models.models import (
-    CollegeAdmin,
     Student,
     Course,
     StudentCourse,
     CollegeCourse
 )
 from app.schemas.enrollment_schema import CourseAssignRequest
+from app.services.college.admin_college import resolve_college_id
 
 
 class CollegeCourseService:
@@ -23,87 +24,82 @@ class CollegeCourseService:
     async def assign_course_to_students(
         self,
         db: AsyncSession,
-        college_admin_user: dict,
+        college_admin_user: AuthUser,
         payload: CourseAssignRequest
     ):
         # 1️⃣ Resolve college for admin
-        college_admin = (
-            await db.execute(
-                select(CollegeAdmin)
-                .where(CollegeAdmin.user_id == college_admin_user["id"])
-            )
-        ).scalar_one_or_none()
+        college_id = await resolve_college_id(db, college_admin_user.id)
 
-        if not college_admin:
+        if college_id is None:
             raise HTTPException(
                 status_code=status.HTTP_403_FORBIDDEN,
                 detail="College admin not mapped to any college"
             )
 
-        college_id = college_admin.college_id
-
         # 2️⃣ Validate course is available for this college
-        college_course = (
-            await db.execute(
-                select(CollegeCourse)
-                .where(
+        # existence only → SELECT EXISTS, no CollegeCourse row hydrated
+        course_available = await db.scalar(
+            select(
+                exists().where(
                     CollegeCourse.course_id == payload.course_id,
                     CollegeCourse.college_id == college_id,
                     CollegeCourse.is_active.is_(True)
                 )
             )
-        ).scalar_one_or_none()
+        )
 
-        if not college_course:
+        if not course_available:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail="Course not available for this college"
             )
 
-        # 3️⃣ Fetch ALL students by branch + academic year
+        # 3️⃣ Assign course to ALL students of branch + academic year in
+        #    one INSERT … SELECT; NOT EXISTS skips existing enrollments
+        #    (uq_student_course still guards against concurrent assigns)
         students = (
-            await db.execute(
-                select(Student)
-                .where(
-                    Student.college_id == college_id,
-                    Student.branch_id == payload.branch_id,
-                    Student.academic_year_id == payload.academic_year_id
+            select(
+                Student.id,
+                literal(payload.course_id),
+                literal("ASSIGNED"),
+                literal(0.0)
+            )
+            .where(
+                Student.college_id == college_id,
+                Student.branch_id == payload.branch_id,
+                Student.academic_year_id == payload.academic_year_id,
+                ~exists().where(
+                    StudentCourse.student_id == Student.id,
+                    StudentCourse.course_id == payload.course_id
                 )
             )
-        ).scalars().all()
+        )
 
-        if not students:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail="No students found for given branch and academic year"
+        result = await db.execute(
+            insert(StudentCourse).from_select(
+                ["student_id", "course_id", "enrollment_status", "progress_percentage"],
+                students
             )
-
-        # 4️⃣ Assign course (avoid duplicates)
-        assigned_count = 0
-
-        for student in students:
-            exists = (
-                await db.execute(
-                    select(StudentCourse)
-                    .where(
-                        StudentCourse.student_id == student.id,
-                        StudentCourse.course_id == payload.course_id
+        )
+        assigned_count = result.rowcount
+
+        # 4️⃣ Nothing inserted → tell "no students" apart from "all assigned"
+        if not assigned_count:
+            has_students = await db.scalar(
+                select(
+                    exists().where(
+                        Student.college_id == college_id,
+                        Student.branch_id == payload.branch_id,
+                        Student.academic_year_id == payload.academic_year_id
                     )
                 )
-            ).scalar_one_or_none()
-
-            if exists:
-                continue
+            )
 
-            db.add(
-                StudentCourse(
-                    student_id=student.id,
-                    course_id=payload.course_id,
-                    enrollment_status="ASSIGNED",
-                    progress_percentage=0.0
+            if not has_students:
+                raise HTTPException(
+                    status_code=status.HTTP_400_BAD_REQUEST,
+                    detail="No students found for given branch and academic year"
                 )
-            )
-            assigned_count += 1
 
         await db.commit()
 
@@ -120,62 +116,56 @@ class CollegeCourseService:
     async def list_college_courses(
         self,
         db: AsyncSession,
-        college_admin_user: dict
+        college_admin_user: AuthUser
     ):
-        college_admin = (
-            await db.execute(
-                select(CollegeAdmin)
-                .where(CollegeAdmin.user_id == college_admin_user["id"])
-            )
-        ).scalar_one_or_none()
+        """
+        Per-course assignment counts, already shaped like
+        CollegeCourseSummaryResponse – served as-is (response_model=None)
+        """
+        college_id = await resolve_college_id(db, college_admin_user.id)
 
-        if not college_admin:
+        if college_id is None:
             raise HTTPException(
                 status_code=status.HTTP_403_FORBIDDEN,
                 detail="College admin not mapped to any college"
             )
 
-        college_id = college_admin.college_id
-
+        # Single grouped query (no per-course count round-trips)
         result = await db.execute(
-            select(Course)
-            .join(CollegeCourse)
+            select(
+                Course.id,
+                Course.title,
+                Course.category,
+                Course.level,
+                func.count(StudentCourse.id).label("assigned"),
+                # MySQL has no FILTER (WHERE ...); COUNT skips the NULLs
+                # from the unmatched CASE and stays an integer (SUM → DECIMAL)
+                func.count(
+                    case((StudentCourse.enrollment_status == "COMPLETED", 1))
+                ).label("completed")
+            )
+            .select_from(Course)
+            .join(CollegeCourse, CollegeCourse.course_id == Course.id)
+            .outerjoin(StudentCourse, StudentCourse.course_id == Course.id)
             .where(
                 CollegeCourse.college_id == college_id,
                 CollegeCourse.is_active.is_(True),
                 Course.is_active.is_(True)
             )
+            .group_by(Course.id)
         )
 
-        courses = result.scalars().all()
-        response = []
-
-        for course in courses:
-            assigned = (
-                await db.execute(
-                    select(func.count(StudentCourse.id))
-                    .where(StudentCourse.course_id == course.id)
-                )
-            ).scalar() or 0
-
-            completed = (
-                await db.execute(
-                    select(func.count(StudentCourse.id))
-                    .where(
-                        StudentCourse.course_id == course.id,
-                        StudentCourse.enrollment_status == "COMPLETED"
-                    )
-                )
-            ).scalar() or 0
-
-            response.append({
-                "course_id": course.id,
-                "course_title": course.title,
-                "category": course.category,
-                "level": course.level,
-                "students_assigned": assigned,
-                "students_completed": completed
-            })
+        response = [
+            {
+                "course_id": r.id,
+                "course_title": r.title,
+                "category": r.category,
+                "level": r.level,
+                "students_assigned": r.assigned,
+                "students_completed": r.completed
+            }
+            for r in result.all()
+        ]
 
         return response
 
@@ -185,25 +175,30 @@ class CollegeCourseService:
     async def get_admin_courses_for_college(
         self,
         db: AsyncSession,
-        college_admin_user: dict
+        college_admin_user: AuthUser
     ):
-        college_admin = (
-            await db.execute(
-                select(CollegeAdmin)
-                .where(CollegeAdmin.user_id == college_admin_user["id"])
-            )
-        ).scalar_one_or_none()
+        college_id = await resolve_college_id(db, college_admin_user.id)
 
-        if not college_admin:
+        if college_id is None:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail="College admin record not found"
             )
 
-        college_id = college_admin.college_id
-
+        # Plain column rows → no ORM identity map / instrumentation;
+        # labels match the response keys so rows map 1:1 to dicts
         result = await db.execute(
-            select(Course)
+            select(
+                Course.id.label("course_id"),
+                Course.title,
+                Course.category,
+                Course.level,
+                Course.description,
+                Course.thumbnail_url,
+                Course.duration_hours,
+                Course.expected_completion_days,
+                Course.created_at
+            )
             .join(CollegeCourse)
             .where(
                 CollegeCourse.college_id == college_id,
@@ -214,23 +209,10 @@ class CollegeCourseService:
             .order_by(Course.created_at.desc())
         )
 
-        courses = result.scalars().all()
+        courses = result.all()
 
         return {
             "college_id": college_id,
             "total_courses": len(courses),
-            "courses": [
-                {
-                    "course_id": c.id,
-                    "title": c.title,
-                    "category": c.category,
-                    "level": c.level,
-                    "description": c.description,
-                    "thumbnail_url": c.thumbnail_url,
-                    "duration_hours": c.duration_hours,
-                    "expected_completion_days": c.expected_completion_days,
-                    "created_at": c.created_at,
-                }
-                for c in courses
-            ]
+            "courses": [c._asdict() for c in courses]
         }
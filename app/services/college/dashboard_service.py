@@ -1,7 +1,11 @@
+import asyncio
+
 from fastapi import HTTPException, status
-from sqlalchemy import select, func, case
+from sqlalchemy import select, func, case, Float
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.auth_user import AuthUser
+from app.core.database import in_own_session
 from app.models.models import (
     College,
     CollegeAdmin,
@@ -21,18 +25,18 @@ class CollegeDashboardService:
     College Admin Dashboard Service (ASYNC SAFE)
     """
 
-    async def get_dashboard_data(self, db: AsyncSession, user: dict):
+    async def get_dashboard_data(self, db: AsyncSession, user: AuthUser):
 
         # -------------------------------------------------
         # 0️⃣ Role validation
         # -------------------------------------------------
-        if user.get("role") != "COLLEGE_ADMIN":
+        if user.role != "COLLEGE_ADMIN":
             raise HTTPException(
                 status_code=status.HTTP_403_FORBIDDEN,
                 detail="College admin access only"
             )
 
-        user_id = user.get("id")
+        user_id = user.id
         if not user_id:
             raise HTTPException(
                 status_code=status.HTTP_401_UNAUTHORIZED,
@@ -40,165 +44,241 @@ class CollegeDashboardService:
             )
 
         # -------------------------------------------------
-        # 1️⃣ Resolve college mapping
+        # 1️⃣ + 2️⃣ Resolve college mapping & basic info
         # -------------------------------------------------
-        college_admin = await db.scalar(
-            select(CollegeAdmin).where(CollegeAdmin.user_id == user_id)
-        )
+        # one row: mapping join + counts as scalar subqueries
+        # (FK guarantees the mapped college exists)
+        college = (
+            await db.execute(
+                select(
+                    College.id,
+                    College.name,
+                    College.city,
+                    College.established_year,
+                    select(func.count(Student.id))
+                    .where(Student.college_id == College.id)
+                    .scalar_subquery().label("total_students"),
+                    select(func.count(CollegeBranch.id))
+                    .where(CollegeBranch.college_id == College.id)
+                    .scalar_subquery().label("total_branches"),
+                    select(func.count(Course.id))
+                    .scalar_subquery().label("total_courses")
+                )
+                .join(CollegeAdmin, CollegeAdmin.college_id == College.id)
+                .where(CollegeAdmin.user_id == user_id)
+            )
+        ).first()
 
-        if not college_admin:
+        if not college:
             raise HTTPException(
                 status_code=status.HTTP_403_FORBIDDEN,
                 detail="College admin is not assigned to any college"
             )
 
-        college_id = college_admin.college_id
-
-        # -------------------------------------------------
-        # 2️⃣ College basic info
-        # -------------------------------------------------
-        college = await db.scalar(
-            select(College).where(College.id == college_id)
-        )
-
-        if not college:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail="College not found"
-            )
+        college_id = college.id
 
         college_info = {
             "college_id": college.id,
             "college_name": college.name,
             "city": college.city,
             "established_year": college.established_year,
-            "total_students": await db.scalar(
-                select(func.count(Student.id))
-                .where(Student.college_id == college_id)
-            ) or 0,
-            "total_branches": await db.scalar(
-                select(func.count(CollegeBranch.id))
-                .where(CollegeBranch.college_id == college_id)
-            ) or 0,
-            "total_courses": await db.scalar(
-                select(func.count(Course.id))
-            ) or 0,
+            "total_students": college.total_students,
+            "total_branches": college.total_branches,
+            "total_courses": college.total_courses,
         }
 
         # -------------------------------------------------
-        # 3️⃣ Academic year summary
+        # 3️⃣ – 8️⃣ Independent sections → one pooled connection each, run
+        # concurrently (an AsyncSession cannot run queries in parallel)
         # -------------------------------------------------
-        academic_years_data = []
+        (
+            academic_years_data,
+            branches_data,
+            courses_data,
+            top_students_data,
+            students_overview,
+            performance_summary,
+        ) = await asyncio.gather(
+            self._academic_years(db, college_id),
+            in_own_session(self._branches, college_id),
+            in_own_session(self._courses_allocated, college_id),
+            in_own_session(self._top_students, college_id),
+            in_own_session(self._students_overview, college_id),
+            in_own_session(self._performance_summary, college_id),
+        )
 
-        years = (
-            await db.execute(
-                select(AcademicYear)
-                .where(AcademicYear.college_id == college_id)
+        # -------------------------------------------------
+        # FINAL RESPONSE
+        # -------------------------------------------------
+        return {
+            "college_info": college_info,
+            "academic_years": academic_years_data,
+            "branches": branches_data,
+            "courses_allocated": courses_data,
+            "top_students": top_students_data,
+            "students_overview": students_overview,
+            "performance_summary": performance_summary
+        }
+
+    # ---------------- ACADEMIC YEAR SUMMARY ----------------
+    async def _academic_years(
+        self,
+        db: AsyncSession,
+        college_id: int
+    ) -> list[dict]:
+
+        result = await db.execute(
+            select(
+                AcademicYear.id,
+                AcademicYear.year_name,
+                func.count(Student.id).label("students_count")
             )
-        ).scalars().all()
+            .outerjoin(Student, Student.academic_year_id == AcademicYear.id)
+            .where(AcademicYear.college_id == college_id)
+            .group_by(AcademicYear.id)
+        )
 
-        for year in years:
-            academic_years_data.append({
+        academic_years_data = [
+            {
                 "academic_year_id": year.id,
                 "year_name": year.year_name,
-                "students_count": await db.scalar(
-                    select(func.count(Student.id))
-                    .where(Student.academic_year_id == year.id)
-                ) or 0
-            })
+                "students_count": year.students_count
+            }
+            for year in result.all()
+        ]
+
+        return academic_years_data
+
+    # ---------------- BRANCH-WISE SUMMARY ----------------
+    async def _branches(
+        self,
+        db: AsyncSession,
+        college_id: int
+    ) -> list[dict]:
+
+        # Students/score and enrollments are pre-aggregated per branch
+        # in separate derived tables: joining both to Student directly
+        # would weight each student's score by their enrollment count.
+        branch_students = (
+            select(
+                Student.branch_id,
+                func.count(Student.id).label("total_students"),
+                func.avg(StudentScore.total_crt_score).label("avg_score")
+            )
+            .outerjoin(StudentScore, StudentScore.student_id == Student.id)
+            .where(Student.college_id == college_id)
+            .group_by(Student.branch_id)
+            .subquery()
+        )
 
-        # -------------------------------------------------
-        # 4️⃣ Branch-wise summary
-        # -------------------------------------------------
-        branches_data = []
+        branch_enrollments = (
+            select(
+                Student.branch_id,
+                func.count(StudentCourse.id).label("total_enrollments"),
+                func.count(
+                    case((StudentCourse.enrollment_status == "COMPLETED", 1))
+                ).label("completed_enrollments")
+            )
+            .join(Student, Student.id == StudentCourse.student_id)
+            .where(Student.college_id == college_id)
+            .group_by(Student.branch_id)
+            .subquery()
+        )
 
-        branches = (
-            await db.execute(
-                select(CollegeBranch)
-                .where(CollegeBranch.college_id == college_id)
+        result = await db.execute(
+            select(
+                CollegeBranch.id,
+                CollegeBranch.branch_name,
+                CollegeBranch.branch_code,
+                func.coalesce(branch_students.c.total_students, 0)
+                .label("total_students"),
+                func.round(
+                    func.coalesce(branch_students.c.avg_score, 0), 2,
+                    type_=Float
+                ).label("avg_score"),
+                func.coalesce(branch_enrollments.c.total_enrollments, 0)
+                .label("total_enrollments"),
+                func.coalesce(branch_enrollments.c.completed_enrollments, 0)
+                .label("completed_enrollments")
             )
-        ).scalars().all()
-
-        for branch in branches:
-
-            avg_score = await db.scalar(
-                select(func.avg(StudentScore.total_crt_score))
-                .join(Student)
-                .where(Student.branch_id == branch.id)
-            ) or 0.0
-
-            total_enrollments = await db.scalar(
-                select(func.count(StudentCourse.id))
-                .join(Student)
-                .where(Student.branch_id == branch.id)
-            ) or 0
-
-            completed_enrollments = await db.scalar(
-                select(func.count(StudentCourse.id))
-                .join(Student)
-                .where(
-                    Student.branch_id == branch.id,
-                    StudentCourse.enrollment_status == "COMPLETED"
-                )
-            ) or 0
+            .outerjoin(
+                branch_students,
+                branch_students.c.branch_id == CollegeBranch.id
+            )
+            .outerjoin(
+                branch_enrollments,
+                branch_enrollments.c.branch_id == CollegeBranch.id
+            )
+            .where(CollegeBranch.college_id == college_id)
+        )
+
+        branches_data = []
 
+        for branch in result.all():
             avg_completion = (
-                (completed_enrollments / total_enrollments) * 100
-                if total_enrollments > 0 else 0.0
+                (branch.completed_enrollments / branch.total_enrollments) * 100
+                if branch.total_enrollments > 0 else 0.0
             )
 
             branches_data.append({
                 "branch_id": branch.id,
                 "branch_name": branch.branch_name,
                 "branch_code": branch.branch_code,
-                "total_students": await db.scalar(
-                    select(func.count(Student.id))
-                    .where(Student.branch_id == branch.id)
-                ) or 0,
-                "average_crt_score": round(avg_score, 2),
+                "total_students": branch.total_students,
+                "average_crt_score": branch.avg_score,
                 "average_course_completion": round(avg_completion, 2)
             })
 
-        # -------------------------------------------------
-        # 5️⃣ Course allocation summary
-        # -------------------------------------------------
-        courses_data = []
+        return branches_data
 
-        courses = (
-            await db.execute(
-                select(Course)
+    # ---------------- COURSE ALLOCATION SUMMARY ----------------
+    async def _courses_allocated(
+        self,
+        db: AsyncSession,
+        college_id: int
+    ) -> list[dict]:
+
+        result = await db.execute(
+            select(
+                Course.id,
+                Course.title,
+                Course.category,
+                Course.level,
+                func.count(StudentCourse.id).label("assigned"),
+                func.count(
+                    case((StudentCourse.enrollment_status == "COMPLETED", 1))
+                ).label("completed"),
+                func.round(
+                    func.coalesce(func.avg(StudentCourse.course_score), 0), 2,
+                    type_=Float
+                ).label("avg_score")
             )
-        ).scalars().all()
+            .outerjoin(StudentCourse, StudentCourse.course_id == Course.id)
+            .group_by(Course.id)
+        )
 
-        for course in courses:
-            courses_data.append({
+        courses_data = [
+            {
                 "course_id": course.id,
                 "course_title": course.title,
                 "category": course.category,
                 "level": course.level,
-                "students_assigned": await db.scalar(
-                    select(func.count(StudentCourse.id))
-                    .where(StudentCourse.course_id == course.id)
-                ) or 0,
-                "students_completed": await db.scalar(
-                    select(func.count(StudentCourse.id))
-                    .where(
-                        StudentCourse.course_id == course.id,
-                        StudentCourse.enrollment_status == "COMPLETED"
-                    )
-                ) or 0,
-                "average_course_score": round(
-                    await db.scalar(
-                        select(func.avg(StudentCourse.course_score))
-                        .where(StudentCourse.course_id == course.id)
-                    ) or 0.0,
-                    2
-                )
-            })
+                "students_assigned": course.assigned,
+                "students_completed": course.completed,
+                "average_course_score": course.avg_score
+            }
+            for course in result.all()
+        ]
+
+        return courses_data
+
+    # ---------------- TOP STUDENTS ----------------
+    async def _top_students(
+        self,
+        db: AsyncSession,
+        college_id: int
+    ) -> list[dict]:
 
-        # -------------------------------------------------
-        # 6️⃣ Top students
-        # -------------------------------------------------
         top_students_data = []
 
         result = await db.execute(
@@ -232,9 +312,15 @@ class CollegeDashboardService:
                 "college_rank": row.rank_position
             })
 
-        # -------------------------------------------------
-        # 7️⃣ Students overview (NEW)
-        # -------------------------------------------------
+        return top_students_data
+
+    # ---------------- STUDENTS OVERVIEW ----------------
+    async def _students_overview(
+        self,
+        db: AsyncSession,
+        college_id: int
+    ) -> list[dict]:
+
         students_overview = []
 
         result = await db.execute(
@@ -246,11 +332,9 @@ class CollegeDashboardService:
                 CollegeBranch.branch_name,
                 AcademicYear.year_name,
                 func.count(StudentCourse.id).label("assigned"),
-                func.sum(
-                    case(
-                        (StudentCourse.enrollment_status == "COMPLETED", 1),
-                        else_=0
-                    )
+                # COUNT stays an integer (SUM → DECIMAL, which orjson rejects)
+                func.count(
+                    case((StudentCourse.enrollment_status == "COMPLETED", 1))
                 ).label("completed")
             )
             .join(User, User.id == Student.user_id)
@@ -283,50 +367,43 @@ class CollegeDashboardService:
                 "course_completion_percentage": round(completion, 2)
             })
 
-        # -------------------------------------------------
-        # 8️⃣ Performance summary
-        # -------------------------------------------------
+        return students_overview
+
+    # ---------------- PERFORMANCE SUMMARY ----------------
+    async def _performance_summary(
+        self,
+        db: AsyncSession,
+        college_id: int
+    ) -> dict:
+
+        score = StudentScore.total_crt_score
+
+        perf = (
+            await db.execute(
+                select(
+                    func.round(
+                        func.coalesce(func.avg(score), 0), 2, type_=Float
+                    ).label("average"),
+                    func.round(
+                        func.coalesce(func.max(score), 0), 2, type_=Float
+                    ).label("highest"),
+                    func.round(
+                        func.coalesce(func.min(score), 0), 2, type_=Float
+                    ).label("lowest"),
+                    func.count(case((score >= 70, 1))).label("above_70"),
+                    func.count(case((score < 40, 1))).label("below_40")
+                )
+                .join(Student, Student.id == StudentScore.student_id)
+                .where(Student.college_id == college_id)
+            )
+        ).one()
+
         performance_summary = {
-            "average_crt_score": round(
-                await db.scalar(
-                    select(func.avg(StudentScore.total_crt_score))
-                    .join(Student)
-                    .where(Student.college_id == college_id)
-                ) or 0.0, 2
-            ),
-            "highest_crt_score": round(
-                await db.scalar(
-                    select(func.max(StudentScore.total_crt_score))
-                    .join(Student)
-                    .where(Student.college_id == college_id)
-                ) or 0.0, 2
-            ),
-            "lowest_crt_score": round(
-                await db.scalar(
-                    select(func.min(StudentScore.total_crt_score))
-                    .join(Student)
-                    .where(Student.college_id == college_id)
-                ) or 0.0, 2
-            ),
-            "students_above_70_percent": await db.scalar(
-                select(func.count(StudentScore.id))
-                .where(StudentScore.total_crt_score >= 70)
-            ) or 0,
-            "students_below_40_percent": await db.scalar(
-                select(func.count(StudentScore.id))
-                .where(StudentScore.total_crt_score < 40)
-            ) or 0,
+            "average_crt_score": perf.average,
+            "highest_crt_score": perf.highest,
+            "lowest_crt_score": perf.lowest,
+            "students_above_70_percent": perf.above_70,
+            "students_below_40_percent": perf.below_40,
         }
 
-        # -------------------------------------------------
-        # FINAL RESPONSE
-        # -------------------------------------------------
-        return {
-            "college_info": college_info,
-            "academic_years": academic_years_data,
-            "branches": branches_data,
-            "courses_allocated": courses_data,
-            "top_students": top_students_data,
-            "students_overview": students_overview,
-            "performance_summary": performance_summary
-        }
+        return performance_summary
@@ -1,22 +1,139 @@
-from sqlalchemy import select, func, or_
+from sqlalchemy import select, insert, func, or_, and_, Float
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.exc import IntegrityError
 from fastapi import HTTPException, status, UploadFile
-from io import BytesIO
+from fastapi.concurrency import run_in_threadpool
+from concurrent.futures import ThreadPoolExecutor
+import os
 import pandas as pd
+from openpyxl import load_workbook
+
+try:
+    import pyarrow  # noqa: F401 – optional, multithreaded CSV parser
+    CSV_ENGINE = "pyarrow"
+except ImportError:
+    CSV_ENGINE = "c"
 
 from app.core.security import hash_password
+from app.core.auth_user import AuthUser
 from app.models.models import (
     User,
     Student,
-    CollegeAdmin,
-    Role,
     CollegeBranch,
     AcademicYear,
     StudentCourse,
     StudentScore,
 )
+from app.repositories.user_repository import UserRepository
 from app.schemas.student_schema import StudentCreate
+from app.services.college.admin_college import resolve_college_id
+
+BULK_REQUIRED_COLUMNS = {
+    "name",
+    "email",
+    "roll_number",
+    "phone",
+    "academic_year_id",
+    "branch_id",
+    "password",
+}
+
+# Rows per INSERT / IN (...) batch
+BULK_INSERT_CHUNK_SIZE = 1000
+
+# bcrypt releases the GIL, so an upload's hashes run in parallel on
+# their own pool (kept apart from the shared request threadpool)
+BULK_HASH_WORKERS = min(8, os.cpu_count() or 1)
+_hash_pool = ThreadPoolExecutor(
+    max_workers=BULK_HASH_WORKERS,
+    thread_name_prefix="bulk-hash"
+)
+
+
+# =====================================================
+# BULK UPLOAD HELPERS (sync, run in threadpool)
+# =====================================================
+def _read_student_sheet(fileobj, filename: str) -> pd.DataFrame:
+    fileobj.seek(0)
+
+    # Read everything as text; ids are converted explicitly during validation
+    if filename.endswith(".xlsx"):
+        return _read_xlsx_rows(fileobj)
+
+    return pd.read_csv(fileobj, dtype=str, engine=CSV_ENGINE)
+
+
+def _read_xlsx_rows(fileobj) -> pd.DataFrame:
+    """
+    Stream the first sheet in openpyxl read-only mode (no full workbook
+    object model). Blank rows are skipped; the index stays sheet row - 2
+    so rejected rows report their real row number.
+    """
+    wb = load_workbook(fileobj, read_only=True, data_only=True)
+    try:
+        rows = wb.active.iter_rows(values_only=True)
+        header = [None if h is None else str(h) for h in next(rows, ())]
+
+        index, data = [], []
+        for idx, row in enumerate(rows):
+            if all(v is None for v in row):
+                continue
+            index.append(idx)
+            data.append([None if v is None else str(v) for v in row])
+    finally:
+        wb.close()
+
+    return pd.DataFrame(data, columns=header, index=index, dtype=object)
+
+
+def _failed(df: pd.DataFrame, reason: str) -> list[dict]:
+    return [
+        {
+            "row": int(idx) + 2,
+            "email": None if pd.isna(email) else email,
+            "reason": reason
+        }
+        for idx, email in df["email"].items()
+    ]
+
+
+def _validate_student_rows(
+    df: pd.DataFrame,
+    college_id: int
+) -> tuple[pd.DataFrame, list[dict]]:
+    """
+    Vectorized cleanup: drops incomplete rows and in-file duplicates,
+    returning the clean frame plus the rejected rows.
+    """
+    df = df[list(BULK_REQUIRED_COLUMNS)].apply(lambda col: col.str.strip())
+
+    df["branch_id"] = pd.to_numeric(df["branch_id"], errors="coerce")
+    df["academic_year_id"] = pd.to_numeric(df["academic_year_id"], errors="coerce")
+
+    incomplete = df.isna().any(axis=1) | df.eq("").any(axis=1)
+    failed_rows = _failed(df[incomplete], "Missing or invalid values")
+    df = df[~incomplete].astype({"branch_id": int, "academic_year_id": int})
+
+    df["student_unique_id"] = f"STU-{college_id}-" + df["roll_number"]
+
+    # unique keys compare case-insensitively (_ci collation), so
+    # "A@x.com" and "a@x.com" are one email as far as MySQL is concerned
+    dup = (
+        df["email"].str.lower().duplicated(keep="first")
+        | df["student_unique_id"].str.lower().duplicated(keep="first")
+    )
+    failed_rows.extend(_failed(df[dup], "Duplicate email / roll number"))
+
+    return df[~dup], failed_rows
+
+
+def _hash_passwords(passwords: list[str]) -> list[str]:
+    return list(_hash_pool.map(hash_password, passwords))
+
+
+def _chunks(df: pd.DataFrame, size: int):
+    for start in range(0, len(df), size):
+        yield df.iloc[start:start + size]
 
 
 class CollegeStudentService:
@@ -24,26 +141,26 @@ class CollegeStudentService:
     College Admin → Student onboarding, listing & progress service
     """
 
+    def __init__(self):
+        self.user_repo = UserRepository()
+
     # =================================================
     # INTERNAL: Resolve college_id from admin user
     # =================================================
     async def _get_college_id(
         self,
         db: AsyncSession,
-        admin_user: dict
+        admin_user: AuthUser
     ) -> int:
-        college_admin = await db.scalar(
-            select(CollegeAdmin)
-            .where(CollegeAdmin.user_id == admin_user["id"])
-        )
+        college_id = await resolve_college_id(db, admin_user.id)
 
-        if not college_admin:
+        if college_id is None:
             raise HTTPException(
                 status_code=status.HTTP_403_FORBIDDEN,
                 detail="College admin not mapped to any college"
             )
 
-        return college_admin.college_id
+        return college_id
 
     # =================================================
     # CREATE SINGLE STUDENT
@@ -51,14 +168,12 @@ class CollegeStudentService:
     async def add_single_student(
         self,
         db: AsyncSession,
-        college_admin_user: dict,
+        college_admin_user: AuthUser,
         data: StudentCreate
     ):
         college_id = await self._get_college_id(db, college_admin_user)
 
-        role_id = await db.scalar(
-            select(Role.id).where(Role.name == "STUDENT")
-        )
+        role_id = await self.user_repo.get_role_id(db, "STUDENT")
 
         if not role_id:
             raise HTTPException(
@@ -66,6 +181,9 @@ class CollegeStudentService:
                 detail="STUDENT role not configured"
             )
 
+        # bcrypt is CPU-bound → keep it off the event loop
+        password_hash = await run_in_threadpool(hash_password, data.roll_number)
+
         try:
             # Create USER
             user = User(
@@ -73,7 +191,7 @@ class CollegeStudentService:
                 full_name=data.name,
                 email=data.email,
                 phone=data.phone,
-                password_hash=hash_password(data.roll_number),
+                password_hash=password_hash,
                 is_active=True,
                 is_verified=True,
             )
@@ -116,7 +234,7 @@ class CollegeStudentService:
     async def create_student(
         self,
         db: AsyncSession,
-        college_admin_user: dict,
+        college_admin_user: AuthUser,
         payload: StudentCreate
     ):
         return await self.add_single_student(
@@ -131,11 +249,18 @@ class CollegeStudentService:
     async def list_students(
         self,
         db: AsyncSession,
-        college_admin_user: dict
+        college_admin_user: AuthUser,
+        limit: int | None = None,
+        after: tuple[str, int] | None = None
     ):
+        """
+        Students ordered by (name, id). With limit, pages by keyset:
+        pass the last row's (name, student_id) as `after` for the next
+        page – the seek stays O(page) however deep the client scrolls.
+        """
         college_id = await self._get_college_id(db, college_admin_user)
 
-        result = await db.execute(
+        stmt = (
             select(
                 Student.id,
                 User.full_name,
@@ -149,9 +274,23 @@ class CollegeStudentService:
             .join(CollegeBranch, CollegeBranch.id == Student.branch_id)
             .join(AcademicYear, AcademicYear.id == Student.academic_year_id)
             .where(Student.college_id == college_id)
-            .order_by(User.full_name)
+            .order_by(User.full_name, Student.id)
         )
 
+        if after is not None:
+            after_name, after_id = after
+            stmt = stmt.where(
+                or_(
+                    User.full_name > after_name,
+                    and_(User.full_name == after_name, Student.id > after_id)
+                )
+            )
+
+        if limit is not None:
+            stmt = stmt.limit(limit)
+
+        result = await db.execute(stmt)
+
         return [
             {
                 "student_id": r.id,
@@ -171,7 +310,7 @@ class CollegeStudentService:
     async def filter_students(
         self,
         db: AsyncSession,
-        college_admin_user: dict,
+        college_admin_user: AuthUser,
         department_id: int | None,
         academic_year_id: int | None,
         min_completion: float | None,
@@ -179,6 +318,20 @@ class CollegeStudentService:
     ):
         college_id = await self._get_college_id(db, college_admin_user)
 
+        # Per-student average computed once in a narrow derived table
+        # (scoped to this college – MySQL materializes it in full);
+        # the wide join rows are then filtered, not grouped
+        progress = (
+            select(
+                StudentCourse.student_id,
+                func.avg(StudentCourse.progress_percentage, type_=Float).label("avg_progress")
+            )
+            .join(Student, Student.id == StudentCourse.student_id)
+            .where(Student.college_id == college_id)
+            .group_by(StudentCourse.student_id)
+            .subquery()
+        )
+
         stmt = (
             select(
                 Student.id,
@@ -187,16 +340,13 @@ class CollegeStudentService:
                 Student.roll_number,
                 CollegeBranch.branch_name,
                 AcademicYear.year_name,
-                func.coalesce(
-                    func.avg(StudentCourse.progress_percentage), 0
-                ).label("completion"),
+                func.coalesce(progress.c.avg_progress, 0).label("completion"),
             )
             .join(User, User.id == Student.user_id)
             .join(CollegeBranch, CollegeBranch.id == Student.branch_id)
             .join(AcademicYear, AcademicYear.id == Student.academic_year_id)
-            .outerjoin(StudentCourse, StudentCourse.student_id == Student.id)
+            .outerjoin(progress, progress.c.student_id == Student.id)
             .where(Student.college_id == college_id)
-            .group_by(Student.id)
         )
 
         if department_id:
@@ -205,11 +355,12 @@ class CollegeStudentService:
         if academic_year_id:
             stmt = stmt.where(Student.academic_year_id == academic_year_id)
 
+        # NULL average (no enrollments) fails both bounds, as with HAVING
         if min_completion is not None:
-            stmt = stmt.having(func.avg(StudentCourse.progress_percentage) >= min_completion)
+            stmt = stmt.where(progress.c.avg_progress >= min_completion)
 
         if max_completion is not None:
-            stmt = stmt.having(func.avg(StudentCourse.progress_percentage) <= max_completion)
+            stmt = stmt.where(progress.c.avg_progress <= max_completion)
 
         result = await db.execute(stmt)
 
@@ -232,7 +383,7 @@ class CollegeStudentService:
     async def search_students(
         self,
         db: AsyncSession,
-        college_admin_user: dict,
+        college_admin_user: AuthUser,
         query: str
     ):
         college_id = await self._get_college_id(db, college_admin_user)
@@ -251,11 +402,14 @@ class CollegeStudentService:
             .join(AcademicYear, AcademicYear.id == Student.academic_year_id)
             .where(
                 Student.college_id == college_id,
+                # Plain LIKE: the _ci column collation already matches
+                # case-insensitively, while ilike() wraps both sides in
+                # LOWER() per row. autoescape keeps % / _ in q literal.
                 or_(
-                    User.full_name.ilike(f"%{query}%"),
-                    User.email.ilike(f"%{query}%"),
-                    Student.roll_number.ilike(f"%{query}%"),
-                    CollegeBranch.branch_name.ilike(f"%{query}%"),
+                    User.full_name.contains(query, autoescape=True),
+                    User.email.contains(query, autoescape=True),
+                    Student.roll_number.contains(query, autoescape=True),
+                    CollegeBranch.branch_name.contains(query, autoescape=True),
                 )
             )
         )
@@ -278,7 +432,7 @@ class CollegeStudentService:
     async def bulk_upload_students(
         self,
         db: AsyncSession,
-        college_admin_user: dict,
+        college_admin_user: AuthUser,
         file: UploadFile
     ):
         college_id = await self._get_college_id(db, college_admin_user)
@@ -289,96 +443,183 @@ class CollegeStudentService:
                 detail="Only Excel or CSV files supported"
             )
 
-        contents = await file.read()
-        file_stream = BytesIO(contents)
+        # Parse + validate off the event loop
+        df = await run_in_threadpool(
+            _read_student_sheet, file.file, file.filename
+        )
+
+        if not BULK_REQUIRED_COLUMNS.issubset(df.columns):
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"Missing columns: {BULK_REQUIRED_COLUMNS}"
+            )
 
-        df = (
-            pd.read_excel(file_stream, engine="openpyxl")
-            if file.filename.endswith(".xlsx")
-            else pd.read_csv(file_stream)
+        df, failed_rows = await run_in_threadpool(
+            _validate_student_rows, df, college_id
         )
 
-        required_columns = {
-            "name",
-            "email",
-            "roll_number",
-            "phone",
-            "academic_year_id",
-            "branch_id",
-            "password",
-        }
+        role_id = await self.user_repo.get_role_id(db, "STUDENT")
 
-        if not required_columns.issubset(df.columns):
+        if not role_id:
             raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail=f"Missing columns: {required_columns}"
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                detail="STUDENT role not configured"
+            )
+
+        # Existing emails / student ids → reported, not inserted
+        existing_emails: set[str] = set()
+        existing_unique_ids: set[str] = set()
+
+        for chunk in _chunks(df, BULK_INSERT_CHUNK_SIZE):
+            existing_emails.update(
+                (await db.execute(
+                    select(User.email)
+                    .where(User.email.in_(chunk["email"].tolist()))
+                )).scalars()
+            )
+            existing_unique_ids.update(
+                (await db.execute(
+                    select(Student.student_unique_id)
+                    .where(
+                        Student.student_unique_id.in_(
+                            chunk["student_unique_id"].tolist()
+                        )
+                    )
+                )).scalars()
             )
 
-        role_id = await db.scalar(
-            select(Role.id).where(Role.name == "STUDENT")
+        # IN (...) matched case-insensitively → compare the same way here
+        exists_mask = (
+            df["email"].str.lower().isin({e.lower() for e in existing_emails})
+            | df["student_unique_id"].str.lower().isin(
+                {u.lower() for u in existing_unique_ids}
+            )
         )
+        failed_rows.extend(_failed(df[exists_mask], "Duplicate email / roll number"))
+        df = df[~exists_mask]
 
-        success_count = 0
-        failed_rows = []
-
-        for index, row in df.iterrows():
-            try:
-                user = User(
-                    role_id=role_id,
-                    full_name=row["name"],
-                    email=row["email"],
-                    phone=str(row["phone"]),
-                    password_hash=hash_password(str(row["password"])),
-                    is_active=True,
-                    is_verified=True,
-                )
-                db.add(user)
-                await db.flush()
-
-                student = Student(
-                    user_id=user.id,
-                    college_id=college_id,
-                    branch_id=int(row["branch_id"]),
-                    academic_year_id=int(row["academic_year_id"]),
-                    roll_number=row["roll_number"],
-                    student_unique_id=f"STU-{college_id}-{row['roll_number']}",
-                    enrollment_status="ACTIVE",
-                )
-                db.add(student)
-                await db.flush()
+        # bcrypt is CPU-bound → hashed in parallel off the event loop
+        df = df.assign(
+            password_hash=await run_in_threadpool(
+                _hash_passwords, df["password"].tolist()
+            )
+        )
+
+        try:
+            for chunk in _chunks(df, BULK_INSERT_CHUNK_SIZE):
+                await self._insert_student_chunk(db, chunk, role_id, college_id)
 
-                db.add(StudentScore(student_id=student.id))
-                success_count += 1
+            await db.commit()
 
-            except IntegrityError:
-                await db.rollback()
-                failed_rows.append({
-                    "row": index + 2,
-                    "email": row["email"],
-                    "reason": "Duplicate email / roll number"
-                })
+        except IntegrityError:
+            await db.rollback()
+            raise HTTPException(
+                status_code=status.HTTP_409_CONFLICT,
+                detail="Students were modified concurrently, please retry the upload"
+            )
 
-        await db.commit()
+        failed_rows.sort(key=lambda r: r["row"])
 
         return {
             "message": "Bulk upload completed",
-            "total_records": len(df),
-            "successfully_created": success_count,
+            "total_records": len(df) + len(failed_rows),
+            "successfully_created": len(df),
             "failed_records": failed_rows,
         }
 
+    async def _insert_student_chunk(
+        self,
+        db: AsyncSession,
+        chunk: pd.DataFrame,
+        role_id: int,
+        college_id: int
+    ):
+        """
+        users → students → student_scores as three multi-row INSERTs.
+        (Not executemany: the driver only batches VALUES made purely of
+        placeholders, and the timestamp defaults render as SQL.)
+        MySQL has no RETURNING, so generated ids are read back by their
+        unique keys (email, user_id).
+        """
+        emails = chunk["email"].tolist()
+
+        await db.execute(
+            insert(User).values([
+                {
+                    "role_id": role_id,
+                    "full_name": r.name,
+                    "email": r.email,
+                    "phone": r.phone,
+                    "password_hash": r.password_hash,
+                    "is_active": True,
+                    "is_verified": True,
+                }
+                for r in chunk.itertuples(index=False)
+            ])
+        )
+
+        user_ids = dict(
+            (await db.execute(
+                select(User.email, User.id).where(User.email.in_(emails))
+            )).all()
+        )
+
+        await db.execute(
+            insert(Student).values([
+                {
+                    "user_id": user_ids[r.email],
+                    "college_id": college_id,
+                    # numpy ints → python ints for the DB driver
+                    "branch_id": int(r.branch_id),
+                    "academic_year_id": int(r.academic_year_id),
+                    "roll_number": r.roll_number,
+                    "student_unique_id": r.student_unique_id,
+                    "enrollment_status": "ACTIVE",
+                }
+                for r in chunk.itertuples(index=False)
+            ])
+        )
+
+        student_ids = (
+            await db.execute(
+                select(Student.id)
+                .where(Student.user_id.in_(list(user_ids.values())))
+            )
+        ).scalars().all()
+
+        await db.execute(
+            insert(StudentScore).values(
+                [{"student_id": sid} for sid in student_ids]
+            )
+        )
+
     # =================================================
     # STUDENT PROGRESS DASHBOARD
     # =================================================
     async def get_student_progress(
         self,
         db: AsyncSession,
-        college_admin_user: dict
+        college_admin_user: AuthUser,
+        limit: int | None = None,
+        offset: int = 0
     ):
+        """
+        Students ranked by average course progress; limit/offset page
+        through the ranking (no limit → the whole college)
+        """
         college_id = await self._get_college_id(db, college_admin_user)
 
-        result = await db.execute(
+        progress = func.avg(StudentCourse.progress_percentage, type_=Float)
+
+        # Rank in SQL (window runs before LIMIT) so a page keeps
+        # college-wide ranks; Student.id breaks ties deterministically
+        rank = func.row_number().over(
+            order_by=(progress.desc(), Student.id)
+        )
+
+        stmt = (
             select(
+                rank.label("rank"),
                 Student.id.label("student_id"),
                 User.full_name.label("name"),
                 User.email,
@@ -388,9 +629,7 @@ class CollegeStudentService:
                 AcademicYear.year_number.label("year"),
 
                 func.coalesce(StudentScore.average_test_score, 0).label("avg_score"),
-                func.coalesce(
-                    func.avg(StudentCourse.progress_percentage), 0
-                ).label("progress"),
+                func.coalesce(progress, 0).label("progress"),
             )
             .join(User, User.id == Student.user_id)
             .join(CollegeBranch, CollegeBranch.id == Student.branch_id)
@@ -406,15 +645,17 @@ class CollegeStudentService:
                 AcademicYear.year_number,
                 StudentScore.average_test_score,
             )
-            .order_by(func.avg(StudentCourse.progress_percentage).desc())
+            .order_by(progress.desc(), Student.id)
         )
 
-        rows = result.all()
+        if limit is not None:
+            stmt = stmt.limit(limit).offset(offset)
+
+        result = await db.execute(stmt)
 
-        response = []
-        for idx, r in enumerate(rows, start=1):
-            response.append({
-                "rank": idx,
+        return [
+            {
+                "rank": r.rank,
                 "student_id": r.student_id,
                 "name": r.name,
                 "email": r.email,
@@ -422,6 +663,6 @@ class CollegeStudentService:
                 "year": r.year,
                 "avg_score": round(r.avg_score, 2),
                 "progress": round(r.progress, 2),
-            })
-
-        return response
+            }
+            for r in result.all()
+        ]
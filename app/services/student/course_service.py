@@ -9,6 +9,7 @@ from app.models.models import (
     Course
 )
 from app.schemas.enrollment_schema import StudentCourseProgressUpdate
+from app.services.student.progress_coalescer import progress_coalescer
 
 
 class StudentCourseService:
@@ -28,47 +29,53 @@ class StudentCourseService:
         List all courses assigned to the logged-in student
         """
 
-        # Resolve student profile
-        student = (
-            await db.execute(
-                select(Student)
-                .where(Student.user_id == student_user.id)
-            )
-        ).scalar_one_or_none()
+        # Resolve student profile (id only, no ORM hydration)
+        student_id = await db.scalar(
+            select(Student.id)
+            .where(Student.user_id == student_user.id)
+        )
 
-        if not student:
+        if student_id is None:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail="Student profile not found"
             )
 
-        enrollments = (
-            await db.execute(
-                select(StudentCourse)
-                .where(StudentCourse.student_id == student.id)
+        # One JOIN instead of a Course lookup per enrollment
+        result = await db.execute(
+            select(
+                StudentCourse.id,
+                StudentCourse.enrollment_status,
+                StudentCourse.progress_percentage,
+                StudentCourse.course_score,
+                StudentCourse.start_date,
+                StudentCourse.completion_date,
+                StudentCourse.last_accessed_at,
+                Course.id.label("course_id"),
+                Course.title,
+                Course.category,
+                Course.level
             )
-        ).scalars().all()
-
-        response = []
-
-        for enrollment in enrollments:
-            course = (
-                await db.execute(
-                    select(Course)
-                    .where(Course.id == enrollment.course_id)
-                )
-            ).scalar_one()
-
-            response.append({
-                "course_id": course.id,
-                "course_title": course.title,
-                "category": course.category,
-                "level": course.level,
-                "enrollment_status": enrollment.enrollment_status,
-                "progress_percentage": enrollment.progress_percentage,
-                "course_score": enrollment.course_score,
-                "last_accessed_at": enrollment.last_accessed_at
-            })
+            .join(Course, Course.id == StudentCourse.course_id)
+            .where(StudentCourse.student_id == student_id)
+        )
+
+        response = [
+            {
+                "id": r.id,
+                "course_id": r.course_id,
+                "course_title": r.title,
+                "category": r.category,
+                "level": r.level,
+                "enrollment_status": r.enrollment_status,
+                "progress_percentage": r.progress_percentage,
+                "course_score": r.course_score,
+                "start_date": r.start_date,
+                "completion_date": r.completion_date,
+                "last_accessed_at": r.last_accessed_at
+            }
+            for r in result.all()
+        ]
 
         return response
 
@@ -84,57 +91,49 @@ class StudentCourseService:
     ):
         """
         Update progress percentage for a course
-        """
 
-        # Resolve student profile
-        student = (
-            await db.execute(
-                select(Student)
-                .where(Student.user_id == student_user.id)
-            )
-        ).scalar_one_or_none()
-
-        if not student:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail="Student profile not found"
-            )
+        Validated here, written behind: the row is buffered in
+        progress_coalescer and flushed with other updates in one batch.
+        """
 
+        # Resolve the enrollment through the student profile (one query)
         enrollment = (
             await db.execute(
-                select(StudentCourse)
+                select(StudentCourse.id, StudentCourse.enrollment_status)
+                .join(Student, Student.id == StudentCourse.student_id)
                 .where(
-                    StudentCourse.student_id == student.id,
+                    Student.user_id == student_user.id,
                     StudentCourse.course_id == course_id
                 )
             )
-        ).scalar_one_or_none()
+        ).first()
 
-        if not enrollment:
+        if enrollment is None:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail="Course not assigned to this student"
             )
 
-        # Update fields
-        if payload.progress_percentage is not None:
-            enrollment.progress_percentage = payload.progress_percentage
-
-            # Auto-update status
-            if payload.progress_percentage >= 100:
-                enrollment.enrollment_status = "COMPLETED"
-                enrollment.completion_date = datetime.utcnow()
-            elif payload.progress_percentage > 0:
-                enrollment.enrollment_status = "IN_PROGRESS"
+        now = datetime.utcnow()
+        values = {
+            "progress_percentage": payload.progress_percentage,
+            "last_accessed_at": now
+        }
 
-        enrollment.last_accessed_at = datetime.utcnow()
+        # Auto-update status
+        if payload.progress_percentage >= 100:
+            values["enrollment_status"] = "COMPLETED"
+            values["completion_date"] = now
+        elif payload.progress_percentage > 0:
+            values["enrollment_status"] = "IN_PROGRESS"
 
-        await db.commit()
-        await db.refresh(enrollment)
+        progress_coalescer.put(enrollment.id, student_user.id, values)
 
         return {
             "course_id": course_id,
-            "enrollment_status": enrollment.enrollment_status,
-            "progress_percentage": enrollment.progress_percentage,
-            "last_accessed_at": enrollment.last_accessed_at
+            "enrollment_status": values.get(
+                "enrollment_status", enrollment.enrollment_status
+            ),
+            "progress_percentage": payload.progress_percentage,
+            "last_accessed_at": now
         }
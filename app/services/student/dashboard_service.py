@@ -1,8 +1,16 @@
-from sqlalchemy import select, func
+import asyncio
+
+from sqlalchemy import select, func, case, lambda_stmt
 from sqlalchemy.ext.asyncio import AsyncSession
 from fastapi import HTTPException, status
 
+from app.core.database import in_own_session
+
 from app.models.models import (
+    User,
+    College,
+    CollegeBranch,
+    AcademicYear,
     Student,
     StudentCourse,
     Course,
@@ -25,12 +33,31 @@ class StudentDashboardService:
         # -------------------------------------------------
         # 1️⃣ Resolve Student profile
         # -------------------------------------------------
+        # Profile + its names in one JOIN: the lazy relationship loads
+        # (user / college / branch / year) can't run under AsyncSession.
+        # lambda_stmt: each section's statement is built + cache-keyed
+        # once; per call only the ids are re-bound.
+        user_id = student_user.id
         student = (
             await db.execute(
-                select(Student)
-                .where(Student.user_id == student_user.id)
+                lambda_stmt(
+                    lambda: select(
+                        Student.id,
+                        User.full_name,
+                        College.name.label("college_name"),
+                        CollegeBranch.branch_name,
+                        AcademicYear.year_name,
+                        Student.roll_number,
+                        Student.student_unique_id
+                    )
+                    .join(User, User.id == Student.user_id)
+                    .join(College, College.id == Student.college_id)
+                    .join(CollegeBranch, CollegeBranch.id == Student.branch_id)
+                    .join(AcademicYear, AcademicYear.id == Student.academic_year_id)
+                    .where(Student.user_id == user_id)
+                )
             )
-        ).scalar_one_or_none()
+        ).first()
 
         if not student:
             raise HTTPException(
@@ -43,117 +70,135 @@ class StudentDashboardService:
         # -------------------------------------------------
         student_info = {
             "student_id": student.id,
-            "student_name": student.user.full_name,
-            "college": student.college.name,
-            "branch": student.branch.branch_name,
-            "academic_year": student.academic_year.year_name,
+            "student_name": student.full_name,
+            "college": student.college_name,
+            "branch": student.branch_name,
+            "academic_year": student.year_name,
             "roll_number": student.roll_number,
             "student_unique_id": student.student_unique_id
         }
 
         # -------------------------------------------------
-        # 3️⃣ Course Summary
+        # 3️⃣ – 6️⃣ Independent sections, run concurrently
         # -------------------------------------------------
-        total_assigned = (
-            await db.execute(
-                select(func.count(StudentCourse.id))
-                .where(StudentCourse.student_id == student.id)
-            )
-        ).scalar()
-
-        completed_courses = (
-            await db.execute(
-                select(func.count(StudentCourse.id))
-                .where(
-                    StudentCourse.student_id == student.id,
-                    StudentCourse.enrollment_status == "COMPLETED"
-                )
-            )
-        ).scalar()
-
+        # one AsyncSession can't run statements concurrently → the
+        # extra sections borrow their own pooled sessions
+        (
+            assigned_courses,
+            tests_summary,
+            performance_summary,
+        ) = await asyncio.gather(
+            self._assigned_courses(db, student.id),
+            in_own_session(self._tests_summary, student.id),
+            in_own_session(self._performance_summary, student.id),
+        )
+
+        # Course summary is counted from the assigned rows
         course_summary = {
-            "total_courses_assigned": total_assigned or 0,
-            "total_courses_completed": completed_courses or 0
+            "total_courses_assigned": len(assigned_courses),
+            "total_courses_completed": sum(
+                c["enrollment_status"] == "COMPLETED" for c in assigned_courses
+            )
         }
 
         # -------------------------------------------------
-        # 4️⃣ Assigned Courses Details
+        # FINAL DASHBOARD RESPONSE
         # -------------------------------------------------
-        assigned_courses = []
-
-        enrollments = (
-            await db.execute(
-                select(StudentCourse)
-                .where(StudentCourse.student_id == student.id)
-            )
-        ).scalars().all()
+        return {
+            "student_info": student_info,
+            "course_summary": course_summary,
+            "assigned_courses": assigned_courses,
+            "tests_summary": tests_summary,
+            "performance_summary": performance_summary
+        }
 
-        for enrollment in enrollments:
-            course = (
-                await db.execute(
-                    select(Course)
-                    .where(Course.id == enrollment.course_id)
+    # ---------------- ASSIGNED COURSES ----------------
+    async def _assigned_courses(
+        self,
+        db: AsyncSession,
+        student_id: int
+    ) -> list[dict]:
+
+        # One JOIN instead of a Course lookup per enrollment
+        result = await db.execute(
+            lambda_stmt(
+                lambda: select(
+                    Course.id,
+                    Course.title,
+                    Course.category,
+                    Course.level,
+                    StudentCourse.enrollment_status,
+                    StudentCourse.progress_percentage,
+                    StudentCourse.course_score
                 )
-            ).scalar_one()
-
-            assigned_courses.append({
-                "course_id": course.id,
-                "course_title": course.title,
-                "category": course.category,
-                "level": course.level,
-                "enrollment_status": enrollment.enrollment_status,
-                "progress_percentage": enrollment.progress_percentage,
-                "course_score": enrollment.course_score
-            })
-
-        # -------------------------------------------------
-        # 5️⃣ Tests Summary
-        # -------------------------------------------------
-        tests_attempted = (
-            await db.execute(
-                select(func.count(TestAttempt.id))
-                .where(TestAttempt.student_id == student.id)
+                .join(Course, Course.id == StudentCourse.course_id)
+                .where(StudentCourse.student_id == student_id)
             )
-        ).scalar()
+        )
+
+        return [
+            {
+                "course_id": r.id,
+                "course_title": r.title,
+                "category": r.category,
+                "level": r.level,
+                "enrollment_status": r.enrollment_status,
+                "progress_percentage": r.progress_percentage,
+                "course_score": r.course_score
+            }
+            for r in result.all()
+        ]
+
+    # ---------------- TESTS SUMMARY ----------------
+    async def _tests_summary(
+        self,
+        db: AsyncSession,
+        student_id: int
+    ) -> dict:
 
-        tests_passed = (
+        tests = (
             await db.execute(
-                select(func.count(TestAttempt.id))
-                .where(
-                    TestAttempt.student_id == student.id,
-                    TestAttempt.is_passed == True
+                lambda_stmt(
+                    lambda: select(
+                        func.count(TestAttempt.id).label("attempted"),
+                        # COUNT skips the NULLs of the unmatched CASE
+                        func.count(
+                            case((TestAttempt.is_passed.is_(True), 1))
+                        ).label("passed")
+                    )
+                    .where(TestAttempt.student_id == student_id)
                 )
             )
-        ).scalar()
+        ).one()
 
-        tests_summary = {
-            "tests_attempted": tests_attempted or 0,
-            "tests_passed": tests_passed or 0
+        return {
+            "tests_attempted": tests.attempted,
+            "tests_passed": tests.passed
         }
 
-        # -------------------------------------------------
-        # 6️⃣ Performance Summary
-        # -------------------------------------------------
+    # ---------------- PERFORMANCE SUMMARY ----------------
+    async def _performance_summary(
+        self,
+        db: AsyncSession,
+        student_id: int
+    ) -> dict:
+
+        # only the three serialized columns – no entity hydration
         score = (
             await db.execute(
-                select(StudentScore)
-                .where(StudentScore.student_id == student.id)
+                lambda_stmt(
+                    lambda: select(
+                        StudentScore.total_crt_score,
+                        StudentScore.average_test_score,
+                        StudentScore.overall_percentage
+                    )
+                    .where(StudentScore.student_id == student_id)
+                )
             )
-        ).scalar_one_or_none()
+        ).first()
 
-        performance_summary = {
+        return {
             "total_crt_score": score.total_crt_score if score else 0.0,
             "average_test_score": score.average_test_score if score else 0.0,
             "overall_percentage": score.overall_percentage if score else 0.0
         }
-
-        # -------------------------------------------------
-        # FINAL DASHBOARD RESPONSE
-        # -------------------------------------------------
-        return {
-            "student_info": student_info,
-            "course_summary": course_summary,
-            "assigned_courses": assigned_courses,
-            "tests_summary": tests_summary,
-            "performance_summary": performance_summary
-        }
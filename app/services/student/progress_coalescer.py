@@ -0,0 +1,185 @@
+import asyncio
+import logging
+from typing import Optional
+
+from sqlalchemy import bindparam, case, func, update
+from sqlalchemy.exc import (
+    DBAPIError,
+    InterfaceError,
+    OperationalError,
+    TimeoutError as PoolTimeoutError,
+)
+
+from app.core.cache import invalidate, student_dashboard_key
+from app.core.database import in_own_session
+from app.models.models import StudentCourse
+
+logger = logging.getLogger(__name__)
+
+PROGRESS_FLUSH_INTERVAL = 2.0   # seconds
+
+
+def _retryable(exc: Exception) -> bool:
+    """
+    Transient failures (connection lost, pool timeout, deadlock / lock
+    wait) – the rows are fine, the write can simply be tried again
+    """
+    if isinstance(exc, (OperationalError, InterfaceError, PoolTimeoutError, OSError)):
+        return True
+    return isinstance(exc, DBAPIError) and exc.connection_invalidated
+
+
+# -----------------------------
+# MONOTONIC PROGRESS UPDATE
+# -----------------------------
+# Each uvicorn worker has its own buffer, so heartbeats for one
+# enrollment can be flushed by different workers in any order. The
+# UPDATE therefore never moves progress backwards and never leaves
+# COMPLETED; whichever worker flushes last can't undo the other's write.
+# (Core executemany: an enrollment deleted meanwhile matches no row.)
+_sc = StudentCourse.__table__
+
+_PROGRESS_UPDATE = (
+    update(_sc)
+    .where(_sc.c.id == bindparam("enrollment_id"))
+    .values(
+        progress_percentage=func.greatest(
+            _sc.c.progress_percentage,
+            bindparam("new_progress", type_=_sc.c.progress_percentage.type),
+        ),
+        enrollment_status=case(
+            (_sc.c.enrollment_status == "COMPLETED", _sc.c.enrollment_status),
+            else_=func.coalesce(
+                bindparam("new_status", type_=_sc.c.enrollment_status.type),
+                _sc.c.enrollment_status,
+            ),
+        ),
+        # first completion wins
+        completion_date=func.coalesce(
+            _sc.c.completion_date,
+            bindparam("new_completion_date", type_=_sc.c.completion_date.type),
+        ),
+        last_accessed_at=func.greatest(
+            func.coalesce(_sc.c.last_accessed_at, bindparam("new_accessed_at")),
+            bindparam("new_accessed_at", type_=_sc.c.last_accessed_at.type),
+        ),
+    )
+)
+
+
+async def _write(db, rows: list[dict]) -> None:
+    await db.execute(_PROGRESS_UPDATE, rows)
+    await db.commit()
+
+
+class ProgressCoalescer:
+    """
+    Write-behind buffer for course progress updates
+
+    One row per enrollment is kept (highest progress, COMPLETED sticky);
+    every PROGRESS_FLUSH_INTERVAL seconds the buffer is written as one
+    executemany UPDATE (by primary key), so heartbeat-style progress
+    pings cost one statement per flush instead of one per request.
+    """
+
+    def __init__(self, interval: float = PROGRESS_FLUSH_INTERVAL):
+        self.interval = interval
+        self._pending: dict[int, dict] = {}     # enrollment id → row values
+        self._owners: dict[int, int] = {}       # enrollment id → user id
+        self._task: Optional[asyncio.Task] = None
+
+    def put(self, enrollment_id: int, user_id: int, values: dict) -> None:
+        self._merge(enrollment_id, user_id, {
+            "enrollment_id": enrollment_id,
+            "new_progress": values["progress_percentage"],
+            "new_status": values.get("enrollment_status"),
+            "new_completion_date": values.get("completion_date"),
+            "new_accessed_at": values["last_accessed_at"],
+        })
+
+    def _merge(self, enrollment_id: int, user_id: int, row: dict) -> None:
+        # same rules as _PROGRESS_UPDATE, for two values in one batch
+        prev = self._pending.get(enrollment_id)
+        if prev is not None:
+            row = {
+                **row,
+                "new_progress": max(prev["new_progress"], row["new_progress"]),
+                "new_completion_date": prev["new_completion_date"] or row["new_completion_date"],
+                "new_accessed_at": max(prev["new_accessed_at"], row["new_accessed_at"]),
+            }
+            if prev["new_status"] == "COMPLETED" or row["new_status"] is None:
+                row["new_status"] = prev["new_status"]
+
+        self._pending[enrollment_id] = row
+        self._owners[enrollment_id] = user_id
+
+    async def flush(self) -> None:
+        if not self._pending:
+            return
+
+        # swap before awaiting: puts during the flush land in the next batch
+        pending, self._pending = self._pending, {}
+        owners, self._owners = self._owners, {}
+
+        try:
+            await in_own_session(_write, list(pending.values()))
+        except Exception as exc:
+            if _retryable(exc):
+                self._requeue(pending, owners)
+                raise
+            # one bad row fails the whole executemany: write rows one
+            # by one so only that row is dropped
+            await self._flush_each(pending, owners)
+
+        await invalidate(*{student_dashboard_key(uid) for uid in owners.values()})
+
+    async def _flush_each(self, pending: dict[int, dict], owners: dict[int, int]) -> None:
+        items = list(pending.items())
+        for i, (enrollment_id, row) in enumerate(items):
+            try:
+                await in_own_session(_write, [row])
+            except Exception as exc:
+                if _retryable(exc):
+                    self._requeue(dict(items[i:]), owners)
+                    raise
+                logger.warning(
+                    "Dropping progress update for enrollment %s: %s",
+                    enrollment_id, exc
+                )
+
+    def _requeue(self, pending: dict[int, dict], owners: dict[int, int]) -> None:
+        # back into the next flush, merged with anything put meanwhile
+        for enrollment_id, row in pending.items():
+            self._merge(enrollment_id, owners[enrollment_id], row)
+
+    async def _run(self) -> None:
+        while True:
+            await asyncio.sleep(self.interval)
+            try:
+                await self.flush()
+            except Exception:
+                logger.exception("Course progress flush failed; retrying next tick")
+
+    def start(self) -> None:
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """
+        Cancel the flush loop and write whatever is still buffered
+        """
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+        try:
+            await self.flush()
+        except Exception:
+            logger.exception("Final course progress flush failed")
+
+
+progress_coalescer = ProgressCoalescer()
@@ -0,0 +1,48 @@
+import datetime
+
+from sqlalchemy import insert, select
+
+import app.models.models as M
+from app.services.admin.course_file_service import (
+    UPLOAD_URL_EXPIRES,
+    AdminCourseFileService,
+)
+
+
+def _file(file_id, status, age_seconds):
+    created = datetime.datetime.utcnow() - datetime.timedelta(seconds=age_seconds)
+    return {
+        "id": file_id,
+        "course_id": 1,
+        "file_name": f"f{file_id}.pdf",
+        "file_type": "PDF",
+        "file_url": f"https://bucket.s3.amazonaws.com/Courses/1/f{file_id}.pdf",
+        "is_published": status == "UPLOADED",
+        "upload_status": status,
+        "created_at": created,
+    }
+
+
+def test_reap_stale_uploads(db, run, monkeypatch):
+    deleted_keys = []
+
+    async def fake_delete(key):
+        deleted_keys.append(key)
+
+    monkeypatch.setattr(
+        "app.services.admin.course_file_service.delete_s3_object", fake_delete
+    )
+
+    db.session.execute(insert(M.CourseFile), [
+        _file(1, "PENDING", UPLOAD_URL_EXPIRES + 60),   # abandoned
+        _file(2, "PENDING", 10),                        # upload still in flight
+        _file(3, "UPLOADED", UPLOAD_URL_EXPIRES + 60),  # committed long ago
+        _file(4, "UPLOADING", UPLOAD_URL_EXPIRES + 60), # slow server-side upload
+    ])
+    db.session.commit()
+
+    assert run(AdminCourseFileService().reap_stale_uploads(db)) == 1
+
+    remaining = db.session.scalars(select(M.CourseFile.id).order_by(M.CourseFile.id)).all()
+    assert remaining == [2, 3, 4]
+    assert deleted_keys == ["Courses/1/f1.pdf"]
@@ -0,0 +1,19 @@
+from app.services.admin.dashboard_service import DashboardService
+
+
+def test_admin_dashboard(db, run):
+    data = run(DashboardService().get_admin_dashboard(db))
+
+    assert data["overview"] == {
+        "total_colleges": 2,
+        "total_students": 5,
+        "avg_completion": 68.0,
+        "avg_score": 73.75,
+    }
+    assert data["rankings"] == [
+        {"rank": 1, "college": "C1", "completion": 68.0, "points": 73.75},
+    ]
+    assert data["course_adoption"] == [
+        {"course": "Py", "adoption_percent": 50, "adopted_by": "1 of 2 colleges"},
+        {"course": "Go", "adoption_percent": 50, "adopted_by": "1 of 2 colleges"},
+    ]
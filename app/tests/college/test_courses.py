@@ -0,0 +1,33 @@
+import pytest
+from fastapi import HTTPException
+
+from app.schemas.enrollment_schema import CourseAssignRequest
+from app.services.college.course_service import CollegeCourseService
+
+
+service = CollegeCourseService()
+
+
+def test_assign_skips_already_enrolled(db, college_admin, run):
+    result = run(service.assign_course_to_students(
+        db, college_admin,
+        CourseAssignRequest(course_id=1, branch_id=1, academic_year_id=1),
+    ))
+
+    assert result == {
+        "course_id": 1,
+        "branch_id": 1,
+        "academic_year_id": 1,
+        "students_assigned": 0,
+    }
+
+
+def test_assign_unallocated_course(db, college_admin, run):
+    with pytest.raises(HTTPException) as exc:
+        run(service.assign_course_to_students(
+            db, college_admin,
+            CourseAssignRequest(course_id=999, branch_id=1, academic_year_id=1),
+        ))
+
+    assert exc.value.status_code == 404
+    assert exc.value.detail == "Course not available for this college"
@@ -0,0 +1,42 @@
+from app.services.college.dashboard_service import CollegeDashboardService
+
+
+def test_college_dashboard(db, college_admin, run):
+    data = run(CollegeDashboardService().get_dashboard_data(db, college_admin))
+
+    assert data["college_info"] == {
+        "college_id": 1,
+        "college_name": "C1",
+        "city": "X",
+        "established_year": 2000,
+        "total_branches": 3,
+        "total_courses": 3,
+        "total_students": 5,
+    }
+    assert data["academic_years"] == [
+        {"academic_year_id": 1, "year_name": "Y1", "students_count": 3},
+        {"academic_year_id": 2, "year_name": "Y2", "students_count": 2},
+    ]
+    assert [
+        (b["branch_code"], b["total_students"], b["average_course_completion"], b["average_crt_score"])
+        for b in data["branches"]
+    ] == [("CSE", 3, 33.33, 65.0), ("ECE", 2, 100.0, 60.0), ("ME", 0, 0.0, 0.0)]
+    assert [
+        (c["course_id"], c["students_assigned"], c["students_completed"], c["average_course_score"])
+        for c in data["courses_allocated"]
+    ] == [(1, 3, 2, 80.0), (2, 2, 1, 67.5), (3, 0, 0, 0.0)]
+    assert [(s["student_id"], s["college_rank"], s["crt_score"]) for s in data["top_students"]] == [
+        (4, 1, 90),
+        (1, 2, 80),
+    ]
+    assert [
+        (s["student_id"], s["courses_assigned"], s["courses_completed"], s["course_completion_percentage"])
+        for s in data["students_overview"]
+    ] == [(1, 2, 1, 50.0), (2, 1, 0, 0.0), (3, 1, 1, 100.0), (4, 1, 1, 100.0), (5, 0, 0, 0)]
+    assert data["performance_summary"] == {
+        "average_crt_score": 62.5,
+        "highest_crt_score": 90.0,
+        "lowest_crt_score": 30.0,
+        "students_above_70_percent": 2,
+        "students_below_40_percent": 1,
+    }
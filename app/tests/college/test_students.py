@@ -0,0 +1,77 @@
+from app.services.college.student_service import CollegeStudentService
+
+
+service = CollegeStudentService()
+
+
+def _ids(rows):
+    return [r["student_id"] for r in rows]
+
+
+def test_filter_students_completion(db, college_admin, run):
+    rows = run(service.filter_students(db, college_admin, None, None, None, None))
+
+    assert _ids(rows) == [1, 2, 5, 3, 4]
+    assert [r["course_completion_percentage"] for r in rows] == [70, 0, 0, 100, 100]
+    assert rows[0] == {
+        "student_id": 1,
+        "name": "U2",
+        "email": "u2@x",
+        "roll_no": "R2",
+        "branch": "CSE",
+        "academic_year": "Y1",
+        "course_completion_percentage": 70.0,
+    }
+
+
+def test_filter_students_completion_bounds(db, college_admin, run):
+    # student 5 has no enrollments, so either bound excludes it
+    assert _ids(run(service.filter_students(db, college_admin, None, None, 50, None))) == [1, 3, 4]
+    assert _ids(run(service.filter_students(db, college_admin, None, None, None, 50))) == [2]
+
+
+def test_filter_students_branch(db, college_admin, run):
+    assert _ids(run(service.filter_students(db, college_admin, 2, None, None, None))) == [3, 4]
+
+
+def test_student_progress_ranking(db, college_admin, run):
+    rows = run(service.get_student_progress(db, college_admin))
+
+    assert [(r["rank"], r["student_id"], r["progress"]) for r in rows] == [
+        (1, 3, 100),
+        (2, 4, 100),
+        (3, 1, 70),
+        (4, 2, 0),
+        (5, 5, 0),
+    ]
+
+
+def test_student_progress_page(db, college_admin, run):
+    rows = run(service.get_student_progress(db, college_admin, limit=2, offset=2))
+
+    assert [(r["rank"], r["student_id"]) for r in rows] == [(3, 1), (4, 2)]
+
+
+def test_list_students_keyset_pages_match_full_list(db, college_admin, run):
+    full = _ids(run(service.list_students(db, college_admin)))
+
+    paged, after = [], None
+    while True:
+        page = run(service.list_students(db, college_admin, limit=2, after=after))
+        if not page:
+            break
+        paged += _ids(page)
+        after = (page[-1]["name"], page[-1]["student_id"])
+
+    assert full == [1, 2, 3, 4, 5]
+    assert paged == full
+
+
+def test_search_students(db, college_admin, run):
+    def search(q):
+        return _ids(run(service.search_students(db, college_admin, q)))
+
+    assert search("u2") == [1]      # email
+    assert search("ECE") == [3, 4]  # branch
+    assert search("r3") == [2]      # roll number
+    assert search("%") == []        # LIKE wildcards are escaped
@@ -0,0 +1,171 @@
+"""
+Shared fixtures: a seeded in-memory sqlite database behind a minimal
+AsyncSession-shaped wrapper, so service queries run without MySQL.
+"""
+import asyncio
+import contextlib
+import datetime
+
+import pytest
+from sqlalchemy import create_engine, event, insert
+from sqlalchemy.orm import Session
+from sqlalchemy.pool import StaticPool
+
+import app.models.models as M
+from app.core.auth_user import AuthUser
+
+
+class SyncBackedSession:
+    """
+    Awaitable facade over a sync Session – only the calls the services use
+    """
+
+    def __init__(self, session: Session):
+        self.session = session
+
+    async def execute(self, stmt, *args, **kwargs):
+        return self.session.execute(stmt, *args, **kwargs)
+
+    async def scalar(self, stmt, *args, **kwargs):
+        return self.session.scalar(stmt, *args, **kwargs)
+
+    async def scalars(self, stmt, *args, **kwargs):
+        return self.session.scalars(stmt, *args, **kwargs)
+
+    async def commit(self):
+        self.session.commit()
+
+    async def rollback(self):
+        self.session.rollback()
+
+    async def flush(self):
+        self.session.flush()
+
+    async def refresh(self, obj):
+        self.session.refresh(obj)
+
+    def add(self, obj):
+        self.session.add(obj)
+
+
+def _seed(session: Session):
+    ex = session.execute
+
+    ex(insert(M.Role), [
+        {"id": i, "name": n}
+        for i, n in enumerate(["ADMIN", "COLLEGE_ADMIN", "TEACHER", "STUDENT"], 1)
+    ])
+    ex(insert(M.College), [
+        {"id": 1, "name": "C1", "code": "c1", "city": "X", "established_year": 2000, "is_active": True},
+        {"id": 2, "name": "C2", "code": "c2", "is_active": True},
+    ])
+    # user 1 is the college admin, users 2..7 are students
+    ex(insert(M.User), [
+        {
+            "id": i, "email": f"u{i}@x", "password_hash": "h", "full_name": f"U{i}",
+            "role_id": 2 if i == 1 else 4, "is_active": True, "is_verified": True,
+        }
+        for i in range(1, 8)
+    ])
+    ex(insert(M.CollegeAdmin), [{"id": 1, "user_id": 1, "college_id": 1}])
+    ex(insert(M.AcademicYear), [
+        {"id": 1, "college_id": 1, "year_name": "Y1", "start_year": 2024, "end_year": 2025},
+        {"id": 2, "college_id": 1, "year_name": "Y2", "start_year": 2025, "end_year": 2026},
+    ])
+    ex(insert(M.CollegeBranch), [
+        {"id": 1, "college_id": 1, "branch_name": "CSE", "branch_code": "CSE"},
+        {"id": 2, "college_id": 1, "branch_name": "ECE", "branch_code": "ECE"},
+        {"id": 3, "college_id": 1, "branch_name": "ME", "branch_code": "ME"},
+    ])
+    # (user_id, branch_id, academic_year_id) → student ids 1..5
+    students = [(2, 1, 1), (3, 1, 1), (4, 2, 1), (5, 2, 2), (6, 1, 2)]
+    ex(insert(M.Student), [
+        {
+            "id": i, "user_id": u, "college_id": 1, "branch_id": b,
+            "academic_year_id": y, "roll_number": f"R{u}", "student_unique_id": f"S{u}",
+        }
+        for i, (u, b, y) in enumerate(students, 1)
+    ])
+    ex(insert(M.StudentScore), [
+        {"student_id": i, "total_crt_score": score}
+        for i, score in [(1, 80), (2, 50), (3, 30), (4, 90)]
+    ])
+    ex(insert(M.Course), [
+        {"id": 1, "title": "Py", "course_code": "P", "level": "BEGINNER", "is_active": True, "is_published": True},
+        {"id": 2, "title": "Go", "course_code": "G", "level": "ADVANCED", "is_active": True, "is_published": True},
+        {"id": 3, "title": "Rs", "course_code": "R", "is_active": True, "is_published": False},
+    ])
+    ex(insert(M.CollegeCourse), [
+        {"college_id": 1, "course_id": 1, "is_active": True},
+        {"college_id": 1, "course_id": 2, "is_active": True},
+    ])
+    ex(insert(M.StudentCourse), [
+        {"student_id": 1, "course_id": 1, "enrollment_status": "COMPLETED", "progress_percentage": 100, "course_score": 90},
+        {"student_id": 1, "course_id": 2, "enrollment_status": "IN_PROGRESS", "progress_percentage": 40, "course_score": 60},
+        {"student_id": 2, "course_id": 1, "enrollment_status": "ASSIGNED", "progress_percentage": 0},
+        {"student_id": 3, "course_id": 1, "enrollment_status": "COMPLETED", "progress_percentage": 100, "course_score": 70},
+        {"student_id": 4, "course_id": 2, "enrollment_status": "COMPLETED", "progress_percentage": 100, "course_score": 75},
+    ])
+    ex(insert(M.Ranking), [
+        {"student_id": 1, "college_id": 1, "ranking_type": "COLLEGE_OVERALL", "rank_position": 2, "score_at_ranking": 80, "total_students_ranked": 5},
+        {"student_id": 4, "college_id": 1, "ranking_type": "COLLEGE_OVERALL", "rank_position": 1, "score_at_ranking": 90, "total_students_ranked": 5},
+    ])
+    session.commit()
+
+
+@pytest.fixture
+def db(monkeypatch):
+    """
+    Fresh seeded sqlite database per test.
+    StaticPool keeps one connection so every session sees the same :memory: db.
+    """
+    engine = create_engine(
+        "sqlite://",
+        poolclass=StaticPool,
+        connect_args={"check_same_thread": False},
+    )
+
+    # MySQL functions the services call through func.*
+    @event.listens_for(engine, "connect")
+    def _mysql_functions(conn, _record):
+        conn.create_function(
+            "utc_timestamp", 0,
+            lambda: datetime.datetime.now(datetime.timezone.utc).strftime("%Y-%m-%d %H:%M:%S"),
+        )
+        conn.create_function("curdate", 0, lambda: datetime.date.today().isoformat())
+        conn.create_function("greatest", -1, max)
+
+    M.Base.metadata.create_all(engine)
+    session = Session(engine, expire_on_commit=False)
+    _seed(session)
+    wrapped = SyncBackedSession(session)
+
+    # code opening its own sessions gets the same one; like a closed
+    # AsyncSession, a failed block leaves nothing pending
+    @contextlib.asynccontextmanager
+    async def _session_local():
+        try:
+            yield wrapped
+        except BaseException:
+            await wrapped.rollback()
+            raise
+
+    monkeypatch.setattr("app.core.database.AsyncSessionLocal", _session_local)
+
+    yield wrapped
+
+    session.close()
+    engine.dispose()
+
+
+@pytest.fixture
+def college_admin():
+    return AuthUser(id=1, role="COLLEGE_ADMIN", permissions=frozenset())
+
+
+@pytest.fixture
+def run():
+    """
+    Drive a service coroutine to completion from a sync test
+    """
+    return asyncio.run
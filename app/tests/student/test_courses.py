@@ -0,0 +1,105 @@
+import datetime
+
+import pytest
+from sqlalchemy import delete, select
+from sqlalchemy.exc import OperationalError
+
+import app.models.models as M
+from app.core.auth_user import AuthUser
+from app.schemas.enrollment_schema import StudentCourseResponse
+from app.services.student.course_service import StudentCourseService
+from app.services.student.progress_coalescer import ProgressCoalescer
+
+
+def test_list_student_courses(db, run):
+    student = AuthUser(id=2, role="STUDENT", permissions=frozenset())
+
+    rows = run(StudentCourseService().list_student_courses(db, student))
+
+    assert [(r["course_id"], r["enrollment_status"], r["progress_percentage"]) for r in rows] == [
+        (1, "COMPLETED", 100),
+        (2, "IN_PROGRESS", 40),
+    ]
+    for row in rows:
+        StudentCourseResponse.model_validate(row)
+
+
+
+def _progress(db, enrollment_id):
+    return db.session.execute(
+        select(M.StudentCourse.progress_percentage, M.StudentCourse.enrollment_status)
+        .where(M.StudentCourse.id == enrollment_id)
+    ).one()
+
+
+def _heartbeat(percentage):
+    # the values update_course_progress buffers
+    values = {
+        "progress_percentage": percentage,
+        "last_accessed_at": datetime.datetime.utcnow(),
+    }
+    if percentage >= 100:
+        values["enrollment_status"] = "COMPLETED"
+        values["completion_date"] = values["last_accessed_at"]
+    elif percentage > 0:
+        values["enrollment_status"] = "IN_PROGRESS"
+    return values
+
+
+def test_progress_flush_skips_deleted_enrollment(db, run):
+    coalescer = ProgressCoalescer()
+    coalescer.put(2, 2, _heartbeat(70))
+    coalescer.put(3, 3, _heartbeat(20))
+
+    # enrollment 3 disappears (student deleted → cascade) before the flush
+    db.session.execute(delete(M.StudentCourse).where(M.StudentCourse.id == 3))
+    db.session.commit()
+
+    run(coalescer.flush())
+
+    assert _progress(db, 2) == (70, "IN_PROGRESS")
+    assert coalescer._pending == {}
+
+    # nothing left behind to block later batches
+    coalescer.put(2, 2, _heartbeat(90))
+    run(coalescer.flush())
+    assert _progress(db, 2) == (90, "IN_PROGRESS")
+
+
+def test_progress_flush_requeues_on_connection_error(db, run, monkeypatch):
+    async def lost_connection(*_args):
+        raise OperationalError("UPDATE", {}, Exception("server has gone away"))
+
+    monkeypatch.setattr(
+        "app.services.student.progress_coalescer.in_own_session", lost_connection
+    )
+
+    coalescer = ProgressCoalescer()
+    coalescer.put(2, 2, _heartbeat(70))
+
+    with pytest.raises(OperationalError):
+        run(coalescer.flush())
+
+    assert list(coalescer._pending) == [2]
+
+
+def test_progress_never_moves_backwards(db, run):
+    # two workers, two buffers, flushed newest-first
+    worker_a, worker_b = ProgressCoalescer(), ProgressCoalescer()
+    worker_a.put(2, 2, _heartbeat(90))
+    worker_b.put(2, 2, _heartbeat(50))
+
+    run(worker_a.flush())
+    run(worker_b.flush())
+    assert _progress(db, 2) == (90, "IN_PROGRESS")
+
+    # a late heartbeat can't reopen a completed course
+    worker_b.put(1, 2, _heartbeat(30))
+    run(worker_b.flush())
+    assert _progress(db, 1) == (100, "COMPLETED")
+
+    # same rule inside one batch
+    worker_a.put(3, 3, _heartbeat(100))
+    worker_a.put(3, 3, _heartbeat(60))
+    run(worker_a.flush())
+    assert _progress(db, 3) == (100, "COMPLETED")
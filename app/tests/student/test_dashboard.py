@@ -0,0 +1,51 @@
+from app.core.auth_user import AuthUser
+from app.services.student.dashboard_service import StudentDashboardService
+
+
+def _student(user_id):
+    return AuthUser(id=user_id, role="STUDENT", permissions=frozenset())
+
+
+def test_student_dashboard(db, run):
+    data = run(StudentDashboardService().get_dashboard_data(db, _student(2)))
+
+    assert data["student_info"] == {
+        "student_id": 1,
+        "student_name": "U2",
+        "student_unique_id": "S2",
+        "roll_number": "R2",
+        "college": "C1",
+        "branch": "CSE",
+        "academic_year": "Y1",
+    }
+    assert data["assigned_courses"] == [
+        {
+            "course_id": 1, "course_title": "Py", "category": None, "level": "BEGINNER",
+            "enrollment_status": "COMPLETED", "progress_percentage": 100, "course_score": 90,
+        },
+        {
+            "course_id": 2, "course_title": "Go", "category": None, "level": "ADVANCED",
+            "enrollment_status": "IN_PROGRESS", "progress_percentage": 40, "course_score": 60,
+        },
+    ]
+    assert data["course_summary"] == {"total_courses_assigned": 2, "total_courses_completed": 1}
+    assert data["tests_summary"] == {"tests_attempted": 0, "tests_passed": 0}
+    assert data["performance_summary"] == {
+        "total_crt_score": 80,
+        "average_test_score": 0,
+        "overall_percentage": 0,
+    }
+
+
+def test_student_dashboard_summaries_per_student(db, run):
+    service = StudentDashboardService()
+
+    other = run(service.get_dashboard_data(db, _student(3)))
+    assert other["student_info"]["student_id"] == 2
+    assert other["course_summary"] == {"total_courses_assigned": 1, "total_courses_completed": 0}
+    assert other["performance_summary"]["total_crt_score"] == 50
+
+    done = run(service.get_dashboard_data(db, _student(4)))
+    assert done["student_info"]["student_id"] == 3
+    assert done["course_summary"] == {"total_courses_assigned": 1, "total_courses_completed": 1}
+    assert done["performance_summary"]["total_crt_score"] == 30
@@ -0,0 +1,80 @@
+import time
+
+import jwt
+from cachetools import TTLCache
+from sqlalchemy import update
+
+import app.core.user_status as user_status
+from app.core.config import settings
+from app.core.jwt import (
+    ACCESS_TOKEN_EXPIRE_MINUTES,
+    ALGORITHM,
+    create_access_token,
+    decode_access_token,
+)
+from app.models.models import User
+
+
+def test_access_token_round_trip():
+    claims = {"sub": "1", "role": "COLLEGE_ADMIN", "permissions": ["college:read"]}
+
+    before = int(time.time())
+    token = create_access_token(claims)
+    payload = decode_access_token(token)
+
+    assert payload is not None
+    assert payload["sub"] == "1"
+    assert payload["role"] == "COLLEGE_ADMIN"
+    assert payload["permissions"] == ["college:read"]
+
+    expected_exp = before + ACCESS_TOKEN_EXPIRE_MINUTES * 60
+    assert isinstance(payload["exp"], int)
+    assert expected_exp - 5 <= payload["exp"] <= expected_exp + 5
+
+    # hand-rolled encoder must stay byte-compatible with PyJWT
+    assert jwt.decode(token, settings.SECRET_KEY, algorithms=[ALGORITHM]) == payload
+    assert claims == {"sub": "1", "role": "COLLEGE_ADMIN", "permissions": ["college:read"]}
+
+
+def test_tampered_token_rejected():
+    token = create_access_token({"sub": "1"})
+    header, body, signature = token.split(".")
+    forged = ".".join([header, body, signature[:-2] + ("AA" if signature[-2:] != "AA" else "BB")])
+
+    assert decode_access_token(forged) is None
+
+
+def test_expired_token_rejected():
+    token = jwt.encode(
+        {"sub": "1", "exp": int(time.time()) - 10},
+        settings.SECRET_KEY,
+        algorithm=ALGORITHM,
+    )
+
+    assert decode_access_token(token) is None
+
+
+def test_token_without_sub_rejected():
+    token = jwt.encode(
+        {"exp": int(time.time()) + 60},
+        settings.SECRET_KEY,
+        algorithm=ALGORITHM,
+    )
+
+    assert decode_access_token(token) is None
+
+
+def test_is_active_rechecked_from_db(db, run, monkeypatch):
+    cache = TTLCache(maxsize=16, ttl=user_status.USER_STATUS_TTL)
+    monkeypatch.setattr(user_status, "_user_status", cache)
+
+    assert run(user_status.is_user_active(2)) is True
+    assert run(user_status.is_user_active(999)) is False    # no such user
+
+    db.session.execute(update(User).where(User.id == 2).values(is_active=False))
+    db.session.commit()
+
+    # served from cache until the entry expires, then re-read
+    assert run(user_status.is_user_active(2)) is True
+    cache.clear()
+    assert run(user_status.is_user_active(2)) is False
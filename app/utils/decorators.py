@@ -1,10 +1,15 @@
+from functools import lru_cache
 from fastapi import Request, HTTPException, status
 from typing import Callable
 
+from app.core.permissions import BYPASS_ROLES
 
+
+@lru_cache(maxsize=None)
 def require_permission(action: str, resource: str) -> Callable:
     """
     Dependency to enforce permission-based access.
+    Memoized per (action, resource) so identical checks share one callable.
 
     JWT payload example:
     {
@@ -12,9 +17,14 @@ def require_permission(action: str, resource: str) -> Callable:
         "role": "COLLEGE_ADMIN",
         "permissions": ["view:college_dashboard"]
     }
+
+    Reads request.state.user (AuthUser set by auth middleware).
     """
 
-    async def permission_checker(request: Request):
+    # closure constant → formatted once per (action, resource)
+    required_permission = f"{action}:{resource}"
+
+    async def permission_checker(request: Request) -> None:
         user = getattr(request.state, "user", None)
 
         if not user:
@@ -23,14 +33,12 @@ def require_permission(action: str, resource: str) -> Callable:
                 detail="Authentication required"
             )
 
-        role = user.get("role")
-        permissions = user.get("permissions", [])
+        role = user.role
+        permissions = user.permissions
 
         # ✅ ADMIN BYPASS
-        if role == "ADMIN":
-            return True
-
-        required_permission = f"{action}:{resource}"
+        if role in BYPASS_ROLES:
+            return
 
         if required_permission not in permissions:
             raise HTTPException(
@@ -38,6 +46,4 @@ def require_permission(action: str, resource: str) -> Callable:
                 detail="You do not have permission to perform this action"
             )
 
-        return True
-
     return permission_checker
@@ -0,0 +1,26 @@
+-- FLOAT → fixed-point DECIMAL for scores and percentages
+--
+-- create_all() never alters existing tables: run this once on a database
+-- created while these columns were FLOAT. MODIFY restates the whole
+-- column, so nullability is repeated exactly as before.
+-- Percentages must fit DECIMAL(5,2) (≤ 999.99), scores DECIMAL(8,2).
+
+ALTER TABLE students
+    MODIFY COLUMN total_crt_score DECIMAL(8, 2) NOT NULL;
+
+ALTER TABLE student_courses
+    MODIFY COLUMN progress_percentage DECIMAL(5, 2) NOT NULL,
+    MODIFY COLUMN course_score DECIMAL(8, 2) NULL;
+
+ALTER TABLE test_attempts
+    MODIFY COLUMN marks_obtained DECIMAL(8, 2) NULL,
+    MODIFY COLUMN percentage DECIMAL(5, 2) NULL;
+
+ALTER TABLE student_scores
+    MODIFY COLUMN total_crt_score DECIMAL(8, 2) NOT NULL,
+    MODIFY COLUMN average_test_score DECIMAL(8, 2) NOT NULL,
+    MODIFY COLUMN overall_percentage DECIMAL(5, 2) NOT NULL;
+
+ALTER TABLE rankings
+    MODIFY COLUMN percentile_rank DECIMAL(5, 2) NULL,
+    MODIFY COLUMN score_at_ranking DECIMAL(8, 2) NOT NULL;
@@ -0,0 +1,32 @@
+-- VARCHAR(20) → ENUM for the closed status/type vocabularies
+--
+-- create_all() never alters existing tables: run this once on a database
+-- created while these columns were VARCHAR. A value outside the ENUM
+-- makes the MODIFY fail in strict mode, so check first, e.g.
+--   SELECT DISTINCT enrollment_status FROM student_courses;
+-- and fix stray values before running.
+
+ALTER TABLE login_history
+    MODIFY COLUMN login_status ENUM('SUCCESS', 'FAILED', 'BLOCKED') NOT NULL;
+
+ALTER TABLE students
+    MODIFY COLUMN enrollment_status ENUM('ACTIVE', 'INACTIVE', 'GRADUATED') NOT NULL;
+
+ALTER TABLE courses
+    MODIFY COLUMN level ENUM('BEGINNER', 'INTERMEDIATE', 'ADVANCED') NOT NULL;
+
+ALTER TABLE course_files
+    MODIFY COLUMN file_type ENUM('PDF', 'VIDEO', 'DOCUMENT', 'IMAGE') NOT NULL;
+
+ALTER TABLE student_courses
+    MODIFY COLUMN enrollment_status ENUM('ASSIGNED', 'IN_PROGRESS', 'COMPLETED', 'DROPPED') NOT NULL;
+
+ALTER TABLE tests
+    MODIFY COLUMN test_type ENUM('QUIZ', 'MID_TERM', 'FINAL', 'PRACTICE') NOT NULL,
+    MODIFY COLUMN difficulty_level ENUM('EASY', 'MEDIUM', 'HARD') NOT NULL;
+
+ALTER TABLE test_attempts
+    MODIFY COLUMN attempt_status ENUM('STARTED', 'IN_PROGRESS', 'SUBMITTED', 'EVALUATED') NOT NULL;
+
+ALTER TABLE rankings
+    MODIFY COLUMN ranking_type ENUM('COLLEGE_OVERALL', 'BRANCH_OVERALL') NOT NULL;
@@ -0,0 +1,10 @@
+-- course_files.upload_status (direct-to-S3 uploads)
+--
+-- create_all() only creates missing tables, it never alters existing
+-- ones: run this once on a database created before the column existed.
+-- Existing rows are real, already-uploaded files → 'UPLOADED'.
+
+ALTER TABLE course_files
+    ADD COLUMN upload_status ENUM('PENDING', 'UPLOADING', 'UPLOADED')
+        NOT NULL DEFAULT 'UPLOADED'
+        AFTER download_allowed;